@@ -0,0 +1,3 @@
+"""GitHub Assistant - AI-powered Git and GitHub automation."""
+
+__version__ = '1.0.0'
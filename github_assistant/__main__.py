@@ -1,6 +1,19 @@
 """Entry point for GitHub Assistant."""
 
-from github_assistant.cli import cli
+import sys
 
-if __name__ == '__main__':
+from github_assistant import __version__
+
+
+def main():
+    """Run the CLI, answering a bare --version without loading Click or Rich."""
+    if sys.argv[1:] in (['--version'], ['-V']):
+        print(f"gh-assist, version {__version__}")
+        return
+
+    from github_assistant.cli import cli
     cli()
+
+
+if __name__ == '__main__':
+    main()
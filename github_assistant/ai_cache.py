@@ -0,0 +1,141 @@
+"""Content-addressed cache of AI results, so an unchanged diff is never sent twice."""
+
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Optional, Tuple
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import logging
+
+from github_assistant.core.response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+# Bump when prompts change so stale answers are not replayed
+PROMPT_VERSION = 1
+
+
+def _freeze(value: Any) -> Any:
+    """Return dict results read-only so callers cannot alter what later hits see."""
+    if isinstance(value, dict):
+        return MappingProxyType(value)
+    return value
+
+
+class AICache:
+    """SQLite store of JSON-encoded AI results keyed by a SHA-256 of their inputs."""
+
+    DEFAULT_PATH = ResponseCache.DEFAULT_PATH.with_name("ai.db")
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the cache (the database is opened on first use).
+
+        Args:
+            path: Database file (defaults to ~/.cache/gh-assistant/ai.db)
+        """
+        self.path = str(path or self.DEFAULT_PATH)
+        self._conn: Optional[sqlite3.Connection] = None
+        # The connection is shared with worker threads (e.g. a split PR review), one statement at a time
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, falling back to an in-memory one if the file is unusable."""
+        if self._conn is None:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"AI cache unavailable at {self.path}: {e}")
+                self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT)")
+        return self._conn
+
+    @staticmethod
+    def make_key(key: Tuple) -> str:
+        """Hash a key tuple such as (operation, model, diff) into a row key."""
+        payload = json.dumps([PROMPT_VERSION, *key], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _lookup(self, row_key: str) -> Optional[Tuple[str]]:
+        try:
+            with self._lock:
+                return self._connect().execute(
+                    "SELECT value FROM results WHERE key = ?", (row_key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"AI cache read failed: {e}")
+            return None
+
+    def _store(self, row_key: str, value: Any) -> None:
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                    (row_key, json.dumps(value)),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"AI cache write failed: {e}")
+
+    def get(self, key: Tuple) -> Any:
+        """Return the stored result for key, or None."""
+        row = self._lookup(self.make_key(key))
+        return None if row is None else _freeze(json.loads(row[0]))
+
+    def set(self, key: Tuple, value: Any) -> None:
+        """Store the result for key, replacing any earlier one."""
+        self._store(self.make_key(key), value)
+
+    def set_row(self, row_key: str, value: Any) -> None:
+        """Store a result under a key already hashed with make_key() (e.g. one saved to disk)."""
+        self._store(row_key, value)
+
+    def get_or_compute(self, key: Tuple, fn: Callable[[], Any], refresh: bool = False) -> Any:
+        """
+        Return the cached result for key, calling fn() and storing its result on a miss.
+
+        Args:
+            key: Tuple of JSON-serializable inputs that fully determine the result
+            fn: Zero-argument callable producing the result
+            refresh: Skip the lookup and replace any stored result with a fresh one
+
+        Returns:
+            The (possibly cached) result; dicts are returned as read-only mappings
+        """
+        row_key = self.make_key(key)
+        row = None if refresh else self._lookup(row_key)
+        if row is not None:
+            logger.debug(f"AI cache hit for {key[0]}")
+            return _freeze(json.loads(row[0]))
+
+        value = fn()
+        self._store(row_key, value)
+        return _freeze(value)
+
+    async def aget_or_compute(
+        self, key: Tuple, fn: Callable[[], Awaitable[Any]], refresh: bool = False
+    ) -> Any:
+        """Like get_or_compute(), but fn returns an awaitable (e.g. an AIAgent `_asend` call)."""
+        row_key = self.make_key(key)
+        row = None if refresh else self._lookup(row_key)
+        if row is not None:
+            logger.debug(f"AI cache hit for {key[0]}")
+            return _freeze(json.loads(row[0]))
+
+        value = await fn()
+        self._store(row_key, value)
+        return _freeze(value)
+
+
+# Global cache instance
+_ai_cache: Optional[AICache] = None
+
+
+def get_ai_cache() -> AICache:
+    """Get global AI cache instance."""
+    global _ai_cache
+    if _ai_cache is None:
+        _ai_cache = AICache()
+    return _ai_cache
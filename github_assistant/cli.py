@@ -1,37 +1,44 @@
 """Command-line interface for GitHub Assistant."""
 
 import sys
-import os
+import asyncio
+import functools
+import importlib
 import logging
+import signal
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
 
 # Fix Windows encoding issues
 if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.markdown import Markdown
-from rich.logging import RichHandler
-from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from github_assistant.core.git_client import GitClient
-from github_assistant.core.github_client import GitHubClient
-from github_assistant.core.ai_agent import AIAgent
-
-console = Console()
+
+from github_assistant import __version__
+
 logger = logging.getLogger(__name__)
 
+# Shared console instance, created on first use so --help never loads Rich
+_console = None
+
+
+def get_console():
+    """Get the shared Rich console instance."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
 
 def setup_logging(debug: bool = False):
     """Configure logging based on debug flag."""
+    from rich.logging import RichHandler
+
+    console = get_console()
     level = logging.DEBUG if debug else logging.WARNING
 
     logging.basicConfig(
@@ -44,652 +51,364 @@ def setup_logging(debug: bool = False):
         console.print("[dim]Debug mode enabled[/dim]")
 
 
-def get_clients():
-    """Initialize and return Git, GitHub, and AI clients."""
-    try:
-        logger.debug("Initializing clients...")
-        git_client = GitClient()
-        github_client = GitHubClient()
-        ai_agent = AIAgent()
-        logger.debug("Clients initialized successfully")
-        return git_client, github_client, ai_agent
-    except Exception as e:
-        logger.exception("Failed to initialize clients")
-        console.print(f"[red]Error initializing clients: {str(e)}[/red]")
-        console.print("\n[yellow]Make sure .env file has GITHUB_TOKEN and ANTHROPIC_API_KEY[/yellow]")
-        console.print("[yellow]Required GitHub token scopes: repo, workflow, read:org, read:user[/yellow]")
-        sys.exit(1)
-
-
-@click.group()
-@click.option('--debug', is_flag=True, help='Enable debug logging', envvar='GH_ASSIST_DEBUG')
-@click.version_option(version='1.0.0')
-@click.pass_context
-def cli(ctx, debug):
-    """GitHub Assistant - Your AI-powered Git and GitHub automation tool."""
-    ctx.ensure_object(dict)
-    ctx.obj['DEBUG'] = debug
-    setup_logging(debug)
-
-
-# ============================================================================
-# GIT OPERATIONS
-# ============================================================================
-
-@cli.command()
-@click.option('--all', '-a', is_flag=True, help='Stage all changes')
-@click.option('--ai', is_flag=True, help='Generate commit message with AI')
-@click.option('--message', '-m', help='Commit message')
-@click.argument('files', nargs=-1)
-def commit(all, ai, message, files):
-    """Commit changes with optional AI-generated message."""
-    git, github, agent = get_clients()
-
-    try:
-        # Stage files
-        if all:
-            git.add(all=True)
-            console.print("[green]OK[/green] Staged all changes")
-        elif files:
-            git.add(list(files))
-            console.print(f"[green]OK[/green] Staged {len(files)} file(s)")
-        else:
-            console.print("[yellow]No files specified. Use --all or specify files.[/yellow]")
-            return
-
-        # Get diff
-        diff = git.get_diff(staged=True)
-        if not diff:
-            console.print("[yellow]No staged changes to commit.[/yellow]")
-            return
-
-        # Generate or use provided message
-        if ai and not message:
-            console.print("[cyan]AI: Generating commit message...[/cyan]")
-            message = agent.generate_commit_message(diff)
-            console.print("\n[bold]Generated message:[/bold]")
-            console.print(Panel(message, border_style="cyan"))
-
-            if not click.confirm("\nUse this message?", default=True):
-                message = click.prompt("Enter commit message")
-
-        if not message:
-            message = click.prompt("Enter commit message")
-
-        # Commit
-        commit_sha = git.commit(message)
-        console.print(f"\n[green]OK Committed: {commit_sha}[/green]")
-        console.print(f"  {message.split(chr(10))[0]}")
-
-    except Exception as e:
-        console.print(f"[red]ERROR Error: {str(e)}[/red]")
-        sys.exit(1)
-
-
-@cli.command()
-@click.option('--remote', '-r', default='origin', help='Remote name')
-@click.option('--branch', '-b', help='Branch name')
-@click.option('--set-upstream', '-u', is_flag=True, help='Set upstream tracking')
-@click.option('--force', '-f', is_flag=True, help='Force push')
-def push(remote, branch, set_upstream, force):
-    """Push commits to remote repository."""
-    git, _, _ = get_clients()
-
-    try:
-        with console.status("[cyan]Pushing changes...[/cyan]"):
-            result = git.push(
-                remote=remote,
-                branch=branch,
-                set_upstream=set_upstream,
-                force=force
-            )
-
-        console.print(f"[green]OK {result}[/green]")
-
-    except Exception as e:
-        console.print(f"[red]ERROR Error: {str(e)}[/red]")
-        sys.exit(1)
-
-
-@cli.command()
-@click.option('--remote', '-r', default='origin', help='Remote name')
-@click.option('--branch', '-b', help='Branch name')
-@click.option('--rebase', is_flag=True, help='Rebase instead of merge')
-def pull(remote, branch, rebase):
-    """Pull changes from remote repository."""
-    git, _, _ = get_clients()
-
-    try:
-        with console.status("[cyan]Pulling changes...[/cyan]"):
-            result = git.pull(remote=remote, branch=branch, rebase=rebase)
-
-        console.print(f"[green]OK {result}[/green]")
-
-    except Exception as e:
-        console.print(f"[red]ERROR Error: {str(e)}[/red]")
-        sys.exit(1)
-
-
-@cli.command()
-@click.option('--verbose', '-v', is_flag=True, help='Show detailed status')
-def status(verbose):
-    """Show repository status."""
-    git, _, _ = get_clients()
-
-    try:
-        status_info = git.status()
-
-        # Display current branch
-        console.print(f"\n[bold cyan]On branch:[/bold cyan] {status_info['current_branch']}")
-
-        # Display modified files
-        if status_info['modified']:
-            console.print("\n[yellow]Modified files:[/yellow]")
-            for file in status_info['modified']:
-                console.print(f"  [yellow]M[/yellow] {file}")
-
-        # Display staged files
-        if status_info['staged']:
-            console.print("\n[green]Staged files:[/green]")
-            for file in status_info['staged']:
-                console.print(f"  [green]A[/green] {file}")
-
-        # Display untracked files
-        if status_info['untracked']:
-            console.print("\n[red]Untracked files:[/red]")
-            for file in status_info['untracked']:
-                console.print(f"  [red]?[/red] {file}")
-
-        # Clean working tree
-        if not status_info['is_dirty']:
-            console.print("\n[green]OK Working tree clean[/green]")
-
-        # Show diff if verbose
-        if verbose and status_info['is_dirty']:
-            diff = git.get_diff()
-            if diff:
-                console.print("\n[bold]Changes:[/bold]")
-                syntax = Syntax(diff, "diff", theme="monokai", line_numbers=True)
-                console.print(syntax)
-
-    except Exception as e:
-        console.print(f"[red]ERROR Error: {str(e)}[/red]")
-        sys.exit(1)
-
-
-@cli.command()
-@click.argument('branch_name')
-@click.option('--checkout', '-c', is_flag=True, help='Checkout after creating')
-def branch(branch_name, checkout):
-    """Create a new branch."""
-    git, _, _ = get_clients()
-
-    try:
-        git.create_branch(branch_name, checkout=checkout)
-
-        if checkout:
-            console.print(f"[green]OK Created and switched to branch '{branch_name}'[/green]")
-        else:
-            console.print(f"[green]OK Created branch '{branch_name}'[/green]")
-
-    except Exception as e:
-        console.print(f"[red]ERROR Error: {str(e)}[/red]")
-        sys.exit(1)
-
-
-@cli.command()
-@click.argument('branch_name')
-def checkout(branch_name):
-    """Checkout a branch."""
-    git, _, _ = get_clients()
-
-    try:
-        git.checkout(branch_name)
-        console.print(f"[green]OK Switched to branch '{branch_name}'[/green]")
-
-    except Exception as e:
-        console.print(f"[red]ERROR Error: {str(e)}[/red]")
-        sys.exit(1)
-
-
-@cli.command()
-@click.option('--count', '-n', default=10, help='Number of commits to show')
-def log(count):
-    """Show commit history."""
-    git, _, _ = get_clients()
-
-    try:
-        commits = git.get_log(max_count=count)
-
-        table = Table(title="Commit History", show_header=True, header_style="bold cyan")
-        table.add_column("SHA", style="yellow", width=8)
-        table.add_column("Author", style="green")
-        table.add_column("Date", style="cyan")
-        table.add_column("Message")
-
-        for commit in commits:
-            table.add_row(
-                commit['sha'],
-                commit['author'],
-                commit['date'][:10],
-                commit['message'].split('\n')[0][:50]
-            )
-
-        console.print(table)
-
-    except Exception as e:
-        console.print(f"[red]ERROR Error: {str(e)}[/red]")
-        sys.exit(1)
-
-
-# ============================================================================
-# GITHUB OPERATIONS
-# ============================================================================
-
-@cli.command(name='create-repo')
-@click.argument('name')
-@click.option('--description', '-d', default='', help='Repository description')
-@click.option('--private', is_flag=True, help='Make repository private')
-@click.option('--init', is_flag=True, default=True, help='Initialize with README')
-def create_repo(name, description, private, init):
-    """Create a new GitHub repository."""
-    _, github, _ = get_clients()
-
-    try:
-        with console.status(f"[cyan]Creating repository '{name}'...[/cyan]"):
-            repo = github.create_repository(
-                name=name,
-                description=description,
-                private=private,
-                auto_init=init
-            )
-
-        console.print(f"\n[green]OK Repository created successfully![/green]")
-        console.print(f"\n[bold]Repository:[/bold] {repo.full_name}")
-        console.print(f"[bold]URL:[/bold] {repo.html_url}")
-        console.print(f"[bold]Clone:[/bold] {repo.clone_url}")
-
-        if click.confirm("\nClone to current directory?"):
-            git, _, _ = get_clients()
-            git.clone_repository(repo.clone_url, name)
-            console.print(f"[green]OK Cloned to ./{name}[/green]")
-
-    except Exception as e:
-        console.print(f"[red]ERROR Error: {str(e)}[/red]")
-        sys.exit(1)
-
-
-@cli.command(name='list-repos')
-@click.option('--limit', '-n', default=10, help='Number of repositories to show')
-def list_repos(limit):
-    """List your GitHub repositories."""
-    _, github, _ = get_clients()
-
-    try:
-        repos = github.list_repositories()[:limit]
-
-        table = Table(title="Your Repositories", show_header=True, header_style="bold cyan")
-        table.add_column("Name", style="green")
-        table.add_column("Description")
-        table.add_column("Stars", justify="right", style="yellow")
-        table.add_column("Private", justify="center")
-
-        for repo in repos:
-            table.add_row(
-                repo.name,
-                (repo.description or '')[:50],
-                str(repo.stargazers_count),
-                "Private" if repo.private else "Public"
-            )
-
-        console.print(table)
-
-    except Exception as e:
-        console.print(f"[red]ERROR Error: {str(e)}[/red]")
-        sys.exit(1)
-
-
-@cli.command()
-@click.option('--staged', is_flag=True, help='Review staged changes')
-@click.option('--ai', is_flag=True, default=True, help='Use AI for review')
-def review(staged, ai):
-    """Review code changes with AI analysis."""
-    git, _, agent = get_clients()
-
-    try:
-        # Get diff
-        diff = git.get_diff(staged=staged)
+def print_panel(text: str, title: Optional[str] = None, markdown: bool = False):
+    """
+    Print text framed in a cyan Panel, or as plain text when stdout is not a terminal.
 
-        if not diff:
-            console.print("[yellow]No changes to review.[/yellow]")
-            return
+    Piped or CI output skips box drawing and markup parsing entirely.
+    """
+    console = get_console()
+    if not console.is_terminal:
+        if title:
+            console.print(f"{title}:", markup=False, highlight=False)
+        console.print(text, markup=False, highlight=False)
+        return
 
-        # Show diff
-        console.print("\n[bold]Changes:[/bold]")
-        syntax = Syntax(diff[:2000], "diff", theme="monokai")
-        console.print(syntax)
+    from rich.panel import Panel
 
-        if len(diff) > 2000:
-            console.print(f"\n[dim]... ({len(diff) - 2000} more characters)[/dim]")
+    renderable = text
+    if markdown:
+        from rich.markdown import Markdown
+        renderable = Markdown(text)
+    console.print(Panel(renderable, title=title, border_style="cyan"))
 
-        # AI review
-        if ai:
-            with console.status("[cyan]AI: AI is reviewing your code...[/cyan]"):
-                review_data = agent.review_code_changes(diff)
 
-            console.print("\n[bold cyan]AI Review:[/bold cyan]")
-            console.print(Panel(review_data.get('summary', 'No summary'), title="Summary", border_style="cyan"))
+def print_stream(chunks) -> str:
+    """Print text pieces as they arrive (e.g. from AIAgent.stream_commit_message) and return the whole text."""
+    console = get_console()
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        console.print(chunk, end="", markup=False, highlight=False, soft_wrap=True)
+    console.print()
+    return "".join(parts)
 
-            if review_data.get('issues'):
-                console.print("\n[yellow]Issues Found:[/yellow]")
-                for issue in review_data['issues']:
-                    console.print(f"  • {issue}")
-
-            if review_data.get('suggestions'):
-                console.print("\n[green]Suggestions:[/green]")
-                for suggestion in review_data['suggestions']:
-                    console.print(f"  • {suggestion}")
-
-            if review_data.get('security_concerns'):
-                console.print("\n[red]Security Concerns:[/red]")
-                for concern in review_data['security_concerns']:
-                    console.print(f"  WARNING: {concern}")
-
-            rating = review_data.get('rating', 'N/A')
-            console.print(f"\n[bold]Rating:[/bold] {rating}/10")
-            console.print(f"[bold]Recommendation:[/bold] {review_data.get('recommendation', 'N/A')}")
-
-    except Exception as e:
-        console.print(f"[red]ERROR Error: {str(e)}[/red]")
-        sys.exit(1)
-
-
-@cli.command(name='create-pr')
-@click.argument('title')
-@click.option('--base', '-b', default='main', help='Base branch')
-@click.option('--head', '-h', help='Head branch (defaults to current)')
-@click.option('--body', '-d', help='PR description')
-@click.option('--ai', is_flag=True, help='Generate description with AI')
-@click.option('--repo', '-r', help='Repository name')
-def create_pr(title, base, head, body, ai, repo):
-    """Create a pull request."""
-    git, github, agent = get_clients()
 
+def print_json(data):
+    """Write data to stdout as indented JSON (via orjson when installed), bypassing Rich."""
     try:
-        # Get current branch if head not specified
-        if not head:
-            head = git.get_current_branch()
-
-        # Get repository name
-        if not repo:
-            remote_url = git.get_remote_url()
-            # Extract repo name from URL
-            repo = remote_url.split('/')[-1].replace('.git', '')
-            if '/' not in repo:
-                repo = f"{github.user.login}/{repo}"
-
-        # Generate description with AI if requested
-        if ai and not body:
-            console.print("[cyan]AI: Generating PR description...[/cyan]")
-            diff = git.get_diff()
-            commits = git.get_log(max_count=10)
-            commit_messages = [c['message'] for c in commits]
-
-            body = agent.generate_pr_description(diff, head, commit_messages)
-
-            console.print("\n[bold]Generated description:[/bold]")
-            console.print(Panel(body, border_style="cyan"))
-
-            if not click.confirm("\nUse this description?", default=True):
-                body = click.prompt("Enter PR description")
-
-        if not body:
-            body = click.prompt("Enter PR description (optional)", default="")
-
-        # Create PR
-        with console.status("[cyan]Creating pull request...[/cyan]"):
-            pr = github.create_pull_request(
-                repo_name=repo,
-                title=title,
-                head=head,
-                base=base,
-                body=body
-            )
-
-        console.print(f"\n[green]OK Pull request created![/green]")
-        console.print(f"\n[bold]PR #{pr.number}:[/bold] {pr.title}")
-        console.print(f"[bold]URL:[/bold] {pr.html_url}")
-
-    except Exception as e:
-        console.print(f"[red]ERROR Error: {str(e)}[/red]")
-        sys.exit(1)
-
-
-@cli.command(name='list-prs')
-@click.option('--repo', '-r', help='Repository name')
-@click.option('--state', '-s', default='open', type=click.Choice(['open', 'closed', 'all']))
-def list_prs(repo, state):
-    """List pull requests."""
-    git, github, _ = get_clients()
-
+        import orjson
+        click.echo(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+    except ImportError:
+        import json
+        click.echo(json.dumps(data, indent=2))
+
+
+@functools.lru_cache(maxsize=128)
+def _highlight_diff(diff: str):
+    """Lex a diff into styled Text; repeat previews of the same text (e.g. in `gh-assist shell`) reuse it."""
+    from rich.syntax import Syntax
+    return Syntax(diff, "diff", theme="monokai").highlight(diff)
+
+
+def print_diff(diff: str, line_numbers: bool = False):
+    """
+    Print a diff syntax-highlighted, or as plain text when stdout is not a terminal.
+
+    Redirected output skips Pygments entirely.
+    """
+    console = get_console()
+    if not console.is_terminal:
+        console.print(diff, markup=False, highlight=False)
+        return
+
+    if line_numbers:
+        from rich.syntax import Syntax
+        console.print(Syntax(diff, "diff", theme="monokai", line_numbers=True))
+    else:
+        console.print(_highlight_diff(diff), overflow="ignore", crop=False)
+
+
+@contextmanager
+def status_if_slow(message: str, threshold: float = 0.3):
+    """
+    Print a progress message only if the wrapped operation is still running after `threshold` seconds.
+
+    Cheaper than console.status() for calls that usually return quickly,
+    since no live-display thread is started for them.
+    """
+    timer = threading.Timer(threshold, get_console().print, args=(message,))
+    timer.daemon = True
+    timer.start()
     try:
-        # Get repository name
-        if not repo:
-            remote_url = git.get_remote_url()
-            repo = remote_url.split('/')[-1].replace('.git', '')
-            if '/' not in repo:
-                repo = f"{github.user.login}/{repo}"
-
-        prs = github.list_pull_requests(repo, state=state)
-
-        table = Table(title=f"Pull Requests ({state})", show_header=True, header_style="bold cyan")
-        table.add_column("#", style="yellow", width=6)
-        table.add_column("Title", style="green")
-        table.add_column("Author")
-        table.add_column("State")
-
-        for pr in prs[:20]:
-            state_style = "green" if pr.state == "open" else "dim"
-            table.add_row(
-                f"#{pr.number}",
-                pr.title[:50],
-                pr.user.login,
-                f"[{state_style}]{pr.state}[/{state_style}]"
-            )
-
-        console.print(table)
+        yield
+    finally:
+        timer.cancel()
 
-    except Exception as e:
-        console.print(f"[red]ERROR Error: {str(e)}[/red]")
-        sys.exit(1)
 
+# Clients, each built on first use and shared by every command in the process
+_git_client = None
+_github_client = None
+_ai_agent = None
 
-@cli.command(name='review-pr')
-@click.argument('pr_number', type=int)
-@click.option('--repo', '-r', help='Repository name')
-def review_pr(pr_number, repo):
-    """Review a pull request with AI."""
-    git, github, agent = get_clients()
 
+def _init_client(factory):
+    """Build a client, reporting configuration problems and exiting on failure."""
     try:
-        # Get repository name
-        if not repo:
-            remote_url = git.get_remote_url()
-            repo = remote_url.split('/')[-1].replace('.git', '')
-            if '/' not in repo:
-                repo = f"{github.user.login}/{repo}"
-
-        # Get PR
-        with console.status(f"[cyan]Fetching PR #{pr_number}...[/cyan]"):
-            pr = github.get_pull_request(repo, pr_number)
-            diff = github.get_pr_diff(repo, pr_number)
-
-        console.print(f"\n[bold]PR #{pr.number}:[/bold] {pr.title}")
-        console.print(f"[bold]By:[/bold] {pr.user.login}")
-        console.print(f"[bold]State:[/bold] {pr.state}")
-
-        # AI Review
-        with console.status("[cyan]AI: AI is reviewing the PR...[/cyan]"):
-            review = agent.review_pull_request(
-                pr_title=pr.title,
-                pr_description=pr.body or "",
-                diff=diff,
-                files_changed=pr.changed_files
-            )
-
-        console.print("\n")
-        console.print(Panel(
-            review.get('review_comment', 'No review generated'),
-            title="AI Review",
-            border_style="cyan"
-        ))
-
-        console.print(f"\n[bold]Recommendation:[/bold] {review.get('recommendation', 'N/A')}")
-
-        if click.confirm("\nPost this review to GitHub?"):
-            github.comment_on_pr(repo, pr_number, review['review_comment'])
-            console.print("[green]OK Review posted![/green]")
-
+        logger.debug(f"Initializing {factory.__name__}...")
+        return factory()
     except Exception as e:
-        console.print(f"[red]ERROR Error: {str(e)}[/red]")
+        logger.exception(f"Failed to initialize {factory.__name__}")
+        console = get_console()
+        console.print(f"[red]Error initializing clients: {str(e)}[/red]")
+        console.print("\n[yellow]Make sure .env file has GITHUB_TOKEN and ANTHROPIC_API_KEY[/yellow]")
+        console.print("[yellow]Required GitHub token scopes: repo, workflow, read:org, read:user[/yellow]")
         sys.exit(1)
 
 
-@cli.command()
-@click.argument('question')
-def ask(question):
-    """Ask the AI assistant a question about Git/GitHub."""
-    _, _, agent = get_clients()
+# Client modules pull in GitPython, aiohttp and the Anthropic SDK, so each is
+# imported only by the getter for the client a command actually uses.
 
-    try:
-        with console.status("[cyan]AI: Thinking...[/cyan]"):
-            answer = agent.ask_question(question)
+def get_git_client():
+    """Return the shared GitClient."""
+    global _git_client
+    if _git_client is None:
+        from github_assistant.core.git_client import GitClient
+        _git_client = _init_client(GitClient)
+    return _git_client
 
-        console.print("\n[bold cyan]AI Assistant:[/bold cyan]")
-        console.print(Panel(Markdown(answer), border_style="cyan"))
 
-    except Exception as e:
-        console.print(f"[red]ERROR Error: {str(e)}[/red]")
-        sys.exit(1)
+def get_github_client():
+    """Return the shared AsyncGitHubClient."""
+    global _github_client
+    if _github_client is None:
+        from github_assistant.core.async_github_client import AsyncGitHubClient
+        _github_client = _init_client(AsyncGitHubClient)
+    return _github_client
 
 
-# ============================================================================
-# BATCH OPERATIONS
-# ============================================================================
+def get_ai_agent():
+    """Return the shared AIAgent."""
+    global _ai_agent
+    if _ai_agent is None:
+        from github_assistant.core.ai_agent import AIAgent
+        _ai_agent = _init_client(AIAgent)
+    return _ai_agent
 
-@cli.command(name='quick-commit', aliases=['qc'])
-@click.option('--ai', is_flag=True, default=True, help='Generate commit message with AI')
-@click.option('--message', '-m', help='Commit message (skips AI)')
-@click.option('--push', '-p', is_flag=True, help='Push after committing')
-@click.option('--remote', '-r', default='origin', help='Remote to push to')
-def quick_commit(ai, message, push, remote):
-    """Quick commit: stage all changes, commit (with AI), and optionally push."""
-    git, _, agent = get_clients()
 
-    try:
-        # Stage all changes
-        git.add(all=True)
-        console.print("[green]OK[/green] Staged all changes")
-
-        # Get diff
-        diff = git.get_diff(staged=True)
-        if not diff:
-            console.print("[yellow]No staged changes to commit.[/yellow]")
-            return
-
-        # Generate or use provided message
-        if ai and not message:
-            console.print("[cyan]AI: Generating commit message...[/cyan]")
-            message = agent.generate_commit_message(diff)
-            console.print("\n[bold]Generated message:[/bold]")
-            console.print(Panel(message, border_style="cyan"))
-
-            if not click.confirm("\nUse this message?", default=True):
-                message = click.prompt("Enter commit message")
-
-        if not message:
-            message = click.prompt("Enter commit message")
-
-        # Commit
-        commit_sha = git.commit(message)
-        console.print(f"\n[green]OK Committed: {commit_sha}[/green]")
-        console.print(f"  {message.split(chr(10))[0]}")
-
-        # Push if requested
-        if push:
-            with console.status("[cyan]Pushing changes...[/cyan]"):
-                result = git.push(remote=remote)
-            console.print(f"[green]OK {result}[/green]")
-
-    except Exception as e:
-        console.print(f"[red]ERROR Error: {str(e)}[/red]")
-        sys.exit(1)
+def refresh_clients():
+    """Forget state the shared clients cached during the previous command."""
+    if _git_client is not None:
+        _git_client.refresh_refs()
 
 
-@cli.command(name='sync', aliases=['sy'])
-@click.option('--remote', '-r', default='origin', help='Remote name')
-@click.option('--branch', '-b', help='Branch name')
-@click.option('--rebase', is_flag=True, help='Use rebase instead of merge')
-def sync(remote, branch, rebase):
-    """Sync with remote: pull changes and push local commits."""
-    git, _, _ = get_clients()
+def get_clients():
+    """Return the Git, async GitHub and AI clients, building any not yet created."""
+    return get_git_client(), get_github_client(), get_ai_agent()
+
+
+# Diffs beyond either limit are summarized per file instead of sent to the AI whole
+AI_DIFF_MAX_FILES = 50
+AI_DIFF_MAX_BYTES = 1_000_000
+# How far past the agent's limit to read, so trimming can shorten hunks across
+# every file instead of only seeing the first few
+AI_DIFF_OVERREAD = 4
+
+
+def get_commit_context_for_ai(
+    git,
+    staged: bool = False,
+    max_size: Optional[int] = None,
+    log_count: int = 0
+) -> Dict[str, Any]:
+    """
+    Collect the diff (and optionally the log) to hand to the AI in one concurrent pass.
+
+    The diff, its --shortstat and the log each come from a single git call.
+    Large change sets get the `git diff --stat` summary in place of the
+    patch, and only a prefix of the streamed patch (a few times `max_size`)
+    is read.
+    The diff is "" when there are no changes.
+    """
+    # Past the limit, so the agent still notices the cut and can trim hunks evenly
+    context = git.collect_commit_context(
+        staged=staged,
+        max_bytes=None if max_size is None else max_size * AI_DIFF_OVERREAD,
+        log_count=log_count,
+    )
 
+    stat = context['shortstat']
+    if not stat['files']:
+        context['diff'] = ""
+    elif stat['files'] >= AI_DIFF_MAX_FILES or stat['bytes_est'] >= AI_DIFF_MAX_BYTES:
+        get_console().print(
+            f"[yellow]Large diff ({stat['files']} files, +{stat['insertions']} -{stat['deletions']}); "
+            f"using a per-file summary.[/yellow]"
+        )
+        context['diff'] = git.get_diff_stat(staged=staged)
+    return context
+
+
+def get_diff_for_ai(git, staged: bool = False, max_size: Optional[int] = None) -> str:
+    """Return the diff to hand to the AI (see get_commit_context_for_ai)."""
+    return get_commit_context_for_ai(git, staged=staged, max_size=max_size)['diff']
+
+
+def run_blocking(fn, *args, **kwargs):
+    """
+    Run a blocking call (e.g. a click prompt) from inside an async command.
+
+    Under asyncio.run() the first Ctrl-C only cancels the main task, which
+    a prompt blocked in input() never notices. Python's default handler is
+    put back for the call, so Ctrl-C aborts the prompt straight away.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return fn(*args, **kwargs)
+    previous = signal.signal(signal.SIGINT, signal.default_int_handler)
     try:
-        # Pull first
-        with console.status("[cyan]Pulling changes...[/cyan]"):
-            pull_result = git.pull(remote=remote, branch=branch, rebase=rebase)
-        console.print(f"[green]OK {pull_result}[/green]")
-
-        # Check if there are local commits to push
-        status_info = git.status()
-        if status_info['is_dirty']:
-            console.print("[yellow]Working directory has uncommitted changes.[/yellow]")
-            console.print("[yellow]Commit changes before syncing.[/yellow]")
-            return
-
-        # Push
-        with console.status("[cyan]Pushing changes...[/cyan]"):
-            push_result = git.push(remote=remote, branch=branch)
-        console.print(f"[green]OK {push_result}[/green]")
-
-        console.print("\n[green]✓[/green] Sync complete!")
-
-    except Exception as e:
-        console.print(f"[red]ERROR Error: {str(e)}[/red]")
-        sys.exit(1)
-
-
-@cli.command(name='rate-limit')
-def rate_limit():
-    """Check GitHub API rate limit status."""
-    _, github, _ = get_clients()
-
+        return fn(*args, **kwargs)
+    finally:
+        signal.signal(signal.SIGINT, previous)
+
+
+def run_async(coro):
+    """
+    Run an async command body to completion.
+
+    The loop is uvloop's when that is installed. The GitHub client's HTTP
+    session and the agent's async Anthropic client are bound to the event
+    loop, so they are closed before asyncio.run() tears the loop down; the
+    next command (e.g. in `gh-assist shell`) opens fresh ones.
+    """
+    async def runner():
+        try:
+            return await coro
+        finally:
+            if _github_client is not None:
+                await _github_client.close()
+            if _ai_agent is not None:
+                await _ai_agent.aclose()
+
+    _use_uvloop()
+    return asyncio.run(runner())
+
+
+def _use_uvloop():
+    """Run event loops on uvloop when it is installed (optional, a faster drop-in loop)."""
     try:
-        status = github.get_rate_limit_status()
-
-        table = Table(title="GitHub API Rate Limits", show_header=True, header_style="bold cyan")
-        table.add_column("Resource", style="yellow")
-        table.add_column("Limit", justify="right")
-        table.add_column("Remaining", justify="right", style="green")
-        table.add_column("Reset Time", style="cyan")
-
-        for resource, data in status.items():
-            remaining_style = "green" if data['remaining'] > data['limit'] * 0.2 else "yellow"
-            if data['remaining'] < data['limit'] * 0.1:
-                remaining_style = "red"
-
-            table.add_row(
-                resource.title(),
-                str(data['limit']),
-                f"[{remaining_style}]{data['remaining']}[/{remaining_style}]",
-                data['reset']
-            )
-
-        console.print(table)
-
-    except Exception as e:
-        console.print(f"[red]ERROR Error: {str(e)}[/red]")
-        sys.exit(1)
+        import uvloop
+    except ImportError:
+        return
+    if not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def report_error(error: Exception):
+    """Print a command failure; the traceback is logged in --debug mode."""
+    logger.debug("Command failed", exc_info=error)
+    get_console().print(f"[red]ERROR Error: {str(error)}[/red]")
+
+
+class LazyGroup(click.Group):
+    """
+    Click group that imports each subcommand's module only when it is used.
+
+    It is also the one place command failures are reported: any exception
+    other than Click's own is printed and turned into exit status 1.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, aliases=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Maps command name -> (module path, attribute name, short help)
+        self.lazy_subcommands = lazy_subcommands or {}
+        # Maps short alias -> command name
+        self.aliases = aliases or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        cmd_name = self.aliases.get(cmd_name, cmd_name)
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr, _ = self.lazy_subcommands[cmd_name]
+            return getattr(importlib.import_module(module_name), attr)
+        return super().get_command(ctx, cmd_name)
+
+    def invoke(self, ctx):
+        try:
+            return super().invoke(ctx)
+        except (click.ClickException, click.Abort, click.exceptions.Exit):
+            raise
+        except Exception as e:
+            report_error(e)
+            ctx.exit(1)
+
+    def format_commands(self, ctx, formatter):
+        """List subcommands using the frozen help text, without importing them."""
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.lazy_subcommands:
+                rows.append((name, self.lazy_subcommands[name][2]))
+                continue
+            command = super().get_command(ctx, name)
+            if command is not None and not command.hidden:
+                rows.append((name, command.get_short_help_str()))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+_COMMANDS = 'github_assistant.cli_commands'
+
+LAZY_SUBCOMMANDS = {
+    # Git operations
+    'commit': (f'{_COMMANDS}.commit', 'commit',
+               'Commit changes with optional AI-generated message.'),
+    'push': (f'{_COMMANDS}.push', 'push',
+             'Push commits to remote repository.'),
+    'pull': (f'{_COMMANDS}.pull', 'pull',
+             'Pull changes from remote repository.'),
+    'status': (f'{_COMMANDS}.status', 'status',
+               'Show repository status.'),
+    'branch': (f'{_COMMANDS}.branch', 'branch',
+               'Create a new branch.'),
+    'checkout': (f'{_COMMANDS}.checkout', 'checkout',
+                 'Checkout a branch.'),
+    'log': (f'{_COMMANDS}.log', 'log',
+            'Show commit history.'),
+    # GitHub operations
+    'create-repo': (f'{_COMMANDS}.create_repo', 'create_repo',
+                    'Create a new GitHub repository.'),
+    'list-repos': (f'{_COMMANDS}.list_repos', 'list_repos',
+                   'List your GitHub repositories.'),
+    'review': (f'{_COMMANDS}.review', 'review',
+               'Review code changes with AI analysis.'),
+    'create-pr': (f'{_COMMANDS}.create_pr', 'create_pr',
+                  'Create a pull request.'),
+    'list-prs': (f'{_COMMANDS}.list_prs', 'list_prs',
+                 'List pull requests.'),
+    'review-pr': (f'{_COMMANDS}.review_pr', 'review_pr',
+                  'Review a pull request with AI.'),
+    'ask': (f'{_COMMANDS}.ask', 'ask',
+            'Ask the AI assistant a question about Git/GitHub.'),
+    # Batch operations
+    'quick-commit': (f'{_COMMANDS}.quick_commit', 'quick_commit',
+                     'Quick commit: stage all changes, commit (with AI), and optionally push.'),
+    'sync': (f'{_COMMANDS}.sync', 'sync',
+             'Sync with remote: pull changes and push local commits.'),
+    'rate-limit': (f'{_COMMANDS}.rate_limit', 'rate_limit',
+                   'Check GitHub API rate limit status.'),
+    'shell': (f'{_COMMANDS}.shell', 'shell',
+              'Run several commands in one process, reading them from stdin.'),
+}
+
+COMMAND_ALIASES = {
+    'ci': 'commit',
+    'qc': 'quick-commit',
+    'sy': 'sync',
+}
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS, aliases=COMMAND_ALIASES)
+@click.option('--debug', is_flag=True, help='Enable debug logging', envvar='GH_ASSIST_DEBUG')
+@click.version_option(__version__, '--version', '-V')
+@click.pass_context
+def cli(ctx, debug):
+    """GitHub Assistant - Your AI-powered Git and GitHub automation tool."""
+    ctx.ensure_object(dict)
+    ctx.obj['DEBUG'] = debug
+    setup_logging(debug)
 
 
 if __name__ == '__main__':
@@ -0,0 +1 @@
+"""Subcommands for the gh-assist CLI, loaded on demand by ``cli.LazyGroup``."""
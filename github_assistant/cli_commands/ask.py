@@ -0,0 +1,20 @@
+"""Ask the AI assistant a question about Git/GitHub."""
+
+import click
+
+from github_assistant.cli import get_ai_agent, get_console, print_panel
+
+console = get_console()
+
+
+@click.command()
+@click.argument('question')
+def ask(question):
+    """Ask the AI assistant a question about Git/GitHub."""
+    agent = get_ai_agent()
+
+    with console.status("[cyan]AI: Thinking...[/cyan]"):
+        answer = agent.ask_question(question)
+
+    console.print("\n[bold cyan]AI Assistant:[/bold cyan]")
+    print_panel(answer, markdown=True)
@@ -0,0 +1,22 @@
+"""Create a new local branch."""
+
+import click
+
+from github_assistant.cli import get_console, get_git_client
+
+console = get_console()
+
+
+@click.command()
+@click.argument('branch_name')
+@click.option('--checkout', '-c', is_flag=True, help='Checkout after creating')
+def branch(branch_name, checkout):
+    """Create a new branch."""
+    git = get_git_client()
+
+    git.create_branch(branch_name, checkout=checkout)
+
+    if checkout:
+        console.print(f"[green]OK Created and switched to branch '{branch_name}'[/green]")
+    else:
+        console.print(f"[green]OK Created branch '{branch_name}'[/green]")
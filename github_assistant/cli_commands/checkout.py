@@ -0,0 +1,17 @@
+"""Check out an existing branch."""
+
+import click
+
+from github_assistant.cli import get_console, get_git_client
+
+console = get_console()
+
+
+@click.command()
+@click.argument('branch_name')
+def checkout(branch_name):
+    """Checkout a branch."""
+    git = get_git_client()
+
+    git.checkout(branch_name)
+    console.print(f"[green]OK Switched to branch '{branch_name}'[/green]")
@@ -0,0 +1,53 @@
+"""Commit changes with an optional AI-generated message."""
+
+import click
+
+from github_assistant.cli import get_ai_agent, get_console, get_diff_for_ai, get_git_client, print_stream
+
+console = get_console()
+
+
+@click.command()
+@click.option('--all', '-a', is_flag=True, help='Stage all changes')
+@click.option('--ai', is_flag=True, help='Generate commit message with AI')
+@click.option('--message', '-m', help='Commit message')
+@click.argument('files', nargs=-1)
+def commit(all, ai, message, files):
+    """Commit changes with optional AI-generated message."""
+    git = get_git_client()
+
+    # Stage files
+    if all:
+        git.add(all=True)
+        console.print("[green]OK[/green] Staged all changes")
+    elif files:
+        git.add(list(files))
+        console.print(f"[green]OK[/green] Staged {len(files)} file(s)")
+    else:
+        console.print("[yellow]No files specified. Use --all or specify files.[/yellow]")
+        return
+
+    # Get diff; the agent, and the size bound it sets, are only needed for an AI message
+    agent = get_ai_agent() if ai and not message else None
+    diff = get_diff_for_ai(git, staged=True, max_size=agent.MAX_DIFF_SIZE if agent else None)
+    if not diff:
+        console.print("[yellow]No staged changes to commit.[/yellow]")
+        return
+
+    # Generate or use provided message
+    if ai and not message:
+        console.print("[cyan]AI: Generating commit message...[/cyan]")
+        console.print("\n[bold]Generated message:[/bold]")
+        message = print_stream(agent.stream_commit_message(diff)).strip()
+
+        if not click.confirm("\nUse this message?", default=True):
+            message = click.prompt("Enter commit message")
+
+    if not message:
+        message = click.prompt("Enter commit message")
+
+    # Commit
+    commit_sha = git.commit(message)
+    console.print(f"\n[green]OK Committed: {commit_sha}[/green]")
+    subject = message.partition('\n')[0]
+    console.print(f"  {subject}")
@@ -0,0 +1,83 @@
+"""Create a pull request with an optional AI-generated description."""
+
+import asyncio
+
+import click
+
+from github_assistant.cli import (
+    get_ai_agent, get_commit_context_for_ai, get_console, get_git_client, get_github_client, print_panel,
+    run_async, run_blocking, status_if_slow
+)
+from github_assistant.repo_utils import resolve_repo
+
+console = get_console()
+
+
+@click.command(name='create-pr')
+@click.argument('title')
+@click.option('--base', '-b', default='main', help='Base branch')
+@click.option('--head', '-h', help='Head branch (defaults to current)')
+@click.option('--body', '-d', help='PR description')
+@click.option('--ai', is_flag=True, help='Generate description with AI')
+@click.option('--repo', '-r', help='Repository name')
+def create_pr(title, base, head, body, ai, repo):
+    """Create a pull request."""
+    run_async(_create_pr(title, base, head, body, ai, repo))
+
+
+async def _create_pr(title, base, head, body, ai, repo):
+    git, github = get_git_client(), get_github_client()
+
+    # Get current branch if head not specified
+    if not head:
+        head = git.get_current_branch()
+
+    # Get repository name
+    repo = await resolve_repo(git, github, repo)
+
+    prewarm = None
+    try:
+        # Generate description with AI if requested
+        if ai and not body:
+            # The create request follows the AI call and a prompt, so set up
+            # the API connection while the description is generated
+            prewarm = asyncio.create_task(github.prewarm(repo))
+
+            agent = get_ai_agent()
+            console.print("[cyan]AI: Generating PR description...[/cyan]")
+            # Diff, shortstat and log are collected side by side, one git call each
+            context = get_commit_context_for_ai(git, max_size=agent.MAX_PR_DIFF_SIZE, log_count=10)
+            diff = context['diff']
+            commit_messages = [c['message'] for c in context['log']]
+
+            body = await agent.agenerate_pr_description(diff, head, commit_messages)
+
+            console.print("\n[bold]Generated description:[/bold]")
+            print_panel(body)
+
+            if not run_blocking(click.confirm, "\nUse this description?", default=True):
+                body = run_blocking(click.prompt, "Enter PR description")
+
+        if not body:
+            body = run_blocking(click.prompt, "Enter PR description (optional)", default="")
+
+        if prewarm is not None:
+            await prewarm
+    finally:
+        # Don't leave the prewarm running under the session run_async closes
+        if prewarm is not None and not prewarm.done():
+            prewarm.cancel()
+
+    # Create PR
+    with status_if_slow("[cyan]Creating pull request...[/cyan]"):
+        pr = await github.create_pull_request(
+            repo_name=repo,
+            title=title,
+            head=head,
+            base=base,
+            body=body
+        )
+
+    console.print(f"\n[green]OK Pull request created![/green]")
+    console.print(f"\n[bold]PR #{pr['number']}:[/bold] {pr['title']}")
+    console.print(f"[bold]URL:[/bold] {pr['html_url']}")
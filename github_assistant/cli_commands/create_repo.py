@@ -0,0 +1,38 @@
+"""Create a new GitHub repository."""
+
+import click
+
+from github_assistant.cli import get_console, get_git_client, get_github_client, run_async, status_if_slow
+
+console = get_console()
+
+
+@click.command(name='create-repo')
+@click.argument('name')
+@click.option('--description', '-d', default='', help='Repository description')
+@click.option('--private', is_flag=True, help='Make repository private')
+@click.option('--init', is_flag=True, default=True, help='Initialize with README')
+def create_repo(name, description, private, init):
+    """Create a new GitHub repository."""
+    run_async(_create_repo(name, description, private, init))
+
+
+async def _create_repo(name, description, private, init):
+    git, github = get_git_client(), get_github_client()
+
+    with status_if_slow(f"[cyan]Creating repository '{name}'...[/cyan]"):
+        repo = await github.create_repository(
+            name=name,
+            description=description,
+            private=private,
+            auto_init=init
+        )
+
+    console.print(f"\n[green]OK Repository created successfully![/green]")
+    console.print(f"\n[bold]Repository:[/bold] {repo['full_name']}")
+    console.print(f"[bold]URL:[/bold] {repo['html_url']}")
+    console.print(f"[bold]Clone:[/bold] {repo['clone_url']}")
+
+    if click.confirm("\nClone to current directory?"):
+        git.clone_repository(repo['clone_url'], name)
+        console.print(f"[green]OK Cloned to ./{name}[/green]")
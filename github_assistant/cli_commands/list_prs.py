@@ -0,0 +1,66 @@
+"""List pull requests for a repository."""
+
+import click
+
+from github_assistant.cli import get_console, get_git_client, get_github_client, print_json, run_async
+from github_assistant.repo_utils import resolve_repo
+
+console = get_console()
+
+
+@click.command(name='list-prs')
+@click.option('--repo', '-r', help='Repository name')
+@click.option('--state', '-s', default='open', type=click.Choice(['open', 'closed', 'all']))
+@click.option('--no-cache', is_flag=True, help='Ignore cached GitHub responses')
+@click.option('--json', 'as_json', is_flag=True, help='Print pull requests as JSON instead of a table')
+def list_prs(repo, state, no_cache, as_json):
+    """List pull requests."""
+    run_async(_list_prs(repo, state, no_cache, as_json))
+
+
+async def _list_prs(repo, state, no_cache, as_json):
+    git, github = get_git_client(), get_github_client()
+
+    # Get repository name
+    repo = await resolve_repo(git, github, repo)
+
+    # Only the first 20 are shown, so don't page through the rest
+    prs = await github.list_pull_requests(repo, state=state, limit=20, use_cache=not no_cache)
+    if as_json:
+        print_json([
+            {
+                "number": pr['number'],
+                "title": pr['title'],
+                "author": pr['user']['login'],
+                "state": pr['state'],
+                "url": pr['html_url'],
+            }
+            for pr in prs
+        ])
+        return
+
+    if not prs:
+        console.print(f"[yellow]No pull requests found ({state}).[/yellow]")
+        return
+
+    from rich.table import Table
+
+    table = Table(title=f"Pull Requests ({state})", show_header=True, header_style="bold cyan")
+    table.add_column("#", style="yellow", width=6)
+    table.add_column("Title", style="green")
+    table.add_column("Author")
+    table.add_column("State")
+
+    rows = [
+        (
+            f"#{pr['number']}",
+            pr['title'][:50],
+            pr['user']['login'],
+            f"[green]{pr['state']}[/green]" if pr['state'] == "open" else f"[dim]{pr['state']}[/dim]",
+        )
+        for pr in prs
+    ]
+    for row in rows:
+        table.add_row(*row)
+
+    console.print(table)
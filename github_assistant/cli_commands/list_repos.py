@@ -0,0 +1,60 @@
+"""List the authenticated user's GitHub repositories."""
+
+import click
+
+from github_assistant.cli import get_console, get_github_client, print_json, run_async
+
+console = get_console()
+
+
+@click.command(name='list-repos')
+@click.option('--limit', '-n', default=10, help='Number of repositories to show')
+@click.option('--no-cache', is_flag=True, help='Ignore cached GitHub responses')
+@click.option('--json', 'as_json', is_flag=True, help='Print repositories as JSON instead of a table')
+def list_repos(limit, no_cache, as_json):
+    """List your GitHub repositories."""
+    run_async(_list_repos(limit, no_cache, as_json))
+
+
+async def _list_repos(limit, no_cache, as_json):
+    github = get_github_client()
+
+    repos = await github.list_repositories(limit=limit, use_cache=not no_cache)
+    if as_json:
+        print_json([
+            {
+                "name": repo['full_name'],
+                "description": repo['description'],
+                "stars": repo['stargazers_count'],
+                "private": repo['private'],
+                "url": repo['html_url'],
+            }
+            for repo in repos
+        ])
+        return
+
+    if not repos:
+        console.print("[yellow]No repositories found.[/yellow]")
+        return
+
+    from rich.table import Table
+
+    table = Table(title="Your Repositories", show_header=True, header_style="bold cyan")
+    table.add_column("Name", style="green")
+    table.add_column("Description")
+    table.add_column("Stars", justify="right", style="yellow")
+    table.add_column("Private", justify="center")
+
+    rows = [
+        (
+            repo['name'],
+            repo['description'][:50],
+            str(repo['stargazers_count']),
+            "Private" if repo['private'] else "Public",
+        )
+        for repo in repos
+    ]
+    for row in rows:
+        table.add_row(*row)
+
+    console.print(table)
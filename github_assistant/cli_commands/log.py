@@ -0,0 +1,36 @@
+"""Show commit history."""
+
+import click
+
+from github_assistant.cli import get_console, get_git_client
+
+console = get_console()
+
+
+@click.command()
+@click.option('--count', '-n', default=10, help='Number of commits to show')
+def log(count):
+    """Show commit history."""
+    git = get_git_client()
+
+    commits = git.get_log(max_count=count)
+    if not commits:
+        console.print("[yellow]No commits found.[/yellow]")
+        return
+
+    from rich.table import Table
+
+    table = Table(title="Commit History", show_header=True, header_style="bold cyan")
+    table.add_column("SHA", style="yellow", width=8)
+    table.add_column("Author", style="green")
+    table.add_column("Date", style="cyan")
+    table.add_column("Message")
+
+    rows = [
+        (c['sha'], c['author'], c['date'][:10], c['message'].partition('\n')[0][:50])
+        for c in commits
+    ]
+    for row in rows:
+        table.add_row(*row)
+
+    console.print(table)
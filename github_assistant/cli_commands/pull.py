@@ -0,0 +1,21 @@
+"""Pull changes from a remote repository."""
+
+import click
+
+from github_assistant.cli import get_console, get_git_client, status_if_slow
+
+console = get_console()
+
+
+@click.command()
+@click.option('--remote', '-r', default='origin', help='Remote name')
+@click.option('--branch', '-b', help='Branch name')
+@click.option('--rebase', is_flag=True, help='Rebase instead of merge')
+def pull(remote, branch, rebase):
+    """Pull changes from remote repository."""
+    git = get_git_client()
+
+    with status_if_slow("[cyan]Pulling changes...[/cyan]"):
+        result = git.pull(remote=remote, branch=branch, rebase=rebase)
+
+    console.print(f"[green]OK {result}[/green]")
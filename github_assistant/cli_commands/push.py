@@ -0,0 +1,27 @@
+"""Push commits to a remote repository."""
+
+import click
+
+from github_assistant.cli import get_console, get_git_client, status_if_slow
+
+console = get_console()
+
+
+@click.command()
+@click.option('--remote', '-r', default='origin', help='Remote name')
+@click.option('--branch', '-b', help='Branch name')
+@click.option('--set-upstream', '-u', is_flag=True, help='Set upstream tracking')
+@click.option('--force', '-f', is_flag=True, help='Force push')
+def push(remote, branch, set_upstream, force):
+    """Push commits to remote repository."""
+    git = get_git_client()
+
+    with status_if_slow("[cyan]Pushing changes...[/cyan]"):
+        result = git.push(
+            remote=remote,
+            branch=branch,
+            set_upstream=set_upstream,
+            force=force
+        )
+
+    console.print(f"[green]OK {result}[/green]")
@@ -0,0 +1,52 @@
+"""Quick commit: stage, commit (with AI) and optionally push."""
+
+import click
+
+from github_assistant.cli import get_ai_agent, get_console, get_diff_for_ai, get_git_client, print_stream, status_if_slow
+
+console = get_console()
+
+
+@click.command(name='quick-commit')
+@click.option('--ai', is_flag=True, default=True, help='Generate commit message with AI')
+@click.option('--message', '-m', help='Commit message (skips AI)')
+@click.option('--push', '-p', is_flag=True, help='Push after committing')
+@click.option('--remote', '-r', default='origin', help='Remote to push to')
+def quick_commit(ai, message, push, remote):
+    """Quick commit: stage all changes, commit (with AI), and optionally push."""
+    git = get_git_client()
+
+    # Stage all changes
+    git.add(all=True)
+    console.print("[green]OK[/green] Staged all changes")
+
+    # Get diff; the agent, and the size bound it sets, are only needed for an AI message
+    agent = get_ai_agent() if ai and not message else None
+    diff = get_diff_for_ai(git, staged=True, max_size=agent.MAX_DIFF_SIZE if agent else None)
+    if not diff:
+        console.print("[yellow]No staged changes to commit.[/yellow]")
+        return
+
+    # Generate or use provided message
+    if ai and not message:
+        console.print("[cyan]AI: Generating commit message...[/cyan]")
+        console.print("\n[bold]Generated message:[/bold]")
+        message = print_stream(agent.stream_commit_message(diff)).strip()
+
+        if not click.confirm("\nUse this message?", default=True):
+            message = click.prompt("Enter commit message")
+
+    if not message:
+        message = click.prompt("Enter commit message")
+
+    # Commit
+    commit_sha = git.commit(message)
+    console.print(f"\n[green]OK Committed: {commit_sha}[/green]")
+    subject = message.partition('\n')[0]
+    console.print(f"  {subject}")
+
+    # Push if requested
+    if push:
+        with status_if_slow("[cyan]Pushing changes...[/cyan]"):
+            result = git.push(remote=remote)
+        console.print(f"[green]OK {result}[/green]")
@@ -0,0 +1,37 @@
+"""Check GitHub API rate limit status."""
+
+import click
+
+from github_assistant.cli import get_console, get_github_client, run_async
+
+console = get_console()
+
+# Indexed by how many of the 10% / 20% thresholds the remaining count clears
+_REMAINING_STYLES = ("red", "yellow", "green")
+
+
+@click.command(name='rate-limit')
+@click.option('--no-cache', is_flag=True, help='Ignore cached GitHub responses')
+def rate_limit(no_cache):
+    """Check GitHub API rate limit status."""
+    run_async(_rate_limit(no_cache))
+
+
+async def _rate_limit(no_cache):
+    from rich.table import Table
+
+    github = get_github_client()
+
+    status = await github.get_rate_limit_status(use_cache=not no_cache)
+
+    table = Table(title="GitHub API Rate Limits", show_header=True, header_style="bold cyan")
+    table.add_column("Resource", style="yellow")
+    table.add_column("Limit", justify="right")
+    table.add_column("Remaining", justify="right", style="green")
+    table.add_column("Reset Time", style="cyan")
+
+    for resource, limit, remaining, reset in status:
+        style = _REMAINING_STYLES[(remaining >= limit * 0.1) + (remaining > limit * 0.2)]
+        table.add_row(resource.title(), str(limit), f"[{style}]{remaining}[/{style}]", reset)
+
+    console.print(table)
@@ -0,0 +1,54 @@
+"""Review local code changes with AI analysis."""
+
+import click
+
+from github_assistant.cli import get_ai_agent, get_console, get_diff_for_ai, get_git_client, print_diff, print_panel
+from github_assistant.models import ReviewResult
+
+console = get_console()
+
+
+@click.command()
+@click.option('--staged', is_flag=True, help='Review staged changes')
+@click.option('--ai', is_flag=True, default=True, help='Use AI for review')
+def review(staged, ai):
+    """Review code changes with AI analysis."""
+    git, agent = get_git_client(), get_ai_agent()
+
+    # Get diff
+    diff = get_diff_for_ai(git, staged=staged, max_size=agent.MAX_DIFF_SIZE)
+
+    if not diff:
+        console.print("[yellow]No changes to review.[/yellow]")
+        return
+
+    # Show diff
+    console.print("\n[bold]Changes:[/bold]")
+    print_diff(diff[:2000])
+
+    if len(diff) > 2000:
+        console.print(f"\n[dim]... ({len(diff) - 2000} more characters)[/dim]")
+
+    # AI review
+    if ai:
+        with console.status("[cyan]AI: AI is reviewing your code...[/cyan]"):
+            review_data = ReviewResult.from_dict(agent.review_code_changes(diff))
+
+        # Read each field once; the list sections share one render loop
+        summary, rating, recommendation = review_data.summary, review_data.rating, review_data.recommendation
+        sections = (
+            ("[yellow]Issues Found:[/yellow]", "  • ", review_data.issues),
+            ("[green]Suggestions:[/green]", "  • ", review_data.suggestions),
+            ("[red]Security Concerns:[/red]", "  WARNING: ", review_data.security_concerns),
+        )
+
+        console.print("\n[bold cyan]AI Review:[/bold cyan]")
+        print_panel(summary, title="Summary")
+
+        for heading, bullet, items in sections:
+            if items:
+                console.print(f"\n{heading}")
+                console.print("\n".join(f"{bullet}{item}" for item in items))
+
+        console.print(f"\n[bold]Rating:[/bold] {rating}/10")
+        console.print(f"[bold]Recommendation:[/bold] {recommendation}")
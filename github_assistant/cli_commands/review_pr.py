@@ -0,0 +1,58 @@
+"""Review a pull request with AI."""
+
+import asyncio
+
+import click
+
+from github_assistant.cli import get_clients, get_console, print_panel, run_async, status_if_slow
+from github_assistant.models import PRReview
+from github_assistant.repo_utils import resolve_repo
+
+console = get_console()
+
+
+@click.command(name='review-pr')
+@click.argument('pr_number', type=int)
+@click.option('--repo', '-r', help='Repository name')
+@click.option('--no-cache', is_flag=True, help='Ignore cached GitHub and AI responses')
+def review_pr(pr_number, repo, no_cache):
+    """Review a pull request with AI."""
+    run_async(_review_pr(pr_number, repo, no_cache))
+
+
+async def _review_pr(pr_number, repo, no_cache):
+    git, github, agent = get_clients()
+    agent.refresh = no_cache
+
+    # Get repository name
+    repo = await resolve_repo(git, github, repo)
+
+    # Get PR
+    with status_if_slow(f"[cyan]Fetching PR #{pr_number}...[/cyan]"):
+        # Overlap the two API round-trips on the shared session
+        pr, diff = await asyncio.gather(
+            github.get_pull_request(repo, pr_number, use_cache=not no_cache),
+            github.get_pr_diff(repo, pr_number, use_cache=not no_cache),
+        )
+
+    console.print(f"\n[bold]PR #{pr['number']}:[/bold] {pr['title']}")
+    console.print(f"[bold]By:[/bold] {pr['user']['login']}")
+    console.print(f"[bold]State:[/bold] {pr['state']}")
+
+    # AI Review
+    with console.status("[cyan]AI: AI is reviewing the PR...[/cyan]"):
+        review = PRReview.from_dict(await agent.areview_pull_request(
+            pr_title=pr['title'],
+            pr_description=pr['body'] or "",
+            diff=diff,
+            files_changed=pr['changed_files']
+        ))
+
+    console.print("\n")
+    print_panel(review.review_comment, title="AI Review")
+
+    console.print(f"\n[bold]Recommendation:[/bold] {review.recommendation}")
+
+    if click.confirm("\nPost this review to GitHub?"):
+        await github.comment_on_pr(repo, pr_number, review.review_comment)
+        console.print("[green]OK Review posted![/green]")
@@ -0,0 +1,59 @@
+"""Run several gh-assist commands in one long-lived process."""
+
+import shlex
+import sys
+
+import click
+
+from github_assistant.cli import get_console, refresh_clients, report_error
+
+console = get_console()
+
+
+@click.command()
+@click.pass_context
+def shell(ctx):
+    """Read commands (e.g. `status`, `log -n 5`) from stdin and run them in one process.
+
+    Clients are built once and reused, so the git repository handle and
+    GitPython's persistent `git cat-file` helpers survive between commands
+    instead of being re-spawned for every invocation.
+    """
+    group = ctx.find_root().command
+    interactive = sys.stdin.isatty()
+
+    while True:
+        try:
+            line = input("gh-assist> " if interactive else "")
+        except EOFError:
+            break
+
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            console.print(f"[red]ERROR Error: {str(e)}[/red]")
+            continue
+
+        if not args:
+            continue
+        if args[0] in ('exit', 'quit'):
+            break
+
+        command = group.get_command(ctx, args[0])
+        if command is None or command is shell:
+            console.print(f"[red]ERROR Unknown command: {args[0]}[/red]")
+            continue
+
+        # The branch may have been switched outside the shell since the last command
+        refresh_clients()
+        try:
+            command.main(args[1:], prog_name=f"gh-assist {args[0]}", standalone_mode=False)
+        except click.ClickException as e:
+            e.show()
+        except click.Abort:
+            console.print("[yellow]Aborted[/yellow]")
+        except SystemExit:
+            # Client setup exits with status 1 after reporting the problem
+            pass
+        except Exception as e:
+            report_error(e)
@@ -0,0 +1,62 @@
+"""Show repository status."""
+
+import click
+from rich.text import Text
+
+from github_assistant.cli import get_console, get_git_client, print_diff
+
+console = get_console()
+
+# Line prefixes are styled once here instead of re-parsing markup for every file
+_MODIFIED_PREFIX = Text.assemble("  ", ("M", "yellow"), " ")
+_STAGED_PREFIX = Text.assemble("  ", ("A", "green"), " ")
+_UNTRACKED_PREFIX = Text.assemble("  ", ("?", "red"), " ")
+
+
+def _file_lines(prefix: Text, files) -> Text:
+    """Build one Text block listing `files`, each behind a pre-styled prefix."""
+    text = Text()
+    for file in files:
+        text.append_text(prefix)
+        text.append(file)
+        text.append("\n")
+    text.rstrip()
+    return text
+
+
+@click.command()
+@click.option('--verbose', '-v', is_flag=True, help='Show detailed status')
+def status(verbose):
+    """Show repository status."""
+    git = get_git_client()
+
+    status_info = git.status()
+
+    # Display current branch
+    console.print(f"\n[bold cyan]On branch:[/bold cyan] {status_info['current_branch']}")
+
+    # Display modified files
+    if status_info['modified']:
+        console.print("\n[yellow]Modified files:[/yellow]")
+        console.print(_file_lines(_MODIFIED_PREFIX, status_info['modified']))
+
+    # Display staged files
+    if status_info['staged']:
+        console.print("\n[green]Staged files:[/green]")
+        console.print(_file_lines(_STAGED_PREFIX, status_info['staged']))
+
+    # Display untracked files
+    if status_info['untracked']:
+        console.print("\n[red]Untracked files:[/red]")
+        console.print(_file_lines(_UNTRACKED_PREFIX, status_info['untracked']))
+
+    # Clean working tree
+    if not status_info['is_dirty']:
+        console.print("\n[green]OK Working tree clean[/green]")
+
+    # Show diff if verbose
+    if verbose and status_info['is_dirty']:
+        diff = git.get_diff()
+        if diff:
+            console.print("\n[bold]Changes:[/bold]")
+            print_diff(diff, line_numbers=True)
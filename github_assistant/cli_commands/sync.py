@@ -0,0 +1,35 @@
+"""Sync with remote: pull changes and push local commits."""
+
+import click
+
+from github_assistant.cli import get_console, get_git_client, status_if_slow
+
+console = get_console()
+
+
+@click.command(name='sync')
+@click.option('--remote', '-r', default='origin', help='Remote name')
+@click.option('--branch', '-b', help='Branch name')
+@click.option('--rebase', is_flag=True, help='Use rebase instead of merge')
+def sync(remote, branch, rebase):
+    """Sync with remote: pull changes and push local commits."""
+    git = get_git_client()
+
+    # Pull first
+    with status_if_slow("[cyan]Pulling changes...[/cyan]"):
+        pull_result = git.pull(remote=remote, branch=branch, rebase=rebase)
+    console.print(f"[green]OK {pull_result}[/green]")
+
+    # Check if there are local commits to push
+    status_info = git.status()
+    if status_info['is_dirty']:
+        console.print("[yellow]Working directory has uncommitted changes.[/yellow]")
+        console.print("[yellow]Commit changes before syncing.[/yellow]")
+        return
+
+    # Push
+    with status_if_slow("[cyan]Pushing changes...[/cyan]"):
+        push_result = git.push(remote=remote, branch=branch)
+    console.print(f"[green]OK {push_result}[/green]")
+
+    console.print("\n[green]✓[/green] Sync complete!")
@@ -1,28 +1,116 @@
 """Configuration management for GitHub Assistant."""
 
 import os
+import re
+from collections import ChainMap
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 try:
     import yaml
+    # LibYAML's C loader parses several times faster than the pure-Python one
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader
     HAS_YAML = True
 except ImportError:
     HAS_YAML = False
-    logger.debug("PyYAML not installed, config file support disabled")
+    logger.debug("PyYAML not installed, YAML config file support disabled")
+
+try:
+    import tomllib
+    HAS_TOML = True
+except ImportError:
+    HAS_TOML = False
+
+# Parsed config files keyed by (path, mtime), so reloading an unchanged file is free
+_parsed_files: Dict[Tuple[str, float], Dict[str, Any]] = {}
+
+# Environment variables mapped onto (section, key)
+_ENV_MAPPINGS = {
+    "ANTHROPIC_MODEL": ("ai", "model"),
+    "GH_ASSIST_DEBUG": ("cli", "debug"),
+    "GH_ASSIST_DEFAULT_BRANCH": ("git", "default_branch"),
+    "GH_ASSIST_TOKENS": ("github", "tokens"),
+}
+
+_INT_RE = re.compile(r'-?\d+')
+
+
+def _coerce(value: str) -> Any:
+    """Convert "true"/"false" to bool and integer strings (including negative ones) to int."""
+    lowered = value.lower()
+    if lowered in ('true', 'false'):
+        return lowered == 'true'
+    if _INT_RE.fullmatch(value):
+        return int(value)
+    return value
+
+
+# Config file names looked for in the working directory, in priority order
+_CWD_CONFIG_NAMES = (".gh-assistant.toml", ".gh-assistant.yml", ".gh-assistant.yaml")
+
+# Per-user config files (relative to the home directory), used when the working directory has none
+_HOME_CONFIG_PATHS = (Path(".config") / "gh-assistant" / "config.yml", Path(".gh-assistant.yml"))
+
+
+def _find_config_file(cwd: str) -> Optional[str]:
+    """
+    Find the config file for a working directory.
+
+    The working directory is listed once and its candidates checked by set
+    membership instead of one stat each. The result is not cached, so a
+    file created or removed since (e.g. during `gh-assist shell`) is seen
+    by the next get_config(reload=True).
+    """
+    try:
+        present = set(os.listdir(cwd))
+    except OSError:
+        present = set()
+
+    for name in _CWD_CONFIG_NAMES:
+        if name in present:
+            path = os.path.join(cwd, name)
+            logger.debug(f"Found config file: {path}")
+            return path
+
+    home = Path.home()
+    for relative in _HOME_CONFIG_PATHS:
+        path = home / relative
+        if path.exists():
+            logger.debug(f"Found config file: {path}")
+            return str(path)
+
+    logger.debug("No config file found, using defaults")
+    return None
 
 
 class Config:
-    """Configuration manager for GitHub Assistant."""
+    """
+    Configuration manager for GitHub Assistant.
+
+    Values are resolved through layers (defaults, config file, environment,
+    runtime overrides), the last one that sets a key winning. No layer is
+    ever merged into another, so the defaults and cached file parses stay
+    untouched.
+    """
 
     DEFAULT_CONFIG = {
         "ai": {
             "model": "claude-3-5-sonnet-20241022",
             "max_diff_size": 50000,
             "max_pr_diff_size": 100000,
+            # Reuse replies to identical prompts (see ai_cache)
+            "cache": True,
+            # Retries of failed API calls (rate limits, overloads, timeouts)
+            "max_retries": 3,
+            # Client-side throttle (Anthropic tier 1 limits); 0 disables it
+            "requests_per_minute": 50,
+            "tokens_per_minute": 40000,
         },
         "git": {
             "default_branch": "main",
@@ -31,6 +119,8 @@ class Config:
         "github": {
             "default_private": False,
             "auto_init": True,
+            # Extra tokens to rotate between when one runs low on rate limit
+            "tokens": [],
         },
         "cli": {
             "debug": False,
@@ -44,8 +134,14 @@ class Config:
         Args:
             config_path: Path to config file (optional)
         """
-        self.config = self.DEFAULT_CONFIG.copy()
-        self.config_path = config_path or self._find_config_file()
+        self._file_layer: Dict[str, Dict[str, Any]] = {}
+        self._env_layer: Dict[str, Dict[str, Any]] = {}
+        self._runtime_layer: Dict[str, Dict[str, Any]] = {}
+        # Lowest priority first
+        self._layers: List[Dict[str, Dict[str, Any]]] = [
+            self.DEFAULT_CONFIG, self._file_layer, self._env_layer, self._runtime_layer
+        ]
+        self.config_path = config_path or _find_config_file(os.getcwd())
 
         if self.config_path and os.path.exists(self.config_path):
             self._load_config()
@@ -53,68 +149,56 @@ class Config:
         # Override with environment variables
         self._load_from_env()
 
-    def _find_config_file(self) -> Optional[str]:
-        """Find config file in common locations."""
-        possible_paths = [
-            Path.cwd() / ".gh-assistant.yml",
-            Path.cwd() / ".gh-assistant.yaml",
-            Path.home() / ".config" / "gh-assistant" / "config.yml",
-            Path.home() / ".gh-assistant.yml",
-        ]
-
-        for path in possible_paths:
-            if path.exists():
-                logger.debug(f"Found config file: {path}")
-                return str(path)
+    def _parse_file(self) -> Optional[Dict[str, Any]]:
+        """Parse the config file as TOML (by .toml suffix) or YAML, reusing an earlier parse if unchanged."""
+        key = (self.config_path, os.path.getmtime(self.config_path))
+        if key in _parsed_files:
+            return _parsed_files[key]
+
+        if str(self.config_path).endswith('.toml'):
+            if not HAS_TOML:
+                logger.warning("TOML config files need Python 3.11+, cannot load config file")
+                return None
+            with open(self.config_path, 'rb') as f:
+                parsed = tomllib.load(f)
+        else:
+            if not HAS_YAML:
+                logger.warning("PyYAML not installed, cannot load config file")
+                return None
+            with open(self.config_path, 'r') as f:
+                parsed = yaml.load(f, Loader=YamlLoader) or {}
 
-        logger.debug("No config file found, using defaults")
-        return None
+        _parsed_files[key] = parsed
+        return parsed
 
     def _load_config(self):
-        """Load configuration from YAML file."""
-        if not HAS_YAML:
-            logger.warning("PyYAML not installed, cannot load config file")
-            return
-
+        """Load configuration from a YAML or TOML file."""
         try:
-            with open(self.config_path, 'r') as f:
-                user_config = yaml.safe_load(f) or {}
-
-            # Deep merge with defaults
-            self._merge_config(self.config, user_config)
+            parsed = self._parse_file()
+            if parsed is None:
+                return
+
+            # Sections are only read, so the cached parse can be used as-is
+            for section, values in parsed.items():
+                if isinstance(values, dict):
+                    self._file_layer[section] = values
+                else:
+                    logger.warning(f"Ignoring config section '{section}': expected a mapping")
             logger.info(f"Loaded configuration from {self.config_path}")
 
         except Exception as e:
             logger.error(f"Failed to load config file: {e}")
 
-    def _merge_config(self, base: Dict, override: Dict):
-        """Recursively merge override config into base config."""
-        for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._merge_config(base[key], value)
-            else:
-                base[key] = value
-
     def _load_from_env(self):
-        """Load configuration from environment variables."""
-        env_mappings = {
-            "ANTHROPIC_MODEL": ("ai", "model"),
-            "GH_ASSIST_DEBUG": ("cli", "debug"),
-            "GH_ASSIST_DEFAULT_BRANCH": ("git", "default_branch"),
-        }
+        """Load configuration from environment variables, scanning os.environ once."""
+        for env_var, value in os.environ.items():
+            mapping = _ENV_MAPPINGS.get(env_var)
+            if mapping is None:
+                continue
 
-        for env_var, (section, key) in env_mappings.items():
-            value = os.getenv(env_var)
-            if value is not None:
-                # Convert boolean strings
-                if value.lower() in ('true', 'false'):
-                    value = value.lower() == 'true'
-                # Convert numeric strings
-                elif value.isdigit():
-                    value = int(value)
-
-                self.config[section][key] = value
-                logger.debug(f"Loaded {env_var} from environment")
+            section, key = mapping
+            self._env_layer.setdefault(section, {})[key] = _coerce(value)
+            logger.debug(f"Loaded {env_var} from environment")
 
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """
@@ -128,20 +212,25 @@ class Config:
         Returns:
             Configuration value
         """
-        try:
-            return self.config[section][key]
-        except KeyError:
-            return default
+        for layer in reversed(self._layers):
+            values = layer.get(section)
+            if values is not None and key in values:
+                return values[key]
+        return default
 
     def get_section(self, section: str) -> Dict[str, Any]:
         """Get entire configuration section."""
-        return self.config.get(section, {})
+        return dict(ChainMap(*(layer.get(section, {}) for layer in reversed(self._layers))))
+
+    @property
+    def config(self) -> Dict[str, Dict[str, Any]]:
+        """All layers flattened into one section -> key -> value dict."""
+        sections = dict.fromkeys(section for layer in self._layers for section in layer)
+        return {section: self.get_section(section) for section in sections}
 
     def set(self, section: str, key: str, value: Any):
         """Set configuration value (runtime only, not persisted)."""
-        if section not in self.config:
-            self.config[section] = {}
-        self.config[section][key] = value
+        self._runtime_layer.setdefault(section, {})[key] = value
 
     def save(self, path: Optional[str] = None):
         """
@@ -157,6 +246,9 @@ class Config:
         save_path = path or self.config_path
         if not save_path:
             save_path = Path.cwd() / ".gh-assistant.yml"
+        if str(save_path).endswith('.toml'):
+            logger.error("Saving TOML config files is not supported, use a .yml path")
+            return
 
         try:
             os.makedirs(os.path.dirname(save_path), exist_ok=True)
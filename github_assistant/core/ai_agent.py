@@ -1,129 +1,517 @@
 """AI agent for intelligent GitHub and Git operations using Claude."""
 
-from typing import Optional, Dict, List, Any
-from anthropic import Anthropic
+from typing import TYPE_CHECKING, Optional, Dict, List, Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, NoReturn, Tuple, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import asyncio
+import json
 import os
+import time
 import logging
 
+from github_assistant.ai_cache import AICache, get_ai_cache
+from github_assistant.config import get_config
+from github_assistant.core import prompts
+from github_assistant.core.diff_trim import file_path, split_files, trim_diff
+from github_assistant.core.response_cache import ResponseCache
+from github_assistant.core.throttle import RateLimiter
+
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+
 logger = logging.getLogger(__name__)
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+T = TypeVar("T")
+
+
+class _JSONScanner:
+    """
+    Brace-depth tracker for text that arrives in pieces.
+
+    Finds where the first top-level JSON object (or, with opener "[", array)
+    starts and ends in one left-to-right pass, skipping brackets inside
+    string literals, so a streamed reply is never re-scanned as it grows.
+    """
+
+    _CLOSERS = {"{": "}", "[": "]"}
+
+    def __init__(self, opener: str = "{"):
+        self._opener, self._closer = opener, self._CLOSERS[opener]
+        self.start = -1
+        self.end = -1
+        self._offset = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: str) -> bool:
+        """Scan the next piece of text; return True once the first object has closed."""
+        if self.end >= 0:
+            return True
+
+        opener, closer = self._opener, self._closer
+        depth, in_string, escape = self._depth, self._in_string, self._escape
+        for i, char in enumerate(chunk):
+            if in_string:
+                if escape:
+                    escape = False
+                elif char == '\\':
+                    escape = True
+                elif char == '"':
+                    in_string = False
+            elif char == opener:
+                if depth == 0:
+                    self.start = self._offset + i
+                depth += 1
+            elif depth:
+                if char == '"':
+                    in_string = True
+                elif char == closer:
+                    depth -= 1
+                    if depth == 0:
+                        self.end = self._offset + i + 1
+                        return True
+
+        self._depth, self._in_string, self._escape = depth, in_string, escape
+        self._offset += len(chunk)
+        return False
+
+
+class _JSONObjectWatcher:
+    """
+    Tells when a streamed reply holds a complete, decodable JSON object.
+
+    _JSONScanner only balances braces, so a "{placeholder}" or quoted code
+    ahead of the real object would end the stream early. A balanced span
+    that does not decode to a dict is skipped, as _extract_first_json does,
+    and scanning resumes just past its start.
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._scanner = _JSONScanner()
+
+    def feed(self, chunk: str) -> bool:
+        """Scan the next piece of the reply; return True once a JSON object in it has closed."""
+        self._text += chunk
+        pending = chunk
+        while self._scanner.feed(pending):
+            start, end = self._pos + self._scanner.start, self._pos + self._scanner.end
+            try:
+                value = json_loads(self._text[start:end])
+            except ValueError:
+                value = None
+            if isinstance(value, dict):
+                return True
+            self._pos = start + 1
+            self._scanner = _JSONScanner()
+            pending = self._text[self._pos:]
+        return False
+
+
+def _extract_first_json(text: str, opener: str = "{", accept: Optional[Callable[[Any], bool]] = None) -> Any:
+    """
+    Decode the first balanced {...} (or [...]) value in text that is valid JSON, fenced or not.
+
+    A bracketed span that fails to decode, or that `accept` rejects (e.g.
+    an "[1]" in prose before the real array), is skipped and scanning
+    resumes just past its start. Returns None when nothing qualifies.
+    """
+    pos = 0
+    while True:
+        scanner = _JSONScanner(opener)
+        if not scanner.feed(text[pos:]):
+            return None
+        start, end = pos + scanner.start, pos + scanner.end
+        try:
+            value = json_loads(text[start:end])
+        except ValueError:
+            value = None
+        else:
+            if accept is None or accept(value):
+                return value
+        pos = start + 1
+
+
+def _extract_first_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """Decode the first JSON object in text (see _extract_first_json)."""
+    return _extract_first_json(text, "{")
+
+
+def _extract_first_json_array(text: str) -> Optional[List[Dict[str, Any]]]:
+    """Decode the first JSON array of objects in text (see _extract_first_json)."""
+    return _extract_first_json(
+        text, "[", accept=lambda value: bool(value) and all(isinstance(item, dict) for item in value)
+    )
+
+
+class _UnusableReply(Exception):
+    """
+    Raised out of the cache lookup when every attempt at a JSON reply was unusable.
+
+    Carries the last reply for the caller to fall back on; raising it keeps
+    get_or_compute from storing the reply.
+    """
+
+    def __init__(self, reply: str):
+        super().__init__("AI reply has no JSON object")
+        self.reply = reply
+
 
 class AIAgent:
-    """Claude-powered AI agent for code analysis and automation."""
+    """
+    Claude-powered AI agent for code analysis and automation.
+
+    Every operation has a blocking method (e.g. review_code_changes) and a
+    coroutine twin prefixed with `a` (e.g. areview_code_changes). Both build
+    the same prompt and parse the reply the same way; only the client
+    differs. Use abatch() to run many of the coroutines concurrently.
+    """
 
     # Maximum characters for diff to prevent huge API costs
     MAX_DIFF_SIZE = 50000
     MAX_PR_DIFF_SIZE = 100000
 
-    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
-        """Initialize AI agent with Anthropic API key."""
+    # Default number of requests abatch() keeps in flight
+    BATCH_CONCURRENCY = 8
+
+    # PR diffs larger than this are reviewed in parallel parts of about this size, grouped by file
+    PR_REVIEW_PART_SIZE = 24000
+
+    # Issues per multi-issue prompt in suggest_labels_batch / triage_issues_batch
+    ISSUE_BATCH_SIZE = 20
+
+    # Message Batches submitted but not yet collected, so they survive a restart
+    BATCH_LEDGER_PATH = ResponseCache.DEFAULT_PATH.with_name("batches.json")
+
+    # Worst-first order used to combine the recommendations of a split PR review
+    _RECOMMENDATION_RANK = {"request_changes": 0, "needs_discussion": 1, "comment": 2, "approve": 3}
+
+    # Extra attempts when a reply comes back empty (or without the JSON that was asked for)
+    EMPTY_REPLY_RETRIES = 2
+
+    # Rough characters per token, for sizing a request before it is sent
+    CHARS_PER_TOKEN = 4
+
+    # Context window in tokens by model-name prefix (longest match wins); others get the default
+    MODEL_CONTEXT_TOKENS = {"claude-2.0": 100_000, "claude-instant": 100_000}
+    DEFAULT_CONTEXT_TOKENS = 200_000
+    # Diffs tokenize denser than prose, so a token budget converts to fewer characters
+    DIFF_CHARS_PER_TOKEN = 3
+    # Room left for the prompt template and the largest reply budget
+    RESERVED_TOKENS = 8_000
+
+    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None, use_cache: bool = True):
+        """
+        Initialize AI agent with Anthropic API key.
+
+        Replies are cached by (model, max_tokens, prompt) unless use_cache is
+        False or ai.cache is off; set `refresh` to fetch fresh replies that
+        replace the cached ones (e.g. for a "regenerate" action).
+        """
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
         if not self.api_key:
             raise ValueError("Anthropic API key required. Set ANTHROPIC_API_KEY env variable.")
 
-        self.client = Anthropic(api_key=self.api_key)
+        # Imported here so loading this module (e.g. for type hints) stays cheap
+        from anthropic import Anthropic
+
+        config = get_config()
+        # Rate limits, overloads, 5xx and timeouts are retried by the SDK with jittered backoff
+        self.max_retries = config.get("ai", "max_retries", 3)
+        self.client = Anthropic(api_key=self.api_key, max_retries=self.max_retries)
+        # Bound to the running event loop, so created on first async call and dropped by aclose()
+        self._aclient: Optional["AsyncAnthropic"] = None
         self.model = model or os.getenv('ANTHROPIC_MODEL', 'claude-3-5-sonnet-20241022')
+
+        # Diff limits are configurable (ai.max_diff_size / ai.max_pr_diff_size), but are
+        # capped so a diff at the limit still fits in the model's context window
+        fits = self.max_diff_chars()
+        self.MAX_DIFF_SIZE = min(config.get("ai", "max_diff_size", self.MAX_DIFF_SIZE), fits)
+        self.MAX_PR_DIFF_SIZE = min(config.get("ai", "max_pr_diff_size", self.MAX_PR_DIFF_SIZE), fits)
+
+        # Proactive throttling to the account's tier limits (ai.requests_per_minute /
+        # ai.tokens_per_minute); a requests_per_minute of 0 turns it off
+        rpm = config.get("ai", "requests_per_minute", 50)
+        self.rate_limiter = RateLimiter(rpm, config.get("ai", "tokens_per_minute") or None) if rpm else None
+
+        self.cache: Optional[AICache] = get_ai_cache() if use_cache and config.get("ai", "cache", True) else None
+        self.refresh = False
         logger.debug(f"AIAgent initialized with model: {self.model}")
 
+    @property
+    def aclient(self) -> "AsyncAnthropic":
+        """The async Anthropic client, created on first use."""
+        if self._aclient is None:
+            from anthropic import AsyncAnthropic
+            self._aclient = AsyncAnthropic(api_key=self.api_key, max_retries=self.max_retries)
+        return self._aclient
+
+    async def aclose(self) -> None:
+        """Close the async client (safe to call more than once)."""
+        if self._aclient is not None:
+            await self._aclient.close()
+            self._aclient = None
+
+    def context_tokens(self) -> int:
+        """Context window of the configured model, in tokens."""
+        prefixes = [prefix for prefix in self.MODEL_CONTEXT_TOKENS if self.model.startswith(prefix)]
+        if not prefixes:
+            return self.DEFAULT_CONTEXT_TOKENS
+        return self.MODEL_CONTEXT_TOKENS[max(prefixes, key=len)]
+
+    def max_diff_chars(self) -> int:
+        """Largest diff, in characters, that leaves room for the prompt and reply in the context window."""
+        return (self.context_tokens() - self.RESERVED_TOKENS) * self.DIFF_CHARS_PER_TOKEN
+
+    # Transport
+
+    def _estimate_tokens(self, prompt: str, max_tokens: int) -> int:
+        """Upper-bound a request's token cost from the prompt length and the output budget."""
+        return len(prompt) // self.CHARS_PER_TOKEN + max_tokens
+
+    def _cache_key(self, prompt: str, max_tokens: int) -> tuple:
+        return ("completion", self.model, max_tokens, prompt)
+
+    def _complete(self, prompt: str, max_tokens: int, json_reply: bool = False) -> str:
+        """Return the reply to a single-turn prompt, from the cache when possible (unusable ones are not cached)."""
+        try:
+            if self.cache is None:
+                return self._send(prompt, max_tokens, json_reply)
+            return self.cache.get_or_compute(
+                self._cache_key(prompt, max_tokens),
+                lambda: self._send(prompt, max_tokens, json_reply),
+                refresh=self.refresh,
+            )
+        except _UnusableReply as e:
+            return e.reply
+
+    async def _acomplete(self, prompt: str, max_tokens: int, json_reply: bool = False) -> str:
+        """Async version of _complete."""
+        try:
+            if self.cache is None:
+                return await self._asend(prompt, max_tokens, json_reply)
+            return await self.cache.aget_or_compute(
+                self._cache_key(prompt, max_tokens),
+                lambda: self._asend(prompt, max_tokens, json_reply),
+                refresh=self.refresh,
+            )
+        except _UnusableReply as e:
+            return e.reply
+
+    def _request(self, prompt: str, max_tokens: int) -> Dict[str, Any]:
+        """Keyword arguments for a single-turn messages request."""
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    @staticmethod
+    def _usable(reply: str, json_reply: bool) -> bool:
+        """Whether a reply has content (and, when JSON was asked for, a JSON object)."""
+        if json_reply:
+            return _extract_first_json_object(reply) is not None
+        return bool(reply.strip())
+
+    def _give_up(self, reply: str, json_reply: bool) -> NoReturn:
+        """
+        Fail once every attempt was unusable.
+
+        JSON callers get the raw text back from _complete (via _UnusableReply,
+        so it is not cached); for text operations this is an error.
+        """
+        if json_reply:
+            raise _UnusableReply(reply)
+        raise Exception(f"AI returned an empty response after {self.EMPTY_REPLY_RETRIES + 1} attempts")
+
+    def _send(self, prompt: str, max_tokens: int, json_reply: bool = False) -> str:
+        """
+        Send a single-turn prompt and return the reply text.
+
+        Replies that come back empty, or without the JSON object json_reply
+        asks for, are retried; transient API errors are retried by the
+        Anthropic client itself (ai.max_retries).
+        """
+        for attempt in range(1, self.EMPTY_REPLY_RETRIES + 2):
+            reply = self._send_once(prompt, max_tokens, json_reply)
+            if self._usable(reply, json_reply):
+                return reply
+            logger.warning(f"Unusable AI reply (attempt {attempt} of {self.EMPTY_REPLY_RETRIES + 1})")
+        self._give_up(reply, json_reply)
+
+    async def _asend(self, prompt: str, max_tokens: int, json_reply: bool = False) -> str:
+        """Async version of _send."""
+        for attempt in range(1, self.EMPTY_REPLY_RETRIES + 2):
+            reply = await self._asend_once(prompt, max_tokens, json_reply)
+            if self._usable(reply, json_reply):
+                return reply
+            logger.warning(f"Unusable AI reply (attempt {attempt} of {self.EMPTY_REPLY_RETRIES + 1})")
+        self._give_up(reply, json_reply)
+
+    def _send_once(self, prompt: str, max_tokens: int, json_reply: bool = False) -> str:
+        """
+        Stream a single-turn prompt and return the reply text.
+
+        With json_reply the stream is closed as soon as the first top-level
+        JSON object is complete and decodes, rather than waiting out any
+        trailing prose.
+        """
+        if self.rate_limiter:
+            self.rate_limiter.acquire(self._estimate_tokens(prompt, max_tokens))
+        parts = []
+        scanner = _JSONObjectWatcher() if json_reply else None
+        with self.client.messages.stream(**self._request(prompt, max_tokens)) as stream:
+            for text in stream.text_stream:
+                parts.append(text)
+                if scanner and scanner.feed(text):
+                    break
+        return "".join(parts)
+
+    async def _asend_once(self, prompt: str, max_tokens: int, json_reply: bool = False) -> str:
+        """Async version of _send_once."""
+        if self.rate_limiter:
+            await self.rate_limiter.aacquire(self._estimate_tokens(prompt, max_tokens))
+        parts = []
+        scanner = _JSONObjectWatcher() if json_reply else None
+        async with self.aclient.messages.stream(**self._request(prompt, max_tokens)) as stream:
+            async for text in stream.text_stream:
+                parts.append(text)
+                if scanner and scanner.feed(text):
+                    break
+        return "".join(parts)
+
+    def _stream(self, prompt: str, max_tokens: int) -> Iterator[str]:
+        """
+        Yield reply text as it arrives (a cached reply comes as one piece) and cache it once complete.
+
+        A blank reply is retried like in _send (nothing visible has been
+        yielded yet), and is never cached.
+        """
+        key = self._cache_key(prompt, max_tokens)
+        cached = self.cache.get(key) if self.cache is not None and not self.refresh else None
+        if cached:
+            yield cached
+            return
+
+        for attempt in range(1, self.EMPTY_REPLY_RETRIES + 2):
+            if self.rate_limiter:
+                self.rate_limiter.acquire(self._estimate_tokens(prompt, max_tokens))
+            parts = []
+            with self.client.messages.stream(**self._request(prompt, max_tokens)) as stream:
+                for text in stream.text_stream:
+                    parts.append(text)
+                    yield text
+            reply = "".join(parts)
+            if self._usable(reply, False):
+                if self.cache is not None:
+                    self.cache.set(key, reply)
+                return
+            logger.warning(f"Unusable AI reply (attempt {attempt} of {self.EMPTY_REPLY_RETRIES + 1})")
+        self._give_up(reply, False)
+
+    async def _astream(self, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        """Async version of _stream."""
+        key = self._cache_key(prompt, max_tokens)
+        cached = self.cache.get(key) if self.cache is not None and not self.refresh else None
+        if cached:
+            yield cached
+            return
+
+        for attempt in range(1, self.EMPTY_REPLY_RETRIES + 2):
+            if self.rate_limiter:
+                await self.rate_limiter.aacquire(self._estimate_tokens(prompt, max_tokens))
+            parts = []
+            async with self.aclient.messages.stream(**self._request(prompt, max_tokens)) as stream:
+                async for text in stream.text_stream:
+                    parts.append(text)
+                    yield text
+            reply = "".join(parts)
+            if self._usable(reply, False):
+                if self.cache is not None:
+                    self.cache.set(key, reply)
+                return
+            logger.warning(f"Unusable AI reply (attempt {attempt} of {self.EMPTY_REPLY_RETRIES + 1})")
+        self._give_up(reply, False)
+
+    async def abatch(self, calls: Iterable[Awaitable[T]], concurrency: Optional[int] = None) -> List[T]:
+        """
+        Await many agent coroutines with at most `concurrency` in flight.
+
+        Example:
+            reviews = await agent.abatch(agent.areview_code_changes(d) for d in diffs)
+
+        Returns:
+            Results in the order the calls were given
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.BATCH_CONCURRENCY)
+
+        async def run(call: Awaitable[T]) -> T:
+            async with semaphore:
+                return await call
+
+        return await asyncio.gather(*(run(call) for call in calls))
+
     def _truncate_diff(self, diff: str, max_size: int) -> tuple[str, bool]:
         """Truncate diff if too large, return (diff, was_truncated)."""
         if len(diff) <= max_size:
             return diff, False
 
         logger.warning(f"Diff size {len(diff)} exceeds limit {max_size}, truncating")
-        truncated = diff[:max_size]
-        truncated += "\n\n... (diff truncated to prevent excessive API costs)"
-        return truncated, True
+        # Keeps every file and hunk header, shortening hunks rather than dropping files
+        return trim_diff(diff, max_size)
 
-    def generate_commit_message(self, diff: str, context: Optional[str] = None) -> str:
-        """Generate a commit message from git diff."""
-        diff, was_truncated = self._truncate_diff(diff, self.MAX_DIFF_SIZE)
+    # Commit messages
 
-        prompt = f"""Analyze this git diff and generate a concise, professional commit message.
+    def _commit_message_prompt(self, diff: str, context: Optional[str]) -> str:
+        diff, was_truncated = self._truncate_diff(diff, self.MAX_DIFF_SIZE)
+        logger.debug(f"Generating commit message for diff of length {len(diff)}")
 
-Follow conventional commit format: <type>: <description>
+        return prompts.COMMIT_MESSAGE.substitute(
+            context_line=prompts.context_line(context),
+            truncation_note=prompts.truncation_note(was_truncated),
+            diff=diff,
+        )
 
-Types: feat, fix, docs, style, refactor, test, chore
+    def generate_commit_message(self, diff: str, context: Optional[str] = None) -> str:
+        """Generate a commit message from git diff."""
+        return self._complete(self._commit_message_prompt(diff, context), 500).strip()
 
-Rules:
-- First line: short summary (50 chars max)
-- Optional body: detailed explanation if needed
-- Focus on WHAT changed and WHY
-- Be specific and actionable
+    async def agenerate_commit_message(self, diff: str, context: Optional[str] = None) -> str:
+        """Async version of generate_commit_message."""
+        return (await self._acomplete(self._commit_message_prompt(diff, context), 500)).strip()
 
-{f"Context: {context}" if context else ""}
-{"Note: Diff was truncated due to size." if was_truncated else ""}
+    def stream_commit_message(self, diff: str, context: Optional[str] = None) -> Iterator[str]:
+        """Yield the commit message text as it is generated."""
+        return self._stream(self._commit_message_prompt(diff, context), 500)
 
-Diff:
-```
-{diff}
-```
+    def astream_commit_message(self, diff: str, context: Optional[str] = None) -> AsyncIterator[str]:
+        """Async version of stream_commit_message."""
+        return self._astream(self._commit_message_prompt(diff, context), 500)
 
-Generate the commit message:"""
+    # Code review
 
-        logger.debug(f"Generating commit message for diff of length {len(diff)}")
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=500,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        return response.content[0].text.strip()
-
-    def review_code_changes(self, diff: str, context: Optional[str] = None) -> Dict[str, Any]:
-        """Review code changes and provide feedback."""
+    def _review_prompt(self, diff: str, context: Optional[str]) -> str:
         diff, was_truncated = self._truncate_diff(diff, self.MAX_DIFF_SIZE)
-
-        prompt = f"""Review this code diff and provide comprehensive feedback.
-
-Analyze:
-1. Code quality and best practices
-2. Potential bugs or issues
-3. Performance considerations
-4. Security concerns
-5. Suggestions for improvement
-
-{f"Context: {context}" if context else ""}
-{"Note: Diff was truncated due to size." if was_truncated else ""}
-
-Diff:
-```
-{diff}
-```
-
-Provide your review in this JSON format:
-{{
-    "summary": "Brief overview",
-    "issues": ["List of issues found"],
-    "suggestions": ["List of suggestions"],
-    "security_concerns": ["Security issues if any"],
-    "rating": "score from 1-10",
-    "recommendation": "approve/request_changes/comment"
-}}"""
-
         logger.debug(f"Reviewing code changes, diff length: {len(diff)}")
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=2000,
-            messages=[{"role": "user", "content": prompt}]
+
+        return prompts.CODE_REVIEW.substitute(
+            context_line=prompts.context_line(context),
+            truncation_note=prompts.truncation_note(was_truncated),
+            diff=diff,
         )
 
-        # Parse the response
-        import json
-        import re
+    @staticmethod
+    def _parse_review(review_text: str) -> Dict[str, Any]:
         try:
-            review_text = response.content[0].text
-            # Try to extract JSON from code block first
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', review_text, re.DOTALL)
-            if json_match:
-                review_data = json.loads(json_match.group(1))
-                return review_data
-
-            # Fallback: Extract JSON from response
-            start = review_text.find('{')
-            end = review_text.rfind('}') + 1
-            if start >= 0 and end > start:
-                review_data = json.loads(review_text[start:end])
+            review_data = _extract_first_json_object(review_text)
+            if review_data is not None:
                 return review_data
             else:
                 # Fallback if JSON not found
@@ -139,7 +527,7 @@ Provide your review in this JSON format:
         except Exception as e:
             logger.error(f"Error parsing AI response: {e}")
             return {
-                "summary": response.content[0].text,
+                "summary": review_text,
                 "issues": [],
                 "suggestions": [],
                 "security_concerns": [],
@@ -148,120 +536,372 @@ Provide your review in this JSON format:
                 "error": str(e)
             }
 
-    def review_pull_request(
+    def review_code_changes(self, diff: str, context: Optional[str] = None) -> Dict[str, Any]:
+        """Review code changes and provide feedback."""
+        return self._parse_review(self._complete(self._review_prompt(diff, context), 2000, json_reply=True))
+
+    async def areview_code_changes(self, diff: str, context: Optional[str] = None) -> Dict[str, Any]:
+        """Async version of review_code_changes."""
+        return self._parse_review(await self._acomplete(self._review_prompt(diff, context), 2000, json_reply=True))
+
+    # Pull request review
+
+    def _pr_review_prompt(
         self,
         pr_title: str,
         pr_description: str,
         diff: str,
-        files_changed: int
-    ) -> Dict[str, Any]:
-        """Review a complete pull request."""
-        diff, was_truncated = self._truncate_diff(diff, self.MAX_PR_DIFF_SIZE)
-
-        prompt = f"""Review this pull request comprehensively.
-
-PR Title: {pr_title}
-Description: {pr_description}
-Files Changed: {files_changed}
-{"Note: Diff was truncated due to size." if was_truncated else ""}
-
-Diff:
-```
-{diff}
-```
-
-Provide detailed review covering:
-1. Overall assessment
-2. Code quality
-3. Test coverage
-4. Documentation
-5. Breaking changes
-6. Specific issues or concerns
-7. Final recommendation
-
-Format as JSON:
-{{
-    "overall_assessment": "summary",
-    "code_quality": "assessment",
-    "test_coverage": "assessment",
-    "documentation": "assessment",
-    "breaking_changes": ["list if any"],
-    "issues": ["specific issues"],
-    "suggestions": ["improvements"],
-    "recommendation": "approve/request_changes/needs_discussion",
-    "review_comment": "detailed comment for PR"
-}}"""
-
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=3000,
-            messages=[{"role": "user", "content": prompt}]
+        files_changed: int,
+        part_files: Optional[List[str]] = None,
+        truncated: bool = False
+    ) -> str:
+        max_size = self.PR_REVIEW_PART_SIZE if part_files else self.MAX_PR_DIFF_SIZE
+        diff, was_truncated = self._truncate_diff(diff, max_size)
+        was_truncated = was_truncated or truncated
+
+        return prompts.PR_REVIEW.substitute(
+            pr_title=pr_title,
+            pr_description=pr_description,
+            files_changed=files_changed,
+            scope_note=f" (review only this part, covering: {', '.join(part_files)})" if part_files else "",
+            truncation_note=prompts.truncation_note(was_truncated),
+            diff=diff,
         )
 
-        import json
+    @staticmethod
+    def _parse_pr_review(review_text: str) -> Dict[str, Any]:
         try:
-            review_text = response.content[0].text
-            start = review_text.find('{')
-            end = review_text.rfind('}') + 1
-            if start >= 0 and end > start:
-                return json.loads(review_text[start:end])
+            review_data = _extract_first_json_object(review_text)
+            if review_data is not None:
+                return review_data
             else:
                 return {"review_comment": review_text, "recommendation": "comment"}
         except Exception as e:
             return {
-                "review_comment": response.content[0].text,
+                "review_comment": review_text,
                 "recommendation": "comment",
                 "error": str(e)
             }
 
-    def analyze_repository(self, repo_info: Dict[str, any]) -> str:
-        """Analyze repository and provide insights."""
-        prompt = f"""Analyze this GitHub repository and provide insights.
+    def _pr_review_prompts(self, pr_title: str, pr_description: str, diff: str, files_changed: int) -> List[str]:
+        """
+        One prompt for the whole PR, or one per group of files when the diff is large.
+
+        Files are packed greedily, in diff order, into parts of up to
+        PR_REVIEW_PART_SIZE characters; a file larger than that gets a part
+        to itself and is trimmed there.
+        """
+        diff, truncated = self._truncate_diff(diff, self.MAX_PR_DIFF_SIZE)
+        if len(diff) <= self.PR_REVIEW_PART_SIZE:
+            return [self._pr_review_prompt(pr_title, pr_description, diff, files_changed, truncated=truncated)]
+
+        parts: List[List[str]] = []
+        size = 0
+        for chunk in split_files(diff):
+            if not parts or size + len(chunk) > self.PR_REVIEW_PART_SIZE:
+                parts.append([])
+                size = 0
+            parts[-1].append(chunk)
+            size += len(chunk) + 1
+
+        logger.debug(f"Reviewing PR diff of length {len(diff)} in {len(parts)} parts")
+        return [
+            self._pr_review_prompt(
+                pr_title, pr_description, "\n".join(part), files_changed,
+                part_files=[file_path(chunk) for chunk in part if chunk.startswith("diff --git ")],
+                truncated=truncated,
+            )
+            for part in parts
+        ]
+
+    def _merge_pr_reviews(self, reviews: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combine the reviews of a PR's parts: lists are concatenated and the worst recommendation wins."""
+        if len(reviews) == 1:
+            return reviews[0]
+
+        merged: Dict[str, Any] = {
+            "recommendation": min(
+                (review.get("recommendation") or "comment" for review in reviews),
+                key=lambda rec: self._RECOMMENDATION_RANK.get(rec, len(self._RECOMMENDATION_RANK)),
+            ),
+            "overall_assessment": f"Reviewed in {len(reviews)} parts. " + " ".join(
+                review["overall_assessment"] for review in reviews if review.get("overall_assessment")
+            ),
+            "review_comment": "\n\n".join(
+                review["review_comment"] for review in reviews if review.get("review_comment")
+            ),
+        }
+        for key in ("breaking_changes", "issues", "suggestions"):
+            merged[key] = [item for review in reviews for item in (review.get(key) or [])]
+        for key in ("code_quality", "test_coverage", "documentation"):
+            merged[key] = " ".join(review[key] for review in reviews if review.get(key))
+        return merged
 
-Repository Information:
-{repo_info}
+    def review_pull_request(
+        self,
+        pr_title: str,
+        pr_description: str,
+        diff: str,
+        files_changed: int
+    ) -> Dict[str, Any]:
+        """
+        Review a complete pull request.
 
-Provide analysis on:
-1. Repository health
-2. Activity level
-3. Community engagement
-4. Areas for improvement
-5. Recommendations
+        Large diffs are split by file and the parts reviewed in parallel,
+        then merged into one review of the same shape.
+        """
+        part_prompts = self._pr_review_prompts(pr_title, pr_description, diff, files_changed)
+        if len(part_prompts) == 1:
+            return self._parse_pr_review(self._complete(part_prompts[0], 3000, json_reply=True))
 
-Keep it concise and actionable."""
+        with ThreadPoolExecutor(max_workers=min(len(part_prompts), self.BATCH_CONCURRENCY)) as pool:
+            replies = list(pool.map(lambda prompt: self._complete(prompt, 3000, json_reply=True), part_prompts))
+        return self._merge_pr_reviews([self._parse_pr_review(reply) for reply in replies])
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=1500,
-            messages=[{"role": "user", "content": prompt}]
-        )
+    async def areview_pull_request(
+        self,
+        pr_title: str,
+        pr_description: str,
+        diff: str,
+        files_changed: int
+    ) -> Dict[str, Any]:
+        """Async version of review_pull_request."""
+        part_prompts = self._pr_review_prompts(pr_title, pr_description, diff, files_changed)
+        replies = await self.abatch(self._acomplete(prompt, 3000, json_reply=True) for prompt in part_prompts)
+        return self._merge_pr_reviews([self._parse_pr_review(reply) for reply in replies])
+
+    # Repository analysis
 
-        return response.content[0].text.strip()
+    @staticmethod
+    def _repository_prompt(repo_info: Dict[str, Any]) -> str:
+        return prompts.REPOSITORY_ANALYSIS.substitute(repo_info=repo_info)
+
+    def analyze_repository(self, repo_info: Dict[str, Any]) -> str:
+        """Analyze repository and provide insights."""
+        return self._complete(self._repository_prompt(repo_info), 1500).strip()
+
+    async def aanalyze_repository(self, repo_info: Dict[str, Any]) -> str:
+        """Async version of analyze_repository."""
+        return (await self._acomplete(self._repository_prompt(repo_info), 1500)).strip()
+
+    # Issue labels
+
+    @staticmethod
+    def _labels_prompt(issue_title: str, issue_body: str) -> str:
+        return prompts.ISSUE_LABELS.substitute(issue_title=issue_title, issue_body=issue_body)
+
+    @staticmethod
+    def _parse_labels(labels_text: str) -> List[str]:
+        return [label.strip() for label in labels_text.strip().split(',')]
 
     def suggest_issue_labels(self, issue_title: str, issue_body: str) -> List[str]:
         """Suggest appropriate labels for an issue."""
-        prompt = f"""Analyze this GitHub issue and suggest appropriate labels.
+        return self._parse_labels(self._complete(self._labels_prompt(issue_title, issue_body), 100))
+
+    async def asuggest_issue_labels(self, issue_title: str, issue_body: str) -> List[str]:
+        """Async version of suggest_issue_labels."""
+        return self._parse_labels(await self._acomplete(self._labels_prompt(issue_title, issue_body), 100))
+
+    # Multi-issue batches
+
+    def _issue_batches(self, template, issues: List[Tuple[str, str]]) -> List[Tuple[str, List[Tuple[str, str]]]]:
+        """Split issues into groups of ISSUE_BATCH_SIZE, each with its one multi-issue prompt."""
+        groups = [issues[i:i + self.ISSUE_BATCH_SIZE] for i in range(0, len(issues), self.ISSUE_BATCH_SIZE)]
+        return [(template.substitute(issues=prompts.issue_list(group)), group) for group in groups]
+
+    @staticmethod
+    def _batch_items(text: str, count: int) -> List[Optional[Dict[str, Any]]]:
+        """Match a multi-issue reply's objects to issues 1..count by id (None where one is missing)."""
+        by_id: Dict[int, Dict[str, Any]] = {}
+        for item in _extract_first_json_array(text) or []:
+            try:
+                by_id[int(item.pop("id"))] = item
+            except (KeyError, TypeError, ValueError):
+                continue
+        return [by_id.get(number) for number in range(1, count + 1)]
+
+    @staticmethod
+    def _batch_labels(item: Optional[Dict[str, Any]]) -> Optional[List[str]]:
+        labels = item.get("labels") if item else None
+        return [str(label).strip() for label in labels] if isinstance(labels, list) else None
+
+    def suggest_labels_batch(self, issues: List[Tuple[str, str]]) -> List[List[str]]:
+        """
+        Suggest labels for many (title, body) issues, ISSUE_BATCH_SIZE per request.
+
+        Returns one label list per issue, in order; an issue the batched reply
+        skipped is asked about on its own.
+        """
+        results = []
+        for prompt, group in self._issue_batches(prompts.ISSUE_LABELS_BATCH, issues):
+            items = self._batch_items(self._complete(prompt, 60 * len(group)), len(group))
+            for (title, body), item in zip(group, items):
+                labels = self._batch_labels(item)
+                results.append(labels if labels is not None else self.suggest_issue_labels(title, body))
+        return results
+
+    async def asuggest_labels_batch(self, issues: List[Tuple[str, str]]) -> List[List[str]]:
+        """Async version of suggest_labels_batch; the batch requests run concurrently."""
+        batches = self._issue_batches(prompts.ISSUE_LABELS_BATCH, issues)
+        replies = await self.abatch(self._acomplete(prompt, 60 * len(group)) for prompt, group in batches)
+
+        results: List[Optional[List[str]]] = []
+        for (_, group), reply in zip(batches, replies):
+            results.extend(self._batch_labels(item) for item in self._batch_items(reply, len(group)))
+
+        missing = [i for i, labels in enumerate(results) if labels is None]
+        retried = await self.abatch(self.asuggest_issue_labels(*issues[i]) for i in missing)
+        for i, labels in zip(missing, retried):
+            results[i] = labels
+        return results
+
+    def triage_issues_batch(self, issues: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Triage many (title, body) issues, ISSUE_BATCH_SIZE per request.
+
+        Returns one triage dict per issue, in order; an issue the batched
+        reply skipped is triaged on its own.
+        """
+        results = []
+        for prompt, group in self._issue_batches(prompts.ISSUE_TRIAGE_BATCH, issues):
+            items = self._batch_items(self._complete(prompt, 300 * len(group)), len(group))
+            for (title, body), item in zip(group, items):
+                results.append(item if item is not None else self.triage_issue(title, body))
+        return results
+
+    async def atriage_issues_batch(self, issues: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Async version of triage_issues_batch; the batch requests run concurrently."""
+        batches = self._issue_batches(prompts.ISSUE_TRIAGE_BATCH, issues)
+        replies = await self.abatch(self._acomplete(prompt, 300 * len(group)) for prompt, group in batches)
+
+        results: List[Optional[Dict[str, Any]]] = []
+        for (_, group), reply in zip(batches, replies):
+            results.extend(self._batch_items(reply, len(group)))
+
+        missing = [i for i, triage in enumerate(results) if triage is None]
+        retried = await self.abatch(self.atriage_issue(*issues[i]) for i in missing)
+        for i, triage in zip(missing, retried):
+            results[i] = triage
+        return results
+
+    # Message Batches
+
+    def _read_ledger(self) -> Dict[str, Any]:
+        try:
+            with open(self.BATCH_LEDGER_PATH, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable batch ledger {self.BATCH_LEDGER_PATH}: {e}")
+            return {}
+
+    def _write_ledger(self, ledger: Dict[str, Any]) -> None:
+        path = self.BATCH_LEDGER_PATH
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(ledger, indent=2), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not save batch ledger {path}: {e}")
+
+    def batch_request(self, custom_id: str, prompt: str, max_tokens: int) -> Dict[str, Any]:
+        """Package one prompt as a Message Batches request."""
+        return {"custom_id": custom_id, "params": self._request(prompt, max_tokens)}
+
+    def commit_message_request(self, custom_id: str, diff: str, context: Optional[str] = None) -> Dict[str, Any]:
+        """Batch request for generate_commit_message."""
+        return self.batch_request(custom_id, self._commit_message_prompt(diff, context), 500)
+
+    def review_request(self, custom_id: str, diff: str, context: Optional[str] = None) -> Dict[str, Any]:
+        """Batch request for review_code_changes (parse the reply with parse_review)."""
+        return self.batch_request(custom_id, self._review_prompt(diff, context), 2000)
+
+    def parse_review(self, review_text: str) -> Dict[str, Any]:
+        """Decode a code review reply, e.g. one collected from a batch."""
+        return self._parse_review(review_text)
+
+    def submit_batch(self, requests: List[Dict[str, Any]]) -> str:
+        """
+        Submit requests (from batch_request and friends) to the Message Batches API.
+
+        Batches run asynchronously at half the price of online calls and can
+        take up to 24 hours. The batch id is recorded in BATCH_LEDGER_PATH
+        until its results are collected.
+
+        Returns:
+            The batch id
+        """
+        batch = self.client.messages.batches.create(requests=requests)
+        ledger = self._read_ledger()
+        ledger[batch.id] = {
+            "submitted": datetime.now(timezone.utc).isoformat(),
+            # AI cache rows for each reply, so results are cached wherever they are collected
+            "cache_keys": {
+                request["custom_id"]: AICache.make_key(self._cache_key(
+                    request["params"]["messages"][0]["content"], request["params"]["max_tokens"]
+                ))
+                for request in requests
+            },
+        }
+        self._write_ledger(ledger)
+        logger.debug(f"Submitted batch {batch.id} with {len(requests)} requests")
+        return batch.id
+
+    def pending_batches(self) -> List[str]:
+        """Ids of submitted batches whose results have not been collected yet."""
+        return list(self._read_ledger())
+
+    def poll_batch(self, batch_id: str) -> str:
+        """Processing status of a batch ("in_progress", "canceling" or "ended")."""
+        return self.client.messages.batches.retrieve(batch_id).processing_status
+
+    def batch_results(self, batch_id: str) -> Dict[str, Optional[str]]:
+        """
+        Collect an ended batch's replies.
+
+        Successful replies are stored in the AI cache, so the same online
+        call later is answered locally, and the batch leaves the ledger.
+
+        Returns:
+            Reply text by custom_id (None for requests that errored or expired)
+        """
+        ledger = self._read_ledger()
+        cache_keys = ledger.get(batch_id, {}).get("cache_keys", {})
+
+        results: Dict[str, Optional[str]] = {}
+        for entry in self.client.messages.batches.results(batch_id):
+            text = None
+            if entry.result.type == "succeeded":
+                text = entry.result.message.content[0].text
+                if self.cache is not None and entry.custom_id in cache_keys and text.strip():
+                    self.cache.set_row(cache_keys[entry.custom_id], text)
+            else:
+                logger.warning(f"Batch request {entry.custom_id} {entry.result.type}")
+            results[entry.custom_id] = text
 
-Title: {issue_title}
-Body: {issue_body}
+        ledger.pop(batch_id, None)
+        self._write_ledger(ledger)
+        return results
 
-Common label categories:
-- Type: bug, feature, enhancement, documentation, question
-- Priority: critical, high, medium, low
-- Status: needs-triage, in-progress, blocked
-- Area: backend, frontend, api, database, ui/ux
+    def wait_for_batch(self, batch_id: str, poll_interval: float = 30.0) -> Dict[str, Optional[str]]:
+        """Block until a batch has ended, then return batch_results()."""
+        while self.poll_batch(batch_id) != "ended":
+            time.sleep(poll_interval)
+        return self.batch_results(batch_id)
 
-Respond with ONLY a comma-separated list of suggested labels (max 5).
-Example: bug, high-priority, backend"""
+    # Pull request descriptions
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=100,
-            messages=[{"role": "user", "content": prompt}]
-        )
+    def _pr_description_prompt(self, diff: str, branch_name: str, commits: List[str]) -> str:
+        diff, was_truncated = self._truncate_diff(diff, self.MAX_PR_DIFF_SIZE)
 
-        labels_text = response.content[0].text.strip()
-        return [label.strip() for label in labels_text.split(',')]
+        return prompts.PR_DESCRIPTION.substitute(
+            branch_name=branch_name,
+            commit_lines="\n".join(f"- {commit}" for commit in commits),
+            truncation_note=prompts.truncation_note(was_truncated),
+            diff=diff,
+        )
 
     def generate_pr_description(
         self,
@@ -270,138 +910,87 @@ Example: bug, high-priority, backend"""
         commits: List[str]
     ) -> str:
         """Generate a comprehensive PR description."""
-        diff, was_truncated = self._truncate_diff(diff, self.MAX_PR_DIFF_SIZE)
-
-        prompt = f"""Generate a comprehensive pull request description.
-
-Branch: {branch_name}
-Commits:
-{chr(10).join(f'- {commit}' for commit in commits)}
-{"Note: Diff was truncated due to size." if was_truncated else ""}
+        return self._complete(self._pr_description_prompt(diff, branch_name, commits), 1500).strip()
 
-Changes:
-```
-{diff}
-```
-
-Format the description as:
-## Summary
-[Brief overview]
-
-## Changes
-- [Key change 1]
-- [Key change 2]
+    async def agenerate_pr_description(
+        self,
+        diff: str,
+        branch_name: str,
+        commits: List[str]
+    ) -> str:
+        """Async version of generate_pr_description."""
+        return (await self._acomplete(self._pr_description_prompt(diff, branch_name, commits), 1500)).strip()
 
-## Testing
-[How this was tested]
+    # Diff explanations
 
-## Checklist
-- [ ] Code follows project guidelines
-- [ ] Tests added/updated
-- [ ] Documentation updated
-"""
+    def _explain_prompt(self, diff: str) -> str:
+        diff, was_truncated = self._truncate_diff(diff, self.MAX_DIFF_SIZE)
+        logger.debug(f"Explaining diff of length {len(diff)}")
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=1500,
-            messages=[{"role": "user", "content": prompt}]
+        return prompts.EXPLAIN_DIFF.substitute(
+            truncation_note=prompts.truncation_note(was_truncated),
+            diff=diff,
         )
 
-        return response.content[0].text.strip()
-
     def explain_diff(self, diff: str) -> str:
         """Explain what a diff does in plain English."""
-        diff, was_truncated = self._truncate_diff(diff, self.MAX_DIFF_SIZE)
-
-        prompt = f"""Explain this git diff in plain English. What does it do?
-{"Note: Diff was truncated due to size." if was_truncated else ""}
+        return self._complete(self._explain_prompt(diff), 800).strip()
 
-Diff:
-```
-{diff}
-```
+    async def aexplain_diff(self, diff: str) -> str:
+        """Async version of explain_diff."""
+        return (await self._acomplete(self._explain_prompt(diff), 800)).strip()
 
-Provide a clear, concise explanation suitable for a non-technical audience."""
-
-        logger.debug(f"Explaining diff of length {len(diff)}")
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=800,
-            messages=[{"role": "user", "content": prompt}]
-        )
+    # Branch names
 
-        return response.content[0].text.strip()
+    @staticmethod
+    def _branch_name_prompt(description: str) -> str:
+        return prompts.BRANCH_NAME.substitute(description=description)
 
     def suggest_branch_name(self, description: str) -> str:
         """Suggest a branch name based on description."""
-        prompt = f"""Suggest a git branch name for this work:
+        return self._complete(self._branch_name_prompt(description), 50).strip()
 
-{description}
+    async def asuggest_branch_name(self, description: str) -> str:
+        """Async version of suggest_branch_name."""
+        return (await self._acomplete(self._branch_name_prompt(description), 50)).strip()
 
-Follow conventions:
-- Use hyphens to separate words
-- Start with type: feature/, bugfix/, hotfix/, chore/
-- Keep it short but descriptive
-- Use lowercase
+    # Issue triage
 
-Respond with ONLY the branch name, nothing else.
-Example: feature/add-user-authentication"""
+    @staticmethod
+    def _triage_prompt(issue_title: str, issue_body: str) -> str:
+        return prompts.ISSUE_TRIAGE.substitute(issue_title=issue_title, issue_body=issue_body)
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=50,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        return response.content[0].text.strip()
-
-    def triage_issue(self, issue_title: str, issue_body: str) -> Dict[str, Any]:
-        """Triage an issue and suggest priority/assignment."""
-        prompt = f"""Triage this GitHub issue and provide recommendations.
-
-Title: {issue_title}
-Body: {issue_body}
-
-Analyze and provide:
-{{
-    "priority": "critical/high/medium/low",
-    "category": "bug/feature/documentation/question",
-    "complexity": "simple/moderate/complex",
-    "suggested_labels": ["label1", "label2"],
-    "requires_immediate_attention": true/false,
-    "summary": "brief analysis"
-}}"""
-
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=500,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        import json
+    @staticmethod
+    def _parse_triage(text: str) -> Dict[str, Any]:
         try:
-            text = response.content[0].text
-            start = text.find('{')
-            end = text.rfind('}') + 1
-            if start >= 0 and end > start:
-                return json.loads(text[start:end])
+            triage = _extract_first_json_object(text)
+            if triage is not None:
+                return triage
             else:
                 return {"summary": text}
         except Exception as e:
-            return {"summary": response.content[0].text, "error": str(e)}
+            return {"summary": text, "error": str(e)}
 
-    def ask_question(self, question: str, context: Optional[str] = None) -> str:
-        """Ask the AI agent a general question about Git/GitHub."""
-        prompt = f"""{question}
+    def triage_issue(self, issue_title: str, issue_body: str) -> Dict[str, Any]:
+        """Triage an issue and suggest priority/assignment."""
+        prompt = self._triage_prompt(issue_title, issue_body)
+        return self._parse_triage(self._complete(prompt, 500, json_reply=True))
 
-{f"Context: {context}" if context else ""}
+    async def atriage_issue(self, issue_title: str, issue_body: str) -> Dict[str, Any]:
+        """Async version of triage_issue."""
+        prompt = self._triage_prompt(issue_title, issue_body)
+        return self._parse_triage(await self._acomplete(prompt, 500, json_reply=True))
 
-Provide a clear, helpful answer."""
+    # Questions
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=1500,
-            messages=[{"role": "user", "content": prompt}]
-        )
+    @staticmethod
+    def _question_prompt(question: str, context: Optional[str]) -> str:
+        return prompts.QUESTION.substitute(question=question, context_line=prompts.context_line(context))
+
+    def ask_question(self, question: str, context: Optional[str] = None) -> str:
+        """Ask the AI agent a general question about Git/GitHub."""
+        return self._complete(self._question_prompt(question, context), 1500).strip()
 
-        return response.content[0].text.strip()
+    async def aask_question(self, question: str, context: Optional[str] = None) -> str:
+        """Async version of ask_question."""
+        return (await self._acomplete(self._question_prompt(question, context), 1500)).strip()
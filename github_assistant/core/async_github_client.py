@@ -0,0 +1,523 @@
+"""Async GitHub API client for commands that issue several independent requests."""
+
+from typing import List, Optional, Dict, Any, Tuple, Union
+from datetime import datetime, timezone
+from urllib.parse import urlencode
+import asyncio
+import math
+import logging
+
+import aiohttp
+
+from github_assistant.core.response_cache import ResponseCache
+from github_assistant.core.throttle import choose_token, github_tokens
+
+logger = logging.getLogger(__name__)
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+API_URL = "https://api.github.com"
+
+
+class AsyncGitHubClient:
+    """GitHub REST client built on a shared aiohttp session, returning plain JSON dicts."""
+
+    # Upper bound on page requests in flight for a single listing
+    MAX_CONCURRENT_PAGES = 8
+
+    # Upper bound on requests in flight across the whole client, so gathered
+    # calls do not trip GitHub's secondary (concurrency) rate limit
+    MAX_CONCURRENT_REQUESTS = 10
+
+    # Most files GitHub lists for one pull request
+    MAX_PR_FILES = 3000
+
+    # Writes in flight for one bulk call; GitHub throttles bursts of content creation
+    BULK_CONCURRENCY = 5
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        tokens: Optional[Union[List[str], str]] = None
+    ):
+        """
+        Initialize async GitHub client.
+
+        Args:
+            token: Single token (defaults to GITHUB_TOKEN)
+            cache: Response cache (defaults to the on-disk one)
+            tokens: Tokens to rotate between, as a list or comma-separated
+                string (defaults to github.tokens / GH_ASSIST_TOKENS). All
+                of them should belong to the same account.
+        """
+        self.tokens = github_tokens(tokens, token)
+        self.token = self.tokens[0]
+
+        # Per-token [remaining, reset epoch] from the latest X-RateLimit-* headers;
+        # remaining is None until the token has been used
+        self._buckets: Dict[str, List[Optional[float]]] = {t: [None, 0.0] for t in self.tokens}
+
+        # Created lazily inside the running event loop and reused for every request
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+        self._login: Optional[str] = None
+        # Validators and bodies of earlier GETs, shared across invocations
+        self.cache = cache or ResponseCache()
+
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+        self.cache.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, opening it (and the in-flight limit) on first use."""
+        if self._session is None or self._session.closed:
+            self._in_flight = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+            self._session = aiohttp.ClientSession(
+                base_url=API_URL,
+                # Enough pooled keep-alive connections for every request allowed in
+                # flight, so none waits on a fresh TLS handshake; api.github.com is
+                # resolved once per session
+                connector=aiohttp.TCPConnector(
+                    limit=self.MAX_CONCURRENT_REQUESTS,
+                    limit_per_host=self.MAX_CONCURRENT_REQUESTS,
+                    ttl_dns_cache=300,
+                ),
+                headers={
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                },
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session (safe to call more than once)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._in_flight = None
+
+    async def _acquire_token(self) -> str:
+        """Pick the token to use next (see choose_token), sleeping if all are exhausted."""
+        index, wait = choose_token([self._buckets[t] for t in self.tokens])
+        token = self.tokens[index]
+        if wait:
+            await asyncio.sleep(wait)
+            self._buckets[token][0] = None
+        return token
+
+    def _update_bucket(self, token: str, headers) -> None:
+        """Record the rate-limit headers GitHub sent back for `token`."""
+        left = headers.get("X-RateLimit-Remaining")
+        reset_at = headers.get("X-RateLimit-Reset")
+        if left is not None and reset_at is not None:
+            self._buckets[token] = [int(left), float(reset_at)]
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        error: str = "GitHub API request failed",
+        use_cache: bool = True,
+        **kwargs
+    ) -> Any:
+        """
+        Issue a request and decode the JSON response.
+
+        GETs are revalidated against the response cache (If-None-Match /
+        If-Modified-Since), and the cached body is returned on 304. Each
+        request goes out on the token with the most rate limit left, and is
+        retried on another one if GitHub rejects it as rate-limited. At most
+        MAX_CONCURRENT_REQUESTS are in flight at once; the rest wait here.
+
+        Args:
+            method: HTTP method
+            path: API path, e.g. "/repos/owner/name/pulls"
+            error: Message prefix used when the request fails
+            use_cache: Send stored validators for GETs (the response is stored either way)
+            **kwargs: Extra arguments for aiohttp (params, json, headers)
+
+        Returns:
+            Decoded JSON body
+
+        Raises:
+            Exception: If GitHub returns an error status
+        """
+        url = cached = None
+        headers = dict(kwargs.pop('headers', None) or {})
+        if method == "GET":
+            url = f"{path}?{urlencode(sorted((kwargs.get('params') or {}).items()))}"
+            if headers.get("Accept"):
+                url += f" {headers['Accept']}"
+            cached = self.cache.get(url) if use_cache else None
+            if cached:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+
+        for _ in range(len(self.tokens) + 1):
+            token = await self._acquire_token()
+            headers["Authorization"] = f"Bearer {token}"
+            session = self._get_session()
+            async with self._in_flight, session.request(method, path, headers=headers, **kwargs) as resp:
+                self._update_bucket(token, resp.headers)
+                if resp.status in (403, 429) and resp.headers.get("X-RateLimit-Remaining") == "0":
+                    logger.warning(f"Rate limit hit on token #{self.tokens.index(token) + 1}, retrying...")
+                    continue
+                return await self._read_response(resp, url, cached, error)
+
+        raise Exception(f"{error}: rate limit exceeded on all tokens")
+
+    async def _read_response(
+        self,
+        resp: aiohttp.ClientResponse,
+        url: Optional[str],
+        cached: Optional[tuple],
+        error: str
+    ) -> Any:
+        """Decode a response, storing GET validators and answering 304s from the cache."""
+        if resp.status == 304 and cached:
+            logger.debug(f"Not modified, using cached response for {url}")
+            return cached[2]
+        if resp.status >= 400:
+            try:
+                message = (await resp.json()).get('message', resp.reason)
+            except (aiohttp.ContentTypeError, ValueError):
+                message = resp.reason
+            raise Exception(f"{error}: {message}")
+        if resp.status == 204:
+            return None
+        # Other media types (e.g. the diff one) come back as text
+        data = json_loads(await resp.read()) if resp.content_type.endswith("json") else await resp.text()
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if url and (etag or last_modified):
+            self.cache.set(url, etag, last_modified, data)
+        return data
+
+    def _get_immutable(self, key: str) -> Any:
+        """Stored value of a resource that never changes once written, or None."""
+        cached = self.cache.get(f"immutable {key}")
+        return cached[2] if cached else None
+
+    def _set_immutable(self, key: str, value: Any) -> None:
+        """Store a resource that never changes (e.g. a merged PR's diff), to be served without a request."""
+        self.cache.set(f"immutable {key}", None, None, value)
+
+    async def _bulk(self, calls: List[Any]) -> List[Any]:
+        """
+        Await independent coroutines, at most BULK_CONCURRENCY at a time.
+
+        Returns one entry per call, in order: its result, or the exception
+        it raised, so a single failure does not abandon the rest.
+        """
+        semaphore = asyncio.Semaphore(self.BULK_CONCURRENCY)
+
+        async def run(call):
+            async with semaphore:
+                return await call
+
+        return await asyncio.gather(*(run(call) for call in calls), return_exceptions=True)
+
+    async def _paginate(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect items from a paginated list endpoint, stopping once `limit` items are gathered.
+
+        With a limit the number of pages is known up front, so they are
+        requested concurrently (at most MAX_CONCURRENT_PAGES at a time);
+        without one, pages are walked in order until a short page.
+        """
+        params = dict(params or {})
+        params.setdefault('per_page', min(limit or 100, 100))
+
+        if limit:
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PAGES)
+
+            async def fetch(page: int) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    return await self._request(
+                        "GET", path, use_cache=use_cache, params={**params, 'page': page}
+                    )
+
+            pages = await asyncio.gather(
+                *(fetch(page) for page in range(1, math.ceil(limit / params['per_page']) + 1))
+            )
+            return [item for batch in pages for item in batch][:limit]
+
+        items: List[Dict[str, Any]] = []
+        page = 1
+        while True:
+            batch = await self._request("GET", path, use_cache=use_cache, params={**params, 'page': page})
+            items.extend(batch)
+            if len(batch) < params['per_page']:
+                break
+            page += 1
+
+        return items
+
+    async def prewarm(self, repo_name: str) -> None:
+        """
+        Open a pooled API connection ahead of a request the user is about to confirm.
+
+        Sends a conditional GET for the repository, which usually comes back
+        304 and is not charged against the rate limit. Failures are only
+        logged; the real request reports them.
+        """
+        try:
+            await self._request("GET", f"/repos/{repo_name}")
+        except Exception as e:
+            logger.debug(f"Connection prewarm failed: {e}")
+
+    # User Operations
+
+    async def get_user_login(self) -> str:
+        """Get the authenticated user's login (fetched once per client)."""
+        if self._login is None:
+            user = await self._request("GET", "/user", error="Failed to fetch user")
+            self._login = user['login']
+        return self._login
+
+    async def get_rate_limit_status(self, use_cache: bool = True) -> List[Tuple[str, int, int, str]]:
+        """
+        Get current rate limit status.
+
+        Returns:
+            (resource, limit, remaining, reset ISO time) for the core and
+            search resources, least remaining first
+        """
+        data = await self._request(
+            "GET", "/rate_limit", error="Failed to fetch rate limit", use_cache=use_cache
+        )
+        resources = data['resources']
+        return sorted(
+            (
+                (
+                    name,
+                    resources[name]['limit'],
+                    resources[name]['remaining'],
+                    datetime.fromtimestamp(resources[name]['reset'], tz=timezone.utc).isoformat(),
+                )
+                for name in ("core", "search")
+            ),
+            key=lambda row: row[2],
+        )
+
+    # Repository Operations
+
+    async def create_repository(
+        self,
+        name: str,
+        description: str = "",
+        private: bool = False,
+        auto_init: bool = True
+    ) -> Dict[str, Any]:
+        """Create a new repository for the authenticated user."""
+        return await self._request(
+            "POST", "/user/repos",
+            error="Failed to create repository",
+            json={
+                "name": name,
+                "description": description,
+                "private": private,
+                "auto_init": auto_init,
+            },
+        )
+
+    async def list_repositories(
+        self,
+        type: str = "all",
+        sort: str = "updated",
+        direction: str = "desc",
+        limit: Optional[int] = None,
+        use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        """List user's repositories (a missing description comes back as "")."""
+        repos = await self._paginate(
+            "/user/repos",
+            {"type": type, "sort": sort, "direction": direction},
+            limit=limit,
+            use_cache=use_cache,
+        )
+        for repo in repos:
+            if repo['description'] is None:
+                repo['description'] = ""
+        return repos
+
+    # Pull Request Operations
+
+    async def create_pull_request(
+        self,
+        repo_name: str,
+        title: str,
+        head: str,
+        base: str = "main",
+        body: str = "",
+        draft: bool = False
+    ) -> Dict[str, Any]:
+        """Create a pull request."""
+        return await self._request(
+            "POST", f"/repos/{repo_name}/pulls",
+            error="Failed to create PR",
+            json={"title": title, "head": head, "base": base, "body": body, "draft": draft},
+        )
+
+    async def create_pull_requests(
+        self,
+        repo_name: str,
+        specs: List[Dict[str, Any]]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Create several pull requests concurrently.
+
+        Args:
+            repo_name: Repository (owner/name)
+            specs: create_pull_request keyword arguments, one dict per PR
+
+        Returns:
+            The created PR, or the exception that stopped it, per spec
+        """
+        return await self._bulk([self.create_pull_request(repo_name, **spec) for spec in specs])
+
+    async def list_pull_requests(
+        self,
+        repo_name: str,
+        state: str = "open",
+        sort: str = "created",
+        direction: str = "desc",
+        limit: Optional[int] = None,
+        use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        """List pull requests for a repository."""
+        return await self._paginate(
+            f"/repos/{repo_name}/pulls",
+            {"state": state, "sort": sort, "direction": direction},
+            limit=limit,
+            use_cache=use_cache,
+        )
+
+    async def get_pull_request(self, repo_name: str, number: int, use_cache: bool = True) -> Dict[str, Any]:
+        """Get a specific pull request (noting merged ones, whose diff can no longer change)."""
+        pr = await self._request(
+            "GET", f"/repos/{repo_name}/pulls/{number}",
+            error=f"Failed to fetch PR #{number}",
+            use_cache=use_cache,
+        )
+        if pr.get('merged'):
+            self._set_immutable(f"merged {repo_name}#{number}", True)
+        return pr
+
+    async def get_pr_diff(
+        self,
+        repo_name: str,
+        number: int,
+        use_cache: bool = True,
+        per_file: bool = False
+    ) -> str:
+        """
+        Get the diff for a pull request.
+
+        The unified diff comes back in one request via the diff media type.
+        With per_file (or when GitHub refuses the diff as too large) it is
+        assembled from the paginated file list instead, with each file's
+        status and line counts.
+
+        Once the PR is known to be merged (see get_pull_request), its diff
+        is stored for good and later calls make no request at all.
+        """
+        if not per_file:
+            merged = self._get_immutable(f"merged {repo_name}#{number}")
+            key = f"pr-diff {repo_name}#{number}"
+            if merged and use_cache:
+                diff = self._get_immutable(key)
+                if diff is not None:
+                    return diff
+            try:
+                diff = await self._request(
+                    "GET", f"/repos/{repo_name}/pulls/{number}",
+                    error=f"Failed to fetch diff for PR #{number}",
+                    use_cache=use_cache,
+                    headers={"Accept": "application/vnd.github.diff"},
+                )
+                if merged or self._get_immutable(f"merged {repo_name}#{number}"):
+                    self._set_immutable(key, diff)
+                return diff
+            except Exception as e:
+                logger.debug(f"Unified diff unavailable, listing files instead: {e}")
+
+        # With the file count known, every page of the listing is requested at once
+        pr = await self.get_pull_request(repo_name, number, use_cache=use_cache)
+        files = await self._paginate(
+            f"/repos/{repo_name}/pulls/{number}/files",
+            limit=min(pr['changed_files'], self.MAX_PR_FILES) or None,
+            use_cache=use_cache,
+        )
+
+        return "\n".join(
+            f"\n--- {file['filename']} ---\n"
+            f"Status: {file['status']}\n"
+            f"Changes: +{file['additions']} -{file['deletions']}"
+            + (f"\n{file['patch']}" if file.get('patch') else "")
+            for file in files
+        )
+
+    async def comment_on_pr(self, repo_name: str, number: int, comment: str) -> None:
+        """Add a comment to a pull request."""
+        await self._request(
+            "POST", f"/repos/{repo_name}/issues/{number}/comments",
+            error="Failed to comment on PR",
+            json={"body": comment},
+        )
+
+    async def comment_on_prs(self, repo_name: str, comments: Dict[int, str]) -> List[Optional[Exception]]:
+        """Add comments to several pull requests concurrently (number -> comment); None or the error per PR."""
+        return await self._bulk([
+            self.comment_on_pr(repo_name, number, comment) for number, comment in comments.items()
+        ])
+
+    # Issue Operations
+
+    async def create_issue(
+        self,
+        repo_name: str,
+        title: str,
+        body: str = "",
+        labels: Optional[List[str]] = None,
+        assignees: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Create an issue."""
+        return await self._request(
+            "POST", f"/repos/{repo_name}/issues",
+            error="Failed to create issue",
+            json={"title": title, "body": body, "labels": labels or [], "assignees": assignees or []},
+        )
+
+    async def create_issues(
+        self,
+        repo_name: str,
+        specs: List[Dict[str, Any]]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Create several issues concurrently.
+
+        Args:
+            repo_name: Repository (owner/name)
+            specs: create_issue keyword arguments, one dict per issue
+
+        Returns:
+            The created issue, or the exception that stopped it, per spec
+        """
+        return await self._bulk([self.create_issue(repo_name, **spec) for spec in specs])
@@ -0,0 +1,102 @@
+"""Shrink a unified diff to a size budget without breaking its structure."""
+
+from typing import List, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Files whose patch text says little about the change (lockfiles, minified and binary assets)
+LOW_VALUE_NAMES = frozenset({
+    "package-lock.json", "npm-shrinkwrap.json", "yarn.lock", "pnpm-lock.yaml", "poetry.lock",
+    "Pipfile.lock", "uv.lock", "Cargo.lock", "Gemfile.lock", "composer.lock", "go.sum",
+})
+LOW_VALUE_SUFFIXES = (
+    ".lock", ".min.js", ".min.css", ".map",
+    ".png", ".jpg", ".jpeg", ".gif", ".ico", ".pdf", ".woff", ".woff2",
+)
+
+_FILE_START = "diff --git "
+
+
+def split_files(diff: str) -> List[str]:
+    """Split a diff into per-file chunks, each starting at its `diff --git` line."""
+    chunks = diff.split("\n" + _FILE_START)
+    return chunks[:1] + [_FILE_START + chunk for chunk in chunks[1:]]
+
+
+def file_path(chunk: str) -> str:
+    """Path of the file a per-file chunk (from split_files) changes."""
+    return chunk.partition("\n")[0].rpartition(" b/")[2]
+
+
+def _is_low_value(header_line: str) -> bool:
+    name = file_path(header_line).rpartition("/")[2]
+    return name in LOW_VALUE_NAMES or name.endswith(LOW_VALUE_SUFFIXES)
+
+
+def _parse_file(chunk: str) -> Tuple[List[str], List[List[str]]]:
+    """Return (header lines, hunks), each hunk being its `@@` line followed by its body lines."""
+    header: List[str] = []
+    hunks: List[List[str]] = []
+    for line in chunk.split("\n"):
+        if line.startswith("@@"):
+            hunks.append([line])
+        elif hunks:
+            hunks[-1].append(line)
+        else:
+            header.append(line)
+    return header, hunks
+
+
+def _render(files: List[Tuple[List[str], List[List[str]]]], cap: int) -> str:
+    """Join the files back up, keeping at most `cap` body lines of each hunk."""
+    lines: List[str] = []
+    for header, hunks in files:
+        lines.extend(header)
+        for hunk in hunks:
+            lines.append(hunk[0])
+            body = hunk[1:]
+            lines.extend(body[:cap])
+            if len(body) > cap:
+                lines.append(f"... [truncated {len(body) - cap} lines in this hunk]")
+    return "\n".join(lines)
+
+
+def trim_diff(diff: str, max_size: int) -> Tuple[str, bool]:
+    """
+    Fit a diff into max_size characters, returning (diff, was_trimmed).
+
+    Lockfiles and other low-value files lose their hunks first. If that is
+    not enough, every hunk is cut to the same number of leading lines, as
+    many as fit, with a marker for what was dropped, so every file header
+    and hunk header survives. Only if the headers alone are too big is the
+    text cut at the last whole file.
+    """
+    if len(diff) <= max_size:
+        return diff, False
+
+    files = []
+    for chunk in split_files(diff):
+        header, hunks = _parse_file(chunk)
+        if hunks and header and _is_low_value(header[0]):
+            omitted = sum(len(hunk) - 1 for hunk in hunks)
+            header.append(f"... [{omitted} lines omitted: generated or binary file]")
+            hunks = []
+        files.append((header, hunks))
+
+    # Largest per-hunk line cap whose rendering fits (size grows with the cap)
+    low, high = 0, max((len(hunk) - 1 for _, hunks in files for hunk in hunks), default=0)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if len(_render(files, mid)) <= max_size:
+            low = mid
+        else:
+            high = mid - 1
+
+    trimmed = _render(files, low)
+    if len(trimmed) > max_size:
+        logger.debug("Diff headers alone exceed the limit, cutting at a file boundary")
+        cut = trimmed.rfind("\n" + _FILE_START, 0, max_size)
+        trimmed = trimmed[:cut] if cut > 0 else trimmed[:max_size]
+        trimmed += "\n\n... (diff truncated to prevent excessive API costs)"
+    return trimmed, True
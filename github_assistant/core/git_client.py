@@ -1,25 +1,154 @@
 """Git client for local repository operations."""
 
-from typing import List, Optional, Dict
+from typing import IO, TYPE_CHECKING, Any, Iterator, List, Optional, Dict
 from pathlib import Path
-import git
-from git import Repo, GitCommandError, InvalidGitRepositoryError
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+import functools
+import shutil
+import subprocess
+import tempfile
 import re
 import logging
 
+if TYPE_CHECKING:
+    from git import Repo
+
 logger = logging.getLogger(__name__)
 
+# Git ref name rules (simplified), compiled once into a single alternation
+_INVALID_REF_RE = re.compile("|".join([
+    r'\.\.', # No double dots
+    r'^\.', # Cannot start with dot
+    r'\.$', # Cannot end with dot
+    r'^/', # Cannot start with slash
+    r'/$', # Cannot end with slash
+    r'//', # No double slashes
+    r'[\[\]^~:?*\\]', # No special chars
+    r'@\{', # No @{
+    r'\s', # No whitespace
+]))
+
+# Counts in `git diff --shortstat` output
+_SHORTSTAT_RES = (
+    ("files", re.compile(r"(\d+) files? changed")),
+    ("insertions", re.compile(r"(\d+) insertions?")),
+    ("deletions", re.compile(r"(\d+) deletions?")),
+)
+
+# Absolute path, resolved once; CPython only uses posix_spawn when the executable has a directory part
+GIT_EXECUTABLE = shutil.which("git") or "git"
+
+
+def _gitpython():
+    """
+    Import GitPython on first use.
+
+    Read-only commands run git directly (see GitClient._run_git), so only
+    mutating operations pay its import cost.
+    """
+    import git
+    return git
+
+
+def _command_error():
+    """GitCommandError, for `except` clauses (evaluated only once something is raised)."""
+    return _gitpython().GitCommandError
+
 
 class GitClient:
     """Comprehensive Git client for local operations."""
 
+    # Number of space splits before the path in `git status --porcelain=v2` records
+    _PORCELAIN_V2_FIELDS = {"1": 8, "2": 9, "u": 10}
+
+    # Rough size of one changed line in patch output, used to size a diff without producing it
+    _DIFF_BYTES_PER_LINE = 80
+
+    # Streamed diffs stay in memory up to this size, then spill to a temporary file
+    _DIFF_SPOOL_SIZE = 10 * 1024 * 1024
+
+    # Read size for patches streamed straight from the git pipe
+    _DIFF_CHUNK_SIZE = 64 * 1024
+
     def __init__(self, repo_path: Optional[str] = None):
         """Initialize Git client with repository path (defaults to current directory)."""
         self.repo_path = Path(repo_path or ".").resolve()
+        # Checked without GitPython; the Repo itself is only opened when needed
+        self._is_repo = (self.repo_path / ".git").exists()
+        # Remote URLs looked up so far; they don't change during a command
+        self._remote_urls: Dict[str, str] = {}
+        # Current branch and remote names, until an operation here changes them
+        # or refresh_refs() is called
+        self._branch: Optional[str] = None
+        self._remotes: Optional[List[str]] = None
+
+    @functools.cached_property
+    def repo(self) -> Optional["Repo"]:
+        """The GitPython Repo, opened on first use (None outside a repository)."""
+        git = _gitpython()
+        try:
+            return git.Repo(self.repo_path)
+        except git.InvalidGitRepositoryError:
+            return None
+
+    @functools.cached_property
+    def _libgit2(self):
+        """
+        A pygit2 Repository for in-process reads, or None.
+
+        pygit2 is optional; without it (or outside a repository) the read
+        methods run git instead.
+        """
+        if not self._is_repo:
+            return None
         try:
-            self.repo = Repo(self.repo_path)
-        except InvalidGitRepositoryError:
-            self.repo = None
+            import pygit2
+        except ImportError:
+            return None
+        try:
+            return pygit2.Repository(str(self.repo_path))
+        except pygit2.GitError as e:
+            logger.debug(f"pygit2 could not open {self.repo_path}: {e}")
+            return None
+
+    def _spawn_git(self, *args: str) -> subprocess.Popen:
+        """
+        Start a git command in the repository with its stdout piped back.
+
+        GitPython spawns with a cwd and close_fds=True, which forces
+        fork+exec. Passing the directory as `git -C` and leaving
+        close_fds off (our fds are non-inheritable anyway) lets CPython
+        take the much cheaper posix_spawn path.
+        """
+        return subprocess.Popen(
+            [GIT_EXECUTABLE, "-C", str(self.repo_path), *args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=False,
+        )
+
+    def _run_git(self, *args: str, output_stream: Optional[IO[bytes]] = None) -> str:
+        """
+        Run a read-only git command and return its stdout (or copy it into `output_stream`).
+
+        Raises:
+            GitCommandError: If git exits with a non-zero status
+        """
+        proc = self._spawn_git(*args)
+        if output_stream is not None:
+            shutil.copyfileobj(proc.stdout, output_stream)
+            stdout = b""
+            stderr = proc.stderr.read()
+            proc.wait()
+        else:
+            stdout, stderr = proc.communicate()
+        proc.stdout.close()
+        proc.stderr.close()
+        if proc.returncode != 0:
+            raise _command_error()(["git", *args], proc.returncode, stderr)
+        return stdout.decode("utf-8", errors="replace").rstrip("\n")
 
     @staticmethod
     def _validate_ref_name(name: str, ref_type: str = "ref") -> None:
@@ -32,24 +161,10 @@ class GitClient:
         if not name or not name.strip():
             raise ValueError(f"Invalid {ref_type} name: cannot be empty")
 
-        # Git ref name rules (simplified)
-        invalid_patterns = [
-            r'\.\.', # No double dots
-            r'^\.', # Cannot start with dot
-            r'\.$', # Cannot end with dot
-            r'^/', # Cannot start with slash
-            r'/$', # Cannot end with slash
-            r'//', # No double slashes
-            r'[\[\]^~:?*\\]', # No special chars
-            r'@\{', # No @{
-            r'\s', # No whitespace
-        ]
-
-        for pattern in invalid_patterns:
-            if re.search(pattern, name):
-                raise ValueError(
-                    f"Invalid {ref_type} name '{name}': contains invalid pattern"
-                )
+        if _INVALID_REF_RE.search(name):
+            raise ValueError(
+                f"Invalid {ref_type} name '{name}': contains invalid pattern"
+            )
 
         # Check for control characters
         if any(ord(c) < 32 or ord(c) == 127 for c in name):
@@ -57,22 +172,26 @@ class GitClient:
 
         logger.debug(f"Validated {ref_type} name: {name}")
 
-    def init_repository(self, path: Optional[str] = None) -> Repo:
+    def init_repository(self, path: Optional[str] = None) -> "Repo":
         """Initialize a new Git repository."""
         target_path = Path(path or self.repo_path)
         target_path.mkdir(parents=True, exist_ok=True)
-        self.repo = Repo.init(target_path)
+        self.repo = _gitpython().Repo.init(target_path)
         self.repo_path = target_path
+        self._is_repo = True
+        self._forget_refs()
         return self.repo
 
-    def clone_repository(self, url: str, path: Optional[str] = None) -> Repo:
+    def clone_repository(self, url: str, path: Optional[str] = None) -> "Repo":
         """Clone a repository from URL."""
         try:
             target_path = Path(path or ".").resolve()
-            self.repo = Repo.clone_from(url, target_path)
+            self.repo = _gitpython().Repo.clone_from(url, target_path)
             self.repo_path = target_path
+            self._is_repo = True
+            self._forget_refs()
             return self.repo
-        except GitCommandError as e:
+        except _command_error() as e:
             raise Exception(f"Failed to clone repository: {str(e)}")
 
     # Status and Information
@@ -81,38 +200,277 @@ class GitClient:
         """Get repository status."""
         self._ensure_repo()
 
+        if self._libgit2 is not None:
+            return self._status_libgit2()
+
+        # One porcelain call replaces the separate index/worktree/untracked
+        # walks GitPython would otherwise do; -z keeps paths unquoted.
+        raw = self._run_git("status", "--porcelain=v2", "-z", "--branch", "--untracked-files=all")
+
+        current_branch = None
+        modified, staged, untracked = [], [], []
+        entries = iter(raw.split("\0"))
+        for entry in entries:
+            if not entry:
+                continue
+            kind = entry[0]
+            if kind == "#":
+                if entry.startswith("# branch.head "):
+                    current_branch = entry[len("# branch.head "):]
+            elif kind in "12u":
+                fields = entry.split(" ", self._PORCELAIN_V2_FIELDS[kind])
+                xy, path = fields[1], fields[-1]
+                if kind == "2":
+                    next(entries, None)  # Original path of a rename/copy
+                if xy[0] != ".":
+                    staged.append(path)
+                if xy[1] != ".":
+                    modified.append(path)
+            elif kind == "?":
+                untracked.append(entry[2:])
+
+        if current_branch != "(detached)":
+            self._branch = current_branch
+
         return {
-            "modified": [item.a_path for item in self.repo.index.diff(None)],
-            "staged": [item.a_path for item in self.repo.index.diff("HEAD")],
-            "untracked": self.repo.untracked_files,
-            "current_branch": self.repo.active_branch.name,
-            "is_dirty": self.repo.is_dirty(),
+            "modified": modified,
+            "staged": staged,
+            "untracked": untracked,
+            "current_branch": current_branch,
+            "is_dirty": bool(modified or staged),
         }
 
-    def get_diff(self, staged: bool = False) -> str:
-        """Get diff of changes."""
+    def _status_libgit2(self) -> Dict[str, Any]:
+        """status() computed in-process by libgit2."""
+        import pygit2
+
+        pg = self._libgit2
+        staged_flags = (pygit2.GIT_STATUS_INDEX_NEW | pygit2.GIT_STATUS_INDEX_MODIFIED | pygit2.GIT_STATUS_INDEX_DELETED
+                        | pygit2.GIT_STATUS_INDEX_RENAMED | pygit2.GIT_STATUS_INDEX_TYPECHANGE | pygit2.GIT_STATUS_CONFLICTED)
+        modified_flags = (pygit2.GIT_STATUS_WT_MODIFIED | pygit2.GIT_STATUS_WT_DELETED | pygit2.GIT_STATUS_WT_RENAMED
+                          | pygit2.GIT_STATUS_WT_TYPECHANGE | pygit2.GIT_STATUS_CONFLICTED)
+
+        statuses = pg.status(untracked_files="all")
+        renamed_from = self._staged_rename_sources(statuses)
+
+        modified, staged, untracked = [], [], []
+        for path, flags in sorted(statuses.items()):
+            if flags & pygit2.GIT_STATUS_WT_NEW:
+                untracked.append(path)
+                continue
+            if flags & staged_flags and path not in renamed_from:
+                staged.append(path)
+            if flags & modified_flags:
+                modified.append(path)
+
+        if pg.head_is_detached:
+            current_branch = "(detached)"
+        else:
+            # The symbolic target also names an unborn branch, which has no commit to resolve
+            current_branch = pg.references["HEAD"].target[len("refs/heads/"):]
+            self._branch = current_branch
+
+        return {
+            "modified": modified,
+            "staged": staged,
+            "untracked": untracked,
+            "current_branch": current_branch,
+            "is_dirty": bool(modified or staged),
+        }
+
+    def _staged_rename_sources(self, statuses: Dict[str, int]) -> set:
+        """
+        Old paths of renames staged in the index.
+
+        libgit2's status reports a staged rename as a deletion plus an
+        addition, while `git status` pairs them up and lists only the new
+        path. Renames are detected (as git does) only when both kinds of
+        change are staged.
+        """
+        import pygit2
+
+        pg = self._libgit2
+        flags = statuses.values()
+        if pg.head_is_unborn or not (
+            any(f & pygit2.GIT_STATUS_INDEX_DELETED for f in flags)
+            and any(f & pygit2.GIT_STATUS_INDEX_NEW for f in flags)
+        ):
+            return set()
+        diff = pg.index.diff_to_tree(pg.head.peel(pygit2.Tree))
+        diff.find_similar()
+        return {delta.old_file.path for delta in diff.deltas if delta.status == pygit2.GIT_DELTA_RENAMED}
+
+    @contextmanager
+    def open_diff(self, staged: bool = False) -> Iterator[IO[bytes]]:
+        """
+        Stream `git diff` into a spooled temporary file and yield it rewound.
+
+        The patch is copied from the pipe in chunks, so it is never held as
+        one string; anything past _DIFF_SPOOL_SIZE lives on disk.
+        """
         self._ensure_repo()
 
-        if staged:
-            return self.repo.git.diff("--staged")
-        else:
-            return self.repo.git.diff()
+        args = ["--staged"] if staged else []
+        with tempfile.SpooledTemporaryFile(max_size=self._DIFF_SPOOL_SIZE) as spool:
+            self._run_git("diff", *args, output_stream=spool)
+            spool.seek(0)
+            yield spool
+
+    def iter_diff(self, staged: bool = False, max_bytes: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Yield `git diff` output in chunks as git produces it.
+
+        Once max_bytes have been yielded (or the caller stops iterating) git
+        is killed, so a huge patch is never generated past what is used.
+
+        Raises:
+            GitCommandError: If git fails before the patch is fully read
+        """
+        self._ensure_repo()
+
+        proc = self._spawn_git("diff", *(["--staged"] if staged else []))
+        remaining = max_bytes
+        exhausted = False
+        try:
+            while remaining is None or remaining > 0:
+                size = self._DIFF_CHUNK_SIZE if remaining is None else min(self._DIFF_CHUNK_SIZE, remaining)
+                chunk = proc.stdout.read(size)
+                if not chunk:
+                    exhausted = True
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            # git closes stdout just before exiting, so only a read that
+            # stopped short of EOF means git should be killed.
+            if not exhausted and proc.poll() is None:
+                proc.kill()
+            stderr = proc.stderr.read()
+            proc.wait()
+            proc.stdout.close()
+            proc.stderr.close()
+
+        if exhausted and proc.returncode != 0:
+            raise _command_error()(["git", "diff"], proc.returncode, stderr)
+
+    def get_diff(self, staged: bool = False, max_bytes: Optional[int] = None) -> str:
+        """
+        Get diff of changes.
+
+        Args:
+            staged: Diff the index against HEAD instead of the working tree
+            max_bytes: Read at most this many bytes of the patch (all of it if None)
+        """
+        return b"".join(self.iter_diff(staged=staged, max_bytes=max_bytes)).decode("utf-8", errors="replace")
+
+    def get_diff_shortstat(self, staged: bool = False) -> Dict[str, int]:
+        """
+        Summarize the diff without generating the patch.
+
+        Returns:
+            Dict with files, insertions, deletions and bytes_est (an estimate
+            of the full patch size)
+        """
+        self._ensure_repo()
+
+        args = ["--shortstat"] + (["--staged"] if staged else [])
+        summary = self._run_git("diff", *args)
+
+        counts = {}
+        for key, pattern in _SHORTSTAT_RES:
+            match = pattern.search(summary)
+            counts[key] = int(match.group(1)) if match else 0
+
+        counts["bytes_est"] = (counts["insertions"] + counts["deletions"]) * self._DIFF_BYTES_PER_LINE
+        return counts
+
+    def get_diff_stat(self, staged: bool = False) -> str:
+        """Get the per-file `git diff --stat` summary."""
+        self._ensure_repo()
+
+        args = ["--stat"] + (["--staged"] if staged else [])
+        return self._run_git("diff", *args)
+
+    def collect_commit_context(
+        self,
+        staged: bool = True,
+        max_bytes: Optional[int] = None,
+        log_count: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Gather the diff, its shortstat and the recent log in one concurrent pass.
+
+        Each datum comes from exactly one git subprocess, and the three run
+        side by side instead of one after another.
+
+        Args:
+            staged: Diff the index against HEAD instead of the working tree
+            max_bytes: Read at most this many bytes of the patch (all of it if None)
+            log_count: Number of commits to include (0 skips the log)
+
+        Returns:
+            Dict with diff (str), shortstat (as from get_diff_shortstat) and
+            log (as from get_log)
+        """
+        self._ensure_repo()
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            diff = pool.submit(self.get_diff, staged, max_bytes)
+            shortstat = pool.submit(self.get_diff_shortstat, staged)
+            log = pool.submit(self.get_log, log_count) if log_count else None
+            return {
+                "diff": diff.result(),
+                "shortstat": shortstat.result(),
+                "log": log.result() if log else [],
+            }
 
     def get_log(self, max_count: int = 10, branch: Optional[str] = None) -> List[Dict]:
         """Get commit history."""
         self._ensure_repo()
 
+        if self._libgit2 is not None:
+            return self._log_libgit2(max_count, branch)
+
+        # Commits are NUL-separated (-z) and fields unit-separated, so
+        # multi-line messages need no further escaping.
+        raw = self._run_git(
+            "log", "-z", f"-n{max_count}", "--format=%H%x1f%an%x1f%cI%x1f%B", branch or "HEAD"
+        )
+
         commits = []
-        ref = branch or self.repo.active_branch.name
+        for record in raw.split("\0"):
+            if not record:
+                continue
+            sha, author, date, message = record.split("\x1f", 3)
+            commits.append({
+                "sha": sha[:7],
+                "author": author,
+                "date": date,
+                "message": message.strip(),
+            })
 
-        for commit in self.repo.iter_commits(ref, max_count=max_count):
+        return commits
+
+    def _log_libgit2(self, max_count: int, branch: Optional[str]) -> List[Dict]:
+        """get_log() walked in-process by libgit2, in `git log` order."""
+        import pygit2
+
+        pg = self._libgit2
+        start = pg.revparse_single(branch or "HEAD").peel(pygit2.Commit).id
+        commits = []
+        for commit in pg.walk(start, pygit2.GIT_SORT_TIME):
+            if len(commits) >= max_count:
+                break
+            committed = datetime.fromtimestamp(
+                commit.commit_time, timezone(timedelta(minutes=commit.commit_time_offset))
+            )
             commits.append({
-                "sha": commit.hexsha[:7],
-                "author": str(commit.author),
-                "date": commit.committed_datetime.isoformat(),
+                "sha": str(commit.id)[:7],
+                "author": commit.author.name,
+                "date": committed.isoformat(),
                 "message": commit.message.strip(),
             })
-
         return commits
 
     # Staging Operations
@@ -128,7 +486,7 @@ class GitClient:
                 self.repo.index.add(files)
             else:
                 raise ValueError("Specify files to add or use all=True")
-        except GitCommandError as e:
+        except _command_error() as e:
             raise Exception(f"Failed to stage files: {str(e)}")
 
     def reset(self, files: Optional[List[str]] = None) -> None:
@@ -140,7 +498,7 @@ class GitClient:
                 self.repo.index.reset(files)
             else:
                 self.repo.index.reset()
-        except GitCommandError as e:
+        except _command_error() as e:
             raise Exception(f"Failed to unstage files: {str(e)}")
 
     # Commit Operations
@@ -153,13 +511,13 @@ class GitClient:
             if author and email:
                 commit = self.repo.index.commit(
                     message,
-                    author=git.Actor(author, email)
+                    author=_gitpython().Actor(author, email)
                 )
             else:
                 commit = self.repo.index.commit(message)
 
             return commit.hexsha[:7]
-        except GitCommandError as e:
+        except _command_error() as e:
             raise Exception(f"Failed to commit: {str(e)}")
 
     def amend_commit(self, message: Optional[str] = None) -> str:
@@ -173,7 +531,7 @@ class GitClient:
                 commit = self.repo.index.commit(amend=True)
 
             return commit.hexsha[:7]
-        except GitCommandError as e:
+        except _command_error() as e:
             raise Exception(f"Failed to amend commit: {str(e)}")
 
     # Branch Operations
@@ -184,10 +542,13 @@ class GitClient:
         self._validate_ref_name(branch_name, "branch")
 
         try:
-            new_branch = self.repo.create_head(branch_name)
             if checkout:
-                new_branch.checkout()
-        except GitCommandError as e:
+                # One `git checkout -b` instead of creating the head and checking it out separately
+                self.repo.git.checkout("-b", branch_name)
+                self._branch = branch_name
+            else:
+                self.repo.create_head(branch_name)
+        except _command_error() as e:
             raise Exception(f"Failed to create branch: {str(e)}") from e
 
     def checkout(self, branch_name: str, create: bool = False) -> None:
@@ -201,7 +562,8 @@ class GitClient:
                 self.create_branch(branch_name, checkout=True)
             else:
                 self.repo.heads[branch_name].checkout()
-        except (GitCommandError, IndexError) as e:
+                self._branch = branch_name
+        except (_command_error(), IndexError) as e:
             raise Exception(f"Failed to checkout branch: {str(e)}") from e
 
     def delete_branch(self, branch_name: str, force: bool = False) -> None:
@@ -210,22 +572,37 @@ class GitClient:
 
         try:
             self.repo.delete_head(branch_name, force=force)
-        except GitCommandError as e:
+        except _command_error() as e:
             raise Exception(f"Failed to delete branch: {str(e)}")
 
     def list_branches(self, remote: bool = False) -> List[str]:
         """List all branches."""
         self._ensure_repo()
 
+        pg = self._libgit2
+        if pg is not None:
+            if remote:
+                return sorted(name for name in pg.branches.remote
+                              if name.startswith("origin/") and not name.endswith("/HEAD"))
+            return sorted(pg.branches.local)
+
+        # One for-each-ref reads packed-refs once instead of a Head object per ref;
+        # strip=2 (not :short) keeps names unambiguous when a tag shares one
         if remote:
-            return [ref.name for ref in self.repo.remote().refs]
-        else:
-            return [head.name for head in self.repo.heads]
+            refs = self._run_git("for-each-ref", "--format=%(refname:strip=2)", "refs/remotes/origin/")
+            return [ref for ref in refs.splitlines() if not ref.endswith("/HEAD")]
+        return self._run_git("for-each-ref", "--format=%(refname:strip=2)", "refs/heads/").splitlines()
 
     def get_current_branch(self) -> str:
-        """Get the current branch name."""
+        """Get the current branch name (cached; checkouts made here keep it current, refresh_refs() drops it)."""
         self._ensure_repo()
-        return self.repo.active_branch.name
+
+        if self._branch is None:
+            try:
+                self._branch = self._run_git("symbolic-ref", "--short", "HEAD")
+            except _command_error():
+                raise Exception("HEAD is detached; not on any branch")
+        return self._branch
 
     # Remote Operations
 
@@ -235,7 +612,9 @@ class GitClient:
 
         try:
             self.repo.create_remote(name, url)
-        except GitCommandError as e:
+            self._remote_urls.pop(name, None)
+            self._remotes = None
+        except _command_error() as e:
             raise Exception(f"Failed to add remote: {str(e)}")
 
     def remove_remote(self, name: str) -> None:
@@ -244,13 +623,18 @@ class GitClient:
 
         try:
             self.repo.delete_remote(name)
-        except GitCommandError as e:
+            self._remote_urls.pop(name, None)
+            self._remotes = None
+        except _command_error() as e:
             raise Exception(f"Failed to remove remote: {str(e)}")
 
     def list_remotes(self) -> List[str]:
         """List all remotes."""
         self._ensure_repo()
-        return [remote.name for remote in self.repo.remotes]
+
+        if self._remotes is None:
+            self._remotes = [remote.name for remote in self.repo.remotes]
+        return list(self._remotes)
 
     def fetch(self, remote: str = "origin", prune: bool = False) -> None:
         """Fetch from remote."""
@@ -259,7 +643,7 @@ class GitClient:
         try:
             remote_obj = self.repo.remote(remote)
             remote_obj.fetch(prune=prune)
-        except GitCommandError as e:
+        except _command_error() as e:
             raise Exception(f"Failed to fetch from {remote}: {str(e)}")
 
     def pull(self, remote: str = "origin", branch: Optional[str] = None, rebase: bool = False) -> str:
@@ -268,7 +652,7 @@ class GitClient:
 
         try:
             remote_obj = self.repo.remote(remote)
-            target_branch = branch or self.repo.active_branch.name
+            target_branch = branch or self.get_current_branch()
 
             if rebase:
                 result = remote_obj.pull(target_branch, rebase=True)
@@ -276,7 +660,7 @@ class GitClient:
                 result = remote_obj.pull(target_branch)
 
             return f"Pulled from {remote}/{target_branch}"
-        except GitCommandError as e:
+        except _command_error() as e:
             raise Exception(f"Failed to pull: {str(e)}")
 
     def push(
@@ -291,17 +675,18 @@ class GitClient:
 
         try:
             remote_obj = self.repo.remote(remote)
-            target_branch = branch or self.repo.active_branch.name
+            target_branch = branch or self.get_current_branch()
 
+            # A bare branch name pushes to the same name on the remote
             if set_upstream:
-                remote_obj.push(refspec=f"{target_branch}:{target_branch}", set_upstream=True)
+                remote_obj.push(target_branch, set_upstream=True)
             elif force:
-                remote_obj.push(refspec=f"{target_branch}:{target_branch}", force=True)
+                remote_obj.push(target_branch, force=True)
             else:
-                remote_obj.push(refspec=f"{target_branch}:{target_branch}")
+                remote_obj.push(target_branch)
 
             return f"Pushed to {remote}/{target_branch}"
-        except GitCommandError as e:
+        except _command_error() as e:
             raise Exception(f"Failed to push: {str(e)}")
 
     # Merge Operations
@@ -316,8 +701,8 @@ class GitClient:
             else:
                 self.repo.git.merge(branch_name)
 
-            return f"Merged {branch_name} into {self.repo.active_branch.name}"
-        except GitCommandError as e:
+            return f"Merged {branch_name} into {self.get_current_branch()}"
+        except _command_error() as e:
             raise Exception(f"Failed to merge: {str(e)}")
 
     def abort_merge(self) -> None:
@@ -326,7 +711,7 @@ class GitClient:
 
         try:
             self.repo.git.merge(abort=True)
-        except GitCommandError as e:
+        except _command_error() as e:
             raise Exception(f"Failed to abort merge: {str(e)}")
 
     # Stash Operations
@@ -340,7 +725,7 @@ class GitClient:
                 self.repo.git.stash("save", "-u", message or "WIP")
             else:
                 self.repo.git.stash("save", message or "WIP")
-        except GitCommandError as e:
+        except _command_error() as e:
             raise Exception(f"Failed to stash: {str(e)}")
 
     def stash_pop(self, index: int = 0) -> None:
@@ -349,7 +734,7 @@ class GitClient:
 
         try:
             self.repo.git.stash("pop", f"stash@{{{index}}}")
-        except GitCommandError as e:
+        except _command_error() as e:
             raise Exception(f"Failed to pop stash: {str(e)}")
 
     def stash_list(self) -> List[str]:
@@ -359,7 +744,7 @@ class GitClient:
         try:
             output = self.repo.git.stash("list")
             return output.split("\n") if output else []
-        except GitCommandError:
+        except _command_error():
             return []
 
     # Tag Operations
@@ -374,7 +759,7 @@ class GitClient:
                 self.repo.create_tag(tag_name, message=message)
             else:
                 self.repo.create_tag(tag_name)
-        except GitCommandError as e:
+        except _command_error() as e:
             raise Exception(f"Failed to create tag: {str(e)}") from e
 
     def delete_tag(self, tag_name: str) -> None:
@@ -383,30 +768,53 @@ class GitClient:
 
         try:
             self.repo.delete_tag(tag_name)
-        except GitCommandError as e:
+        except _command_error() as e:
             raise Exception(f"Failed to delete tag: {str(e)}")
 
     def list_tags(self) -> List[str]:
         """List all tags."""
         self._ensure_repo()
-        return [tag.name for tag in self.repo.tags]
+
+        if self._libgit2 is not None:
+            return sorted(ref[len("refs/tags/"):] for ref in self._libgit2.references if ref.startswith("refs/tags/"))
+        return self._run_git("for-each-ref", "--format=%(refname:strip=2)", "refs/tags/").splitlines()
 
     # Utility Methods
 
+    def refresh_refs(self) -> None:
+        """
+        Forget the cached branch, remotes and remote URLs.
+
+        A long-lived client (e.g. in `gh-assist shell`) calls this between
+        commands, since a checkout or remote change made outside this
+        process would otherwise go unnoticed.
+        """
+        self._remote_urls.clear()
+        self._branch = None
+        self._remotes = None
+
+    def _forget_refs(self) -> None:
+        """Drop what was cached about the repository, e.g. after switching to another one."""
+        self.refresh_refs()
+        # Reopened for the new repo_path on next use
+        self.__dict__.pop('_libgit2', None)
+
     def _ensure_repo(self) -> None:
         """Ensure repository is initialized."""
-        if self.repo is None:
+        if not self._is_repo:
             raise Exception("Not a git repository. Run 'git init' first.")
 
     def is_repo(self) -> bool:
         """Check if current directory is a git repository."""
-        return self.repo is not None
+        return self._is_repo
 
     def get_remote_url(self, remote: str = "origin") -> str:
-        """Get remote URL."""
+        """Get remote URL (looked up once per remote)."""
         self._ensure_repo()
 
-        try:
-            return list(self.repo.remote(remote).urls)[0]
-        except (IndexError, ValueError):
-            raise Exception(f"Remote '{remote}' not found")
+        if remote not in self._remote_urls:
+            try:
+                self._remote_urls[remote] = next(iter(self.repo.remote(remote).urls))
+            except (StopIteration, ValueError):
+                raise Exception(f"Remote '{remote}' not found")
+        return self._remote_urls[remote]
@@ -1,28 +1,361 @@
 """GitHub API client for repository and remote operations."""
 
-from typing import List, Optional, Dict, Any
-from github import Github, GithubException, Repository, PullRequest, Issue, RateLimitExceededException
-from github.GithubObject import NotSet
-import os
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Dict, Any, Tuple, TypeVar, Union
+from urllib.parse import urlencode
+import functools
+import random
+import threading
 import time
 import logging
 
+from github_assistant.core.response_cache import ResponseCache
+from github_assistant.core.throttle import choose_token, github_tokens
+from github_assistant.models import IssueSummary, PRSummary, RepoSummary
+
+if TYPE_CHECKING:
+    from github.Issue import Issue
+    from github.PullRequest import PullRequest
+    from github.Repository import Repository
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _pygithub():
+    """
+    Import PyGithub on first use.
+
+    It is a few dozen modules, so importing this module (or a command that
+    never builds a GitHubClient) does not pay for it.
+    """
+    import github
+    import github.GithubObject
+    return github
+
+
+def _github_error():
+    """GithubException, for `except` clauses (evaluated only once something is raised)."""
+    return _pygithub().GithubException
+
+
+def _rate_limit_error():
+    """RateLimitExceededException, for `except` clauses and isinstance checks."""
+    return _pygithub().RateLimitExceededException
+
+# GraphQL selections for the *_graphql listings; $states/$labels filter, $after pages
+_PR_QUERY = """
+query($owner: String!, $name: String!, $first: Int!, $after: String, $states: [PullRequestState!]) {
+  repository(owner: $owner, name: $name) {
+    items: pullRequests(first: $first, after: $after, states: $states,
+                        orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number title state isDraft url createdAt updatedAt headRefName baseRefName
+        author { login }
+        labels(first: 20) { nodes { name } }
+      }
+    }
+  }
+}
+"""
+
+_ISSUE_QUERY = """
+query($owner: String!, $name: String!, $first: Int!, $after: String, $states: [IssueState!],
+      $labels: [String!]) {
+  repository(owner: $owner, name: $name) {
+    items: issues(first: $first, after: $after, states: $states, labels: $labels,
+                  orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number title state url createdAt updatedAt
+        author { login }
+        labels(first: 20) { nodes { name } }
+        comments { totalCount }
+      }
+    }
+  }
+}
+"""
+
+
+def _paginate(items: Iterable[T], max_pages: Optional[int] = None) -> Iterator[T]:
+    """
+    Yield items from a PyGithub PaginatedList, fetching pages only as they are consumed.
+
+    With max_pages, iteration also stops after that many pages have been
+    requested, even if the caller keeps reading.
+    """
+    if max_pages is None:
+        yield from items
+        return
+    for page in range(max_pages):
+        batch = items.get_page(page)
+        if not batch:
+            return
+        yield from batch
+
+
+def _repo_summary(item: Dict[str, Any]) -> RepoSummary:
+    return RepoSummary(
+        name=item["name"],
+        full_name=item["full_name"],
+        url=item["html_url"],
+        updated_at=item["updated_at"],
+        description=item["description"] or "",
+        private=item["private"],
+        language=item["language"] or "",
+        stars=item["stargazers_count"],
+        forks=item["forks_count"],
+        default_branch=item["default_branch"],
+    )
+
+
+def _pr_summary(item: Dict[str, Any]) -> PRSummary:
+    return PRSummary(
+        number=item["number"],
+        title=item["title"],
+        state="merged" if item.get("merged_at") else item["state"],
+        author=(item["user"] or {}).get("login", "ghost"),
+        url=item["html_url"],
+        created_at=item["created_at"],
+        updated_at=item["updated_at"],
+        labels=tuple(label["name"] for label in item["labels"]),
+        draft=item.get("draft", False),
+        head=item["head"]["ref"],
+        base=item["base"]["ref"],
+    )
+
+
+def _issue_summary(item: Dict[str, Any]) -> IssueSummary:
+    return IssueSummary(
+        number=item["number"],
+        title=item["title"],
+        state=item["state"],
+        author=(item["user"] or {}).get("login", "ghost"),
+        url=item["html_url"],
+        created_at=item["created_at"],
+        updated_at=item["updated_at"],
+        labels=tuple(label["name"] for label in item["labels"]),
+        comments=item["comments"],
+    )
 
-class GitHubClient:
-    """Comprehensive GitHub API client with rate limit handling."""
 
-    def __init__(self, token: Optional[str] = None):
-        """Initialize GitHub client with token from env or parameter."""
-        self.token = token or os.getenv('GITHUB_TOKEN')
-        if not self.token:
-            raise ValueError("GitHub token required. Set GITHUB_TOKEN env variable.")
+class GitHubClient:
+    """
+    Comprehensive GitHub API client with rate limit handling.
+
+    The list_* methods (and get_notifications) return lazy iterators that
+    request further pages only as they are read; wrap them in list() where
+    every item is needed up front. Repositories, pull requests and issues
+    are listed as plain summary dataclasses built from the listing JSON,
+    since PyGithub's partially loaded objects fetch again on attribute
+    access; use get_repository / get_pull_request to act on one.
+    """
+
+    # Fixed attribute set: lookups skip the instance dict on every call
+    __slots__ = (
+        "tokens", "token", "client", "cache", "user",
+        "_requesters", "_token_requests", "_token_lock", "_repos", "_repo_paths", "_user_info",
+    )
+
+    # Page cap for listings that can run to thousands of items (100 per page)
+    DEFAULT_MAX_PAGES = 10
+
+    # Seconds a looked-up repository / the user's profile is reused before refetching
+    REPO_TTL = 60
+    USER_INFO_TTL = 300
+
+    # Attempts for _handle_rate_limit, and its backoff (seconds) when GitHub gives no reset time
+    MAX_RETRIES = 3
+    BACKOFF_BASE = 1.0
+    BACKOFF_JITTER = 5.0
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        tokens: Optional[Union[List[str], str]] = None
+    ):
+        """
+        Initialize GitHub client with token from env or parameter.
 
-        self.client = Github(self.token)
+        Args:
+            token: Single token (defaults to GITHUB_TOKEN)
+            cache: Response cache for conditional GETs (defaults to the on-disk one)
+            tokens: Tokens to rotate between, as a list or comma-separated
+                string (defaults to github.tokens / GH_ASSIST_TOKENS). All
+                of them should belong to the same account.
+        """
+        self.tokens = github_tokens(tokens, token)
+        self.token = self.tokens[0]
+
+        github = _pygithub()
+        self.client = github.Github(self.token, per_page=100)
+        self.cache = cache or ResponseCache()
+
+        # One requester per token. Every object hangs off self.client, whose
+        # requests are routed by _request_any_token to whichever token has the
+        # most rate limit left (PyGithub tracks it per requester).
+        self._requesters = [self.client.requester] + [
+            github.Github(t, per_page=100).requester for t in self.tokens[1:]
+        ]
+        self._token_requests = [r.requestJsonAndCheck for r in self._requesters]
+        self._token_lock = threading.Lock()
+        self.client.requester.requestJsonAndCheck = self._conditional(self._request_any_token)
         self.user = self.client.get_user()
+
+        # repo_name -> (Repository, expiry on the monotonic clock)
+        self._repos: Dict[str, Tuple["Repository", float]] = {}
+        # repo_name -> "/repos/owner/name", built once per name
+        self._repo_paths: Dict[str, str] = {}
+        self._user_info: Optional[Tuple[Dict[str, Any], float]] = None
         logger.debug(f"GitHub client initialized for user: {self.user.login}")
 
+    def _pick_token(self) -> int:
+        """Index of the token to use next (see choose_token), sleeping if all are exhausted."""
+        with self._token_lock:
+            # PyGithub reports -1 for a token it has no headers for yet
+            index, wait = choose_token([
+                (None if r.rate_limiting[0] < 0 else r.rate_limiting[0], r.rate_limiting_resettime)
+                for r in self._requesters
+            ])
+        if wait:
+            time.sleep(wait)
+        return index
+
+    def _request_any_token(self, verb, url, parameters=None, headers=None, input=None, **kwargs):
+        """Send a request on the token with the most rate limit left, moving to another if it is rejected."""
+        for _ in range(len(self._requesters) + 1):
+            index = self._pick_token()
+            try:
+                return self._token_requests[index](verb, url, parameters, headers, input, **kwargs)
+            except _rate_limit_error():
+                logger.warning(f"Rate limit hit on token #{index + 1}, retrying...")
+                requester = self._requesters[index]
+                requester.rate_limiting = (0, requester.rate_limiting[1])
+        raise _rate_limit_error()(403, {"message": "Rate limit exceeded on all tokens"}, None)
+
+    def _conditional(self, request):
+        """
+        Wrap PyGithub's JSON request method so GETs are revalidated against the response cache.
+
+        Every GET PyGithub issues (lazy object loads and each listing page)
+        carries the stored ETag / Last-Modified, and a 304 Not Modified,
+        which is not charged against the rate limit, is answered with the
+        stored body. The Link header is kept too so pagination continues
+        past a 304 page.
+        """
+        @functools.wraps(request)
+        def conditional_request(verb, url, parameters=None, headers=None, input=None, **kwargs):
+            if verb != "GET" or input is not None:
+                return request(verb, url, parameters, headers, input, **kwargs)
+
+            # Namespaced apart from AsyncGitHubClient's entries, which store bare bodies
+            key = f"pygithub {url}?{urlencode(sorted((parameters or {}).items()))}"
+            if headers and headers.get("Accept"):
+                key += f" {headers['Accept']}"
+            cached = self.cache.get(key)
+            headers = dict(headers or {})
+            if cached:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+
+            response_headers, data = request(verb, url, parameters, headers, input, **kwargs)
+            if data is None and cached:
+                logger.debug(f"Not modified, using cached response for {url}")
+                stored = cached[2]
+                if stored.get("link"):
+                    response_headers = {**response_headers, "link": stored["link"]}
+                return response_headers, stored["data"]
+
+            etag = response_headers.get("etag")
+            last_modified = response_headers.get("last-modified")
+            if etag or last_modified:
+                self.cache.set(key, etag, last_modified, {"link": response_headers.get("link"), "data": data})
+            return response_headers, data
+
+        return conditional_request
+
+    def _repo_path(self, repo_name: str) -> str:
+        """REST path of a repository, e.g. /repos/owner/name (the user's own if no owner is given)."""
+        path = self._repo_paths.get(repo_name)
+        if path is None:
+            owner = "" if '/' in repo_name else f"{self.user.login}/"
+            path = self._repo_paths[repo_name] = f"/repos/{owner}{repo_name}"
+        return path
+
+    def _call(self, verb: str, path: str, payload: Optional[Dict[str, Any]] = None):
+        """
+        Send one REST request straight through the requester, returning (headers, data).
+
+        For writes that only need the repository and a number, this skips
+        loading the repository and the PR / issue objects first.
+        """
+        return self.client.requester.requestJsonAndCheck(verb, path, input=payload)
+
+    def _list_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the raw JSON items of a REST list endpoint, 100 per page, reading pages as consumed.
+
+        Requests go through the client's requester, so they share its
+        token rotation and conditional-request cache.
+        """
+        page = 1
+        while max_pages is None or page <= max_pages:
+            _, batch = self.client.requester.requestJsonAndCheck(
+                "GET", url, parameters={**(params or {}), "per_page": 100, "page": page}
+            )
+            yield from batch
+            if len(batch) < 100:
+                return
+            page += 1
+
+    def _graphql_nodes(
+        self,
+        query: str,
+        repo_name: str,
+        limit: Optional[int] = None,
+        **variables
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the nodes of a query's `repository { items: ... }` connection, following its cursor.
+
+        Requests go through the client's requester, so they share its token
+        rotation. At most `limit` nodes are fetched (None for all).
+        """
+        owner, _, name = repo_name.rpartition('/')
+        after = None
+        while limit is None or limit > 0:
+            first = 100 if limit is None else min(limit, 100)
+            _, data = self.client.requester.requestJsonAndCheck(
+                "POST", "/graphql",
+                input={
+                    "query": query,
+                    "variables": {
+                        **variables, "owner": owner or self.user.login, "name": name,
+                        "first": first, "after": after,
+                    },
+                },
+            )
+            if data.get("errors"):
+                raise Exception(f"GraphQL query failed: {data['errors'][0].get('message')}")
+            connection = data["data"]["repository"]["items"]
+            yield from connection["nodes"]
+            if limit is not None:
+                limit -= len(connection["nodes"])
+            if not connection["pageInfo"]["hasNextPage"]:
+                return
+            after = connection["pageInfo"]["endCursor"]
+
     def _handle_rate_limit(self, func, *args, **kwargs):
         """
         Execute function with rate limit handling.
@@ -38,34 +371,42 @@ class GitHubClient:
         Raises:
             Exception: If function fails after retry
         """
-        max_retries = 3
-        retry_delay = 60  # seconds
-
-        for attempt in range(max_retries):
+        for attempt in range(self.MAX_RETRIES):
             try:
                 return func(*args, **kwargs)
-            except RateLimitExceededException:
-                if attempt < max_retries - 1:
-                    rate_limit = self.client.get_rate_limit()
-                    reset_time = rate_limit.core.reset
-                    wait_time = (reset_time - time.time()) + 5  # Add 5s buffer
-
-                    logger.warning(
-                        f"Rate limit exceeded. Waiting {wait_time:.0f}s until reset..."
-                    )
-                    time.sleep(min(wait_time, retry_delay))
-                else:
-                    logger.error("Rate limit exceeded, max retries reached")
+            except _github_error() as e:
+                rate_limited = isinstance(e, _rate_limit_error()) or (
+                    e.status in (403, 429) and 'rate limit' in str(e).lower()
+                )
+                if not rate_limited:
                     raise
-            except GithubException as e:
-                if e.status == 403 and 'rate limit' in str(e).lower():
-                    if attempt < max_retries - 1:
-                        logger.warning(f"Rate limit hit, retrying in {retry_delay}s...")
-                        time.sleep(retry_delay)
-                    else:
-                        raise
-                else:
+                if attempt == self.MAX_RETRIES - 1:
+                    logger.error("Rate limit exceeded, max retries reached")
                     raise
+                wait_time = self._rate_limit_wait(e, attempt)
+                logger.warning(f"Rate limit exceeded. Retrying in {wait_time:.0f}s...")
+                time.sleep(wait_time)
+
+    def _rate_limit_wait(self, error: Exception, attempt: int) -> float:
+        """
+        Seconds to wait before retrying after a rate-limit error.
+
+        A secondary limit's Retry-After is honoured; an exhausted primary
+        limit waits out the whole window, since retrying earlier only fails
+        again. Otherwise the wait doubles per attempt from BACKOFF_BASE.
+        Random jitter of up to BACKOFF_JITTER seconds keeps concurrent
+        clients from retrying in lockstep.
+        """
+        jitter = random.uniform(0, self.BACKOFF_JITTER)
+        headers = {k.lower(): v for k, v in (error.headers or {}).items()}
+        if headers.get("retry-after"):
+            return float(headers["retry-after"]) + jitter
+        if headers.get("x-ratelimit-remaining") == "0" and headers.get("x-ratelimit-reset"):
+            return max(float(headers["x-ratelimit-reset"]) - time.time(), 0) + jitter
+        if isinstance(error, _rate_limit_error()):
+            reset = self.client.get_rate_limit().core.reset.timestamp()
+            return max(reset - time.time(), 0) + jitter
+        return self.BACKOFF_BASE * 2 ** attempt + jitter
 
     def get_rate_limit_status(self) -> Dict[str, Any]:
         """Get current rate limit status."""
@@ -83,6 +424,40 @@ class GitHubClient:
             }
         }
 
+    def remaining_budget(self) -> int:
+        """
+        Requests left across all tokens, as of their latest responses.
+
+        Every response carries X-RateLimit-Remaining / -Reset, which PyGithub
+        records per token, so this is normally free. Only a token that has
+        not been used yet, or whose window has since reset, is looked up
+        (via /rate_limit, which does not count against the limit).
+        """
+        total = 0
+        for index, requester in enumerate(self._requesters):
+            if requester.rate_limiting[0] < 0 or requester.rate_limiting_resettime <= time.time():
+                self._token_requests[index]("GET", "/rate_limit")
+            total += max(requester.rate_limiting[0], 0)
+        return total
+
+    def wait_for_budget(self, requests: int) -> None:
+        """
+        Before a loop of `requests` calls, sleep until the tokens can cover it.
+
+        Waiting once up front, for the earliest reset, replaces a
+        rate-limit error and retry in the middle of the loop. Budgets
+        larger than one window are left to the per-request handling.
+        """
+        budget = self.remaining_budget()
+        if budget >= requests:
+            return
+        wait = min(r.rate_limiting_resettime for r in self._requesters) - time.time()
+        if wait > 0:
+            logger.warning(
+                f"{budget} requests left for {requests} planned, waiting {wait:.0f}s for a reset..."
+            )
+            time.sleep(wait + 1)
+
     # Repository Operations
 
     def create_repository(
@@ -93,55 +468,84 @@ class GitHubClient:
         auto_init: bool = True,
         gitignore_template: Optional[str] = None,
         license_template: Optional[str] = None
-    ) -> Repository:
+    ) -> "Repository":
         """Create a new repository."""
+        not_set = _pygithub().GithubObject.NotSet
         try:
             repo = self.user.create_repo(
                 name=name,
                 description=description,
                 private=private,
                 auto_init=auto_init,
-                gitignore_template=gitignore_template or NotSet,
-                license_template=license_template or NotSet
+                gitignore_template=gitignore_template or not_set,
+                license_template=license_template or not_set
             )
+            self.invalidate(name)
             return repo
-        except GithubException as e:
+        except _github_error() as e:
             raise Exception(f"Failed to create repository: {e.data.get('message', str(e))}")
 
-    def get_repository(self, repo_name: str) -> Repository:
-        """Get a repository by name (owner/repo or just repo for user's repos)."""
+    def get_repository(self, repo_name: str) -> "Repository":
+        """
+        Get a repository by name (owner/repo or just repo for user's repos).
+
+        The object is reused for REPO_TTL seconds, so the many methods that
+        start from it share one request.
+        """
+        cached = self._repos.get(repo_name)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
         try:
             if '/' in repo_name:
-                return self.client.get_repo(repo_name)
+                repo = self.client.get_repo(repo_name)
             else:
-                return self.user.get_repo(repo_name)
-        except GithubException as e:
+                repo = self.user.get_repo(repo_name)
+        except _github_error() as e:
             raise Exception(f"Repository not found: {repo_name}")
+        self._repos[repo_name] = (repo, time.monotonic() + self.REPO_TTL)
+        return repo
+
+    def invalidate(self, repo_name: Optional[str] = None) -> None:
+        """Drop the cached repository `repo_name` (either name form), or every cached lookup."""
+        if self._user_info:
+            # Repository counts in the profile change with the repositories
+            self._user_info = (self._user_info[0], 0.0)
+        if repo_name is None:
+            self._repos.clear()
+            return
+        short_name = repo_name.rpartition('/')[2]
+        for key in [key for key in self._repos if key.rpartition('/')[2] == short_name]:
+            del self._repos[key]
 
     def list_repositories(
         self,
         type: str = "all",
         sort: str = "updated",
-        direction: str = "desc"
-    ) -> List[Repository]:
-        """List user's repositories."""
-        return list(self.user.get_repos(type=type, sort=sort, direction=direction))
+        direction: str = "desc",
+        max_pages: Optional[int] = DEFAULT_MAX_PAGES
+    ) -> Iterator[RepoSummary]:
+        """List user's repositories, reading at most `max_pages` pages (None for all)."""
+        for item in self._list_json(
+            "/user/repos", {"type": type, "sort": sort, "direction": direction}, max_pages
+        ):
+            yield _repo_summary(item)
 
     def delete_repository(self, repo_name: str) -> bool:
         """Delete a repository."""
         try:
             repo = self.get_repository(repo_name)
             repo.delete()
+            self.invalidate(repo_name)
             return True
         except Exception as e:
             raise Exception(f"Failed to delete repository: {str(e)}")
 
-    def fork_repository(self, repo_full_name: str) -> Repository:
+    def fork_repository(self, repo_full_name: str) -> "Repository":
         """Fork a repository."""
         try:
             repo = self.client.get_repo(repo_full_name)
             return self.user.create_fork(repo)
-        except GithubException as e:
+        except _github_error() as e:
             raise Exception(f"Failed to fork repository: {str(e)}")
 
     # Pull Request Operations
@@ -154,7 +558,7 @@ class GitHubClient:
         base: str = "main",
         body: str = "",
         draft: bool = False
-    ) -> PullRequest:
+    ) -> "PullRequest":
         """Create a pull request."""
         try:
             repo = self.get_repository(repo_name)
@@ -166,7 +570,7 @@ class GitHubClient:
                 draft=draft
             )
             return pr
-        except GithubException as e:
+        except _github_error() as e:
             raise Exception(f"Failed to create PR: {e.data.get('message', str(e))}")
 
     def list_pull_requests(
@@ -174,13 +578,45 @@ class GitHubClient:
         repo_name: str,
         state: str = "open",
         sort: str = "created",
-        direction: str = "desc"
-    ) -> List[PullRequest]:
+        direction: str = "desc",
+        max_pages: Optional[int] = None
+    ) -> Iterator[PRSummary]:
         """List pull requests for a repository."""
-        repo = self.get_repository(repo_name)
-        return list(repo.get_pulls(state=state, sort=sort, direction=direction))
+        for item in self._list_json(
+            f"{self._repo_path(repo_name)}/pulls", {"state": state, "sort": sort, "direction": direction}, max_pages
+        ):
+            yield _pr_summary(item)
+
+    def list_pull_requests_graphql(
+        self,
+        repo_name: str,
+        state: str = "open",
+        limit: Optional[int] = None
+    ) -> Iterator[PRSummary]:
+        """
+        List pull requests with their author, labels and refs, 100 per GraphQL request.
 
-    def get_pull_request(self, repo_name: str, number: int) -> PullRequest:
+        Unlike the REST list_pull_requests, this also reports merged PRs
+        as "merged" without reading each one, and takes one request per
+        100 PRs whatever the filters.
+        """
+        states = {"open": ["OPEN"], "closed": ["CLOSED", "MERGED"]}.get(state)
+        for node in self._graphql_nodes(_PR_QUERY, repo_name, limit, states=states):
+            yield PRSummary(
+                number=node["number"],
+                title=node["title"],
+                state=node["state"].lower(),
+                author=(node["author"] or {}).get("login", "ghost"),
+                url=node["url"],
+                created_at=node["createdAt"],
+                updated_at=node["updatedAt"],
+                labels=tuple(label["name"] for label in node["labels"]["nodes"]),
+                draft=node["isDraft"],
+                head=node["headRefName"],
+                base=node["baseRefName"],
+            )
+
+    def get_pull_request(self, repo_name: str, number: int) -> "PullRequest":
         """Get a specific pull request."""
         repo = self.get_repository(repo_name)
         return repo.get_pull(number)
@@ -193,35 +629,62 @@ class GitHubClient:
         merge_method: str = "merge"
     ) -> bool:
         """Merge a pull request."""
+        payload = {"merge_method": merge_method}
+        if commit_message:
+            payload["commit_message"] = commit_message
         try:
-            pr = self.get_pull_request(repo_name, number)
-            result = pr.merge(
-                commit_message=commit_message,
-                merge_method=merge_method
-            )
-            return result.merged
-        except GithubException as e:
+            _, result = self._call("PUT", f"{self._repo_path(repo_name)}/pulls/{number}/merge", payload)
+            return result["merged"]
+        except _github_error() as e:
             raise Exception(f"Failed to merge PR: {str(e)}")
 
-    def get_pr_diff(self, repo_name: str, number: int) -> str:
-        """Get the diff for a pull request."""
-        pr = self.get_pull_request(repo_name, number)
-        files = pr.get_files()
+    def get_pr_diff(self, repo_name: str, number: int, per_file: bool = False) -> str:
+        """
+        Get the diff for a pull request.
 
-        diff_content = []
-        for file in files:
-            diff_content.append(f"\n--- {file.filename} ---")
-            diff_content.append(f"Status: {file.status}")
-            diff_content.append(f"Changes: +{file.additions} -{file.deletions}")
-            if file.patch:
-                diff_content.append(file.patch)
+        The unified diff comes back in one request via the diff media type.
+        With per_file (or when GitHub refuses the diff as too large) it is
+        assembled from the paginated file list instead, with each file's
+        status and line counts.
+        """
+        if not per_file:
+            try:
+                url = f"{self._repo_path(repo_name)}/pulls/{number}"
+                _, data = self.client.requester.requestJsonAndCheck(
+                    "GET", url, headers={"Accept": "application/vnd.github.diff"}
+                )
+                # PyGithub hands back non-JSON bodies as {"data": text}
+                return data["data"] if isinstance(data, dict) else data or ""
+            except _github_error() as e:
+                logger.debug(f"Unified diff unavailable for PR #{number}, listing files instead: {e}")
+
+        return "\n".join(chunk for _, chunk in self.iter_pr_diff(repo_name, number))
+
+    def iter_pr_diff(self, repo_name: str, number: int) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (filename, diff chunk) per file of a pull request, as its file list is paged in.
 
-        return "\n".join(diff_content)
+        Each chunk carries the file's status and line counts ahead of its
+        patch. Only one page of files is held at a time, so large PRs
+        can be processed as they arrive.
+        """
+        url = f"{self._repo_path(repo_name)}/pulls/{number}/files"
+        for file in self._list_json(url):
+            lines = [
+                f"\n--- {file['filename']} ---",
+                f"Status: {file['status']}",
+                f"Changes: +{file['additions']} -{file['deletions']}",
+            ]
+            if file.get('patch'):
+                lines.append(file['patch'])
+            yield file['filename'], "\n".join(lines)
 
     def comment_on_pr(self, repo_name: str, number: int, comment: str) -> None:
-        """Add a comment to a pull request."""
-        pr = self.get_pull_request(repo_name, number)
-        pr.create_issue_comment(comment)
+        """Add a comment to a pull request (PR conversations are issue comments)."""
+        try:
+            self._call("POST", f"{self._repo_path(repo_name)}/issues/{number}/comments", {"body": comment})
+        except _github_error() as e:
+            raise Exception(f"Failed to comment on PR: {str(e)}")
 
     # Issue Operations
 
@@ -232,7 +695,7 @@ class GitHubClient:
         body: str = "",
         labels: Optional[List[str]] = None,
         assignees: Optional[List[str]] = None
-    ) -> Issue:
+    ) -> "Issue":
         """Create an issue."""
         try:
             repo = self.get_repository(repo_name)
@@ -243,7 +706,7 @@ class GitHubClient:
                 assignees=assignees or []
             )
             return issue
-        except GithubException as e:
+        except _github_error() as e:
             raise Exception(f"Failed to create issue: {str(e)}")
 
     def list_issues(
@@ -252,28 +715,53 @@ class GitHubClient:
         state: str = "open",
         labels: Optional[List[str]] = None,
         sort: str = "created",
-        direction: str = "desc"
-    ) -> List[Issue]:
-        """List issues for a repository."""
-        repo = self.get_repository(repo_name)
-        return list(repo.get_issues(
-            state=state,
-            labels=labels or NotSet,
-            sort=sort,
-            direction=direction
-        ))
+        direction: str = "desc",
+        max_pages: Optional[int] = None
+    ) -> Iterator[IssueSummary]:
+        """List issues (without pull requests) for a repository."""
+        params = {"state": state, "sort": sort, "direction": direction}
+        if labels:
+            params["labels"] = ",".join(labels)
+        for item in self._list_json(f"{self._repo_path(repo_name)}/issues", params, max_pages):
+            # The issues endpoint lists pull requests too
+            if "pull_request" not in item:
+                yield _issue_summary(item)
+
+    def list_issues_graphql(
+        self,
+        repo_name: str,
+        state: str = "open",
+        labels: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[IssueSummary]:
+        """List issues (without pull requests) with their author and labels, 100 per GraphQL request."""
+        states = {"open": ["OPEN"], "closed": ["CLOSED"]}.get(state)
+        for node in self._graphql_nodes(_ISSUE_QUERY, repo_name, limit, states=states, labels=labels):
+            yield IssueSummary(
+                number=node["number"],
+                title=node["title"],
+                state=node["state"].lower(),
+                author=(node["author"] or {}).get("login", "ghost"),
+                url=node["url"],
+                created_at=node["createdAt"],
+                updated_at=node["updatedAt"],
+                labels=tuple(label["name"] for label in node["labels"]["nodes"]),
+                comments=node["comments"]["totalCount"],
+            )
 
     def close_issue(self, repo_name: str, number: int) -> None:
         """Close an issue."""
-        repo = self.get_repository(repo_name)
-        issue = repo.get_issue(number)
-        issue.edit(state="closed")
+        try:
+            self._call("PATCH", f"{self._repo_path(repo_name)}/issues/{number}", {"state": "closed"})
+        except _github_error() as e:
+            raise Exception(f"Failed to close issue: {str(e)}")
 
     def comment_on_issue(self, repo_name: str, number: int, comment: str) -> None:
         """Add a comment to an issue."""
-        repo = self.get_repository(repo_name)
-        issue = repo.get_issue(number)
-        issue.create_comment(comment)
+        try:
+            self._call("POST", f"{self._repo_path(repo_name)}/issues/{number}/comments", {"body": comment})
+        except _github_error() as e:
+            raise Exception(f"Failed to comment on issue: {str(e)}")
 
     # Branch Operations
 
@@ -283,22 +771,21 @@ class GitHubClient:
             repo = self.get_repository(repo_name)
             source = repo.get_branch(from_branch)
             repo.create_git_ref(f"refs/heads/{branch_name}", source.commit.sha)
-        except GithubException as e:
+        except _github_error() as e:
             raise Exception(f"Failed to create branch: {str(e)}")
 
     def delete_branch(self, repo_name: str, branch_name: str) -> None:
         """Delete a branch."""
         try:
-            repo = self.get_repository(repo_name)
-            ref = repo.get_git_ref(f"heads/{branch_name}")
-            ref.delete()
-        except GithubException as e:
+            self._call("DELETE", f"{self._repo_path(repo_name)}/git/refs/heads/{branch_name}")
+        except _github_error() as e:
             raise Exception(f"Failed to delete branch: {str(e)}")
 
-    def list_branches(self, repo_name: str) -> List[str]:
-        """List all branches in a repository."""
+    def list_branches(self, repo_name: str, max_pages: Optional[int] = None) -> Iterator[str]:
+        """List the names of the branches in a repository."""
         repo = self.get_repository(repo_name)
-        return [branch.name for branch in repo.get_branches()]
+        for branch in _paginate(repo.get_branches(), max_pages):
+            yield branch.name
 
     # Release Operations
 
@@ -321,21 +808,26 @@ class GitHubClient:
                 message=body,
                 draft=draft,
                 prerelease=prerelease,
-                target_commitish=target_commitish or NotSet
+                target_commitish=target_commitish or _pygithub().GithubObject.NotSet
             )
-        except GithubException as e:
+        except _github_error() as e:
             raise Exception(f"Failed to create release: {str(e)}")
 
-    def list_releases(self, repo_name: str) -> list:
-        """List all releases for a repository."""
+    def list_releases(self, repo_name: str, max_pages: Optional[int] = DEFAULT_MAX_PAGES) -> Iterator:
+        """List releases for a repository, newest first, reading at most `max_pages` pages (None for all)."""
         repo = self.get_repository(repo_name)
-        return list(repo.get_releases())
+        yield from _paginate(repo.get_releases(), max_pages)
 
     # User Operations
 
     def get_user_info(self) -> Dict[str, Any]:
-        """Get authenticated user information."""
-        return {
+        """Get authenticated user information (reused for USER_INFO_TTL seconds)."""
+        if self._user_info and self._user_info[1] > time.monotonic():
+            return dict(self._user_info[0])
+        if self._user_info:
+            # PyGithub keeps the attributes it first loaded; fetch them again
+            self.user.update()
+        info = {
             "login": self.user.login,
             "name": self.user.name,
             "email": self.user.email,
@@ -344,12 +836,19 @@ class GitHubClient:
             "followers": self.user.followers,
             "following": self.user.following,
         }
+        self._user_info = (info, time.monotonic() + self.USER_INFO_TTL)
+        return dict(info)
 
     # Notification Operations
 
-    def get_notifications(self, all: bool = False, participating: bool = False) -> list:
+    def get_notifications(
+        self,
+        all: bool = False,
+        participating: bool = False,
+        max_pages: Optional[int] = None
+    ) -> Iterator:
         """Get user notifications."""
-        return list(self.user.get_notifications(all=all, participating=participating))
+        yield from _paginate(self.user.get_notifications(all=all, participating=participating), max_pages)
 
     def mark_notifications_as_read(self) -> None:
         """Mark all notifications as read."""
@@ -0,0 +1,238 @@
+"""Prompt templates for AIAgent, parsed once at import instead of rebuilt on every call."""
+
+from string import Template
+
+# Optional lines substituted into the templates below (or "" when absent)
+TRUNCATION_NOTE = "Note: Diff was truncated due to size."
+
+COMMIT_MESSAGE = Template("""Analyze this git diff and generate a concise, professional commit message.
+
+Follow conventional commit format: <type>: <description>
+
+Types: feat, fix, docs, style, refactor, test, chore
+
+Rules:
+- First line: short summary (50 chars max)
+- Optional body: detailed explanation if needed
+- Focus on WHAT changed and WHY
+- Be specific and actionable
+
+$context_line
+$truncation_note
+
+Diff:
+```
+$diff
+```
+
+Generate the commit message:""")
+
+CODE_REVIEW = Template("""Review this code diff and provide comprehensive feedback.
+
+Analyze:
+1. Code quality and best practices
+2. Potential bugs or issues
+3. Performance considerations
+4. Security concerns
+5. Suggestions for improvement
+
+$context_line
+$truncation_note
+
+Diff:
+```
+$diff
+```
+
+Provide your review in this JSON format:
+{
+    "summary": "Brief overview",
+    "issues": ["List of issues found"],
+    "suggestions": ["List of suggestions"],
+    "security_concerns": ["Security issues if any"],
+    "rating": "score from 1-10",
+    "recommendation": "approve/request_changes/comment"
+}""")
+
+PR_REVIEW = Template("""Review this pull request comprehensively.
+
+PR Title: $pr_title
+Description: $pr_description
+Files Changed: $files_changed$scope_note
+$truncation_note
+
+Diff:
+```
+$diff
+```
+
+Provide detailed review covering:
+1. Overall assessment
+2. Code quality
+3. Test coverage
+4. Documentation
+5. Breaking changes
+6. Specific issues or concerns
+7. Final recommendation
+
+Format as JSON:
+{
+    "overall_assessment": "summary",
+    "code_quality": "assessment",
+    "test_coverage": "assessment",
+    "documentation": "assessment",
+    "breaking_changes": ["list if any"],
+    "issues": ["specific issues"],
+    "suggestions": ["improvements"],
+    "recommendation": "approve/request_changes/needs_discussion",
+    "review_comment": "detailed comment for PR"
+}""")
+
+REPOSITORY_ANALYSIS = Template("""Analyze this GitHub repository and provide insights.
+
+Repository Information:
+$repo_info
+
+Provide analysis on:
+1. Repository health
+2. Activity level
+3. Community engagement
+4. Areas for improvement
+5. Recommendations
+
+Keep it concise and actionable.""")
+
+ISSUE_LABELS = Template("""Analyze this GitHub issue and suggest appropriate labels.
+
+Title: $issue_title
+Body: $issue_body
+
+Common label categories:
+- Type: bug, feature, enhancement, documentation, question
+- Priority: critical, high, medium, low
+- Status: needs-triage, in-progress, blocked
+- Area: backend, frontend, api, database, ui/ux
+
+Respond with ONLY a comma-separated list of suggested labels (max 5).
+Example: bug, high-priority, backend""")
+
+ISSUE_LABELS_BATCH = Template("""Analyze each GitHub issue below and suggest appropriate labels for it.
+
+Common label categories:
+- Type: bug, feature, enhancement, documentation, question
+- Priority: critical, high, medium, low
+- Status: needs-triage, in-progress, blocked
+- Area: backend, frontend, api, database, ui/ux
+
+$issues
+
+Respond with ONLY a JSON array holding one object per issue, using the issue's number as "id"
+and at most 5 labels each.
+Example: [{"id": 1, "labels": ["bug", "high-priority", "backend"]}]""")
+
+PR_DESCRIPTION = Template("""Generate a comprehensive pull request description.
+
+Branch: $branch_name
+Commits:
+$commit_lines
+$truncation_note
+
+Changes:
+```
+$diff
+```
+
+Format the description as:
+## Summary
+[Brief overview]
+
+## Changes
+- [Key change 1]
+- [Key change 2]
+
+## Testing
+[How this was tested]
+
+## Checklist
+- [ ] Code follows project guidelines
+- [ ] Tests added/updated
+- [ ] Documentation updated
+""")
+
+EXPLAIN_DIFF = Template("""Explain this git diff in plain English. What does it do?
+$truncation_note
+
+Diff:
+```
+$diff
+```
+
+Provide a clear, concise explanation suitable for a non-technical audience.""")
+
+BRANCH_NAME = Template("""Suggest a git branch name for this work:
+
+$description
+
+Follow conventions:
+- Use hyphens to separate words
+- Start with type: feature/, bugfix/, hotfix/, chore/
+- Keep it short but descriptive
+- Use lowercase
+
+Respond with ONLY the branch name, nothing else.
+Example: feature/add-user-authentication""")
+
+ISSUE_TRIAGE = Template("""Triage this GitHub issue and provide recommendations.
+
+Title: $issue_title
+Body: $issue_body
+
+Analyze and provide:
+{
+    "priority": "critical/high/medium/low",
+    "category": "bug/feature/documentation/question",
+    "complexity": "simple/moderate/complex",
+    "suggested_labels": ["label1", "label2"],
+    "requires_immediate_attention": true/false,
+    "summary": "brief analysis"
+}""")
+
+ISSUE_TRIAGE_BATCH = Template("""Triage each GitHub issue below and provide recommendations.
+
+$issues
+
+Respond with ONLY a JSON array holding one object per issue, using the issue's number as "id":
+[
+    {
+        "id": 1,
+        "priority": "critical/high/medium/low",
+        "category": "bug/feature/documentation/question",
+        "complexity": "simple/moderate/complex",
+        "suggested_labels": ["label1", "label2"],
+        "requires_immediate_attention": true/false,
+        "summary": "brief analysis"
+    }
+]""")
+
+QUESTION = Template("""$question
+
+$context_line
+
+Provide a clear, helpful answer.""")
+
+
+def context_line(context) -> str:
+    """The "Context: ..." line, or "" without context."""
+    return f"Context: {context}" if context else ""
+
+
+def issue_list(issues) -> str:
+    """Number (title, body) pairs as [1], [2], ... for the *_BATCH templates."""
+    return "\n\n".join(
+        f"[{number}] Title: {title}\nBody: {body}" for number, (title, body) in enumerate(issues, 1)
+    )
+
+
+def truncation_note(was_truncated: bool) -> str:
+    """TRUNCATION_NOTE if the diff was cut, else ""."""
+    return TRUNCATION_NOTE if was_truncated else ""
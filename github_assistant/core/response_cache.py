@@ -0,0 +1,83 @@
+"""On-disk cache of GitHub GET responses for conditional requests."""
+
+from typing import Any, Optional, Tuple
+from pathlib import Path
+import json
+import os
+import sqlite3
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+class ResponseCache:
+    """
+    SQLite store of (ETag, Last-Modified, body) per request URL.
+
+    Replaying a stored validator lets GitHub answer 304 Not Modified, which
+    skips the body transfer and is not charged against the rate limit.
+    """
+
+    DEFAULT_PATH = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / ".cache") / "gh-assistant" / "responses.db"
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the cache (the database is opened on first use).
+
+        Args:
+            path: Database file (defaults to ~/.cache/gh-assistant/responses.db)
+        """
+        self.path = str(path or self.DEFAULT_PATH)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, falling back to an in-memory one if the file is unusable."""
+        if self._conn is None:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._conn = sqlite3.connect(self.path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Response cache unavailable at {self.path}: {e}")
+                self._conn = sqlite3.connect(":memory:")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body TEXT)"
+            )
+        return self._conn
+
+    def get(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], Any]]:
+        """Return (etag, last_modified, body) stored for url, or None."""
+        try:
+            row = self._connect().execute(
+                "SELECT etag, last_modified, body FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+
+        if row is None:
+            return None
+        etag, last_modified, body = row
+        return etag, last_modified, json_loads(body)
+
+    def set(self, url: str, etag: Optional[str], last_modified: Optional[str], body: Any) -> None:
+        """Store the validators and decoded body of a 200 response."""
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (url, etag, last_modified, body) VALUES (?, ?, ?, ?)",
+                    (url, etag, last_modified, json.dumps(body)),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache write failed: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
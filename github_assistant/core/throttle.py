@@ -0,0 +1,145 @@
+"""Client-side rate limiting so bursts of API calls wait for capacity instead of being rejected."""
+
+from typing import List, Optional, Sequence, Tuple, Union
+import asyncio
+import math
+import os
+import threading
+import time
+import logging
+
+from github_assistant.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# A GitHub token with fewer requests left than this is passed over while another has more
+LOW_REMAINING = 10
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute token buckets.
+
+    A call is released only when both buckets hold enough capacity; otherwise
+    the caller sleeps for exactly as long as the larger deficit takes to
+    refill. Waiting up front avoids 429s, whose retries back off blindly and
+    waste far more wall time. Shared by the blocking and async call paths.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: Optional[int] = None):
+        """
+        Initialize both buckets full.
+
+        Args:
+            requests_per_minute: Request budget per minute
+            tokens_per_minute: Token budget per minute (None for no token limit)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute or 0)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: int) -> float:
+        """Take capacity for one call if both buckets allow it; otherwise return the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed, self._updated = now - self._updated, now
+            self._requests = min(
+                self.requests_per_minute, self._requests + elapsed * self.requests_per_minute / 60
+            )
+            if self.tokens_per_minute:
+                self._tokens = min(
+                    self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60
+                )
+                # A call bigger than the whole bucket goes through once the bucket is full
+                tokens = min(tokens, self.tokens_per_minute)
+            else:
+                tokens = 0
+
+            if self._requests >= 1 and self._tokens >= tokens:
+                self._requests -= 1
+                self._tokens -= tokens
+                return 0.0
+
+            wait = (1 - self._requests) * 60 / self.requests_per_minute
+            if tokens:
+                wait = max(wait, (tokens - self._tokens) * 60 / self.tokens_per_minute)
+            return wait
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until a call costing `tokens` may be sent."""
+        while True:
+            wait = self._reserve(tokens)
+            if wait <= 0:
+                return
+            logger.debug(f"Rate limiter: waiting {wait:.2f}s for capacity")
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int = 0) -> None:
+        """Wait, without blocking the event loop, until a call costing `tokens` may be sent."""
+        while True:
+            wait = self._reserve(tokens)
+            if wait <= 0:
+                return
+            logger.debug(f"Rate limiter: waiting {wait:.2f}s for capacity")
+            await asyncio.sleep(wait)
+
+
+def github_tokens(tokens: Optional[Union[List[str], str]] = None, token: Optional[str] = None) -> List[str]:
+    """
+    The GitHub tokens a client rotates between, first one preferred.
+
+    Args:
+        tokens: List or comma-separated string (defaults to github.tokens /
+            GH_ASSIST_TOKENS). All of them should belong to the same account.
+        token: Single token used when no list is configured (defaults to GITHUB_TOKEN)
+
+    Raises:
+        ValueError: If no token is configured at all
+    """
+    if tokens is None:
+        tokens = get_config().get("github", "tokens")
+    if isinstance(tokens, str):
+        tokens = tokens.split(",")
+    result = [t.strip() for t in tokens or [] if t.strip()]
+    if not result:
+        token = token or os.getenv('GITHUB_TOKEN')
+        if token:
+            result = [token]
+    if not result:
+        raise ValueError("GitHub token required. Set GITHUB_TOKEN env variable.")
+    return result
+
+
+def choose_token(buckets: Sequence[Tuple[Optional[float], float]]) -> Tuple[int, float]:
+    """
+    Pick the GitHub token to send the next request on.
+
+    Unused tokens count as full. Once every token is below LOW_REMAINING,
+    the one whose window resets first is used, after waiting for the reset
+    if it has nothing left at all.
+
+    Args:
+        buckets: Per token, (requests left or None if not yet known, reset
+            epoch) from its latest X-RateLimit-* headers
+
+    Returns:
+        (index of the token, seconds to wait before using it)
+    """
+    def remaining(index: int) -> float:
+        left = buckets[index][0]
+        return math.inf if left is None else left
+
+    indexes = range(len(buckets))
+    index = max(indexes, key=remaining)
+    if remaining(index) >= LOW_REMAINING:
+        return index, 0.0
+
+    index = min(indexes, key=lambda i: buckets[i][1])
+    wait = buckets[index][1] - time.time()
+    if remaining(index) == 0 and wait > 0:
+        logger.warning(f"Rate limit exhausted on all tokens, waiting {wait:.0f}s for reset...")
+        return index, wait + 1
+    return index, 0.0
@@ -0,0 +1,104 @@
+"""Typed views of the structured results the AI agent and the GitHub clients return."""
+
+from dataclasses import dataclass, fields
+from typing import Any, Mapping, Tuple, Union
+import sys
+
+# Listing rows are built by the thousand; on Python 3.10+ they drop the per-instance dict
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _as_tuple(value: Any) -> Tuple[str, ...]:
+    """Normalize a list-valued field the model may have left out, nulled or given as one string."""
+    if not value:
+        return ()
+    if isinstance(value, str):
+        return (value,)
+    return tuple(str(item) for item in value)
+
+
+@dataclass(frozen=True)
+class _AIResult:
+    """Base for result types built from the agent's JSON dicts."""
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]):
+        """Build the result from a decoded response, ignoring unknown keys and filling in defaults."""
+        values = {}
+        for field in fields(cls):
+            if field.name in data and data[field.name] is not None:
+                value = data[field.name]
+                values[field.name] = _as_tuple(value) if field.type == Tuple[str, ...] else value
+        return cls(**values)
+
+
+@dataclass(frozen=True)
+class ReviewResult(_AIResult):
+    """Review of a local diff (from AIAgent.review_code_changes)."""
+
+    summary: str = "No summary"
+    issues: Tuple[str, ...] = ()
+    suggestions: Tuple[str, ...] = ()
+    security_concerns: Tuple[str, ...] = ()
+    rating: Union[int, str] = "N/A"
+    recommendation: str = "N/A"
+
+
+@dataclass(frozen=True)
+class PRReview(_AIResult):
+    """Review of a pull request (from AIAgent.review_pull_request)."""
+
+    review_comment: str = "No review generated"
+    recommendation: str = "N/A"
+    overall_assessment: str = ""
+    issues: Tuple[str, ...] = ()
+    suggestions: Tuple[str, ...] = ()
+    breaking_changes: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, **_SLOTS)
+class RepoSummary:
+    """Repository row from a listing (GitHubClient.list_repositories), fully loaded."""
+
+    name: str
+    full_name: str
+    url: str
+    updated_at: str
+    description: str = ""
+    private: bool = False
+    language: str = ""
+    stars: int = 0
+    forks: int = 0
+    default_branch: str = "main"
+
+
+@dataclass(frozen=True, **_SLOTS)
+class PRSummary:
+    """Pull request row from a listing (GitHubClient.list_pull_requests[_graphql]), fully loaded."""
+
+    number: int
+    title: str
+    state: str
+    author: str
+    url: str
+    created_at: str
+    updated_at: str
+    labels: Tuple[str, ...] = ()
+    draft: bool = False
+    head: str = ""
+    base: str = ""
+
+
+@dataclass(frozen=True, **_SLOTS)
+class IssueSummary:
+    """Issue row from a listing (GitHubClient.list_issues[_graphql]), fully loaded."""
+
+    number: int
+    title: str
+    state: str
+    author: str
+    url: str
+    created_at: str
+    updated_at: str
+    labels: Tuple[str, ...] = ()
+    comments: int = 0
@@ -0,0 +1,44 @@
+"""Derive the GitHub repository a local checkout points at."""
+
+from typing import Optional, Tuple
+import re
+
+# owner/name at the end of an https://, ssh:// or scp-style (git@host:owner/name) remote URL
+_REMOTE_RE = re.compile(r'[:/]([^/:]+)/([^/]+?)(?:\.git)?/?$')
+
+# Resolved "owner/name" per remote URL, shared by every command in the process
+_resolved = {}
+
+
+def parse_remote_url(url: str) -> Tuple[Optional[str], str]:
+    """
+    Split a remote URL into (owner, name).
+
+    The owner is None for local paths (no scheme or host), in which case
+    the name is the last path segment.
+    """
+    match = _REMOTE_RE.search(url) if ':' in url else None
+    if match:
+        return match.group(1), match.group(2)
+
+    name = url.rstrip('/').rsplit('/', 1)[-1]
+    if name.endswith('.git'):
+        name = name[:-len('.git')]
+    return None, name
+
+
+async def resolve_repo(git, github, repo: Optional[str] = None) -> str:
+    """
+    Return `repo` if given, otherwise the "owner/name" of the origin remote.
+
+    The result is memoized per remote URL, and the user login used when the
+    URL has no owner is fetched at most once per client.
+    """
+    if repo:
+        return repo
+
+    url = git.get_remote_url()
+    if url not in _resolved:
+        owner, name = parse_remote_url(url)
+        _resolved[url] = f"{owner or await github.get_user_login()}/{name}"
+    return _resolved[url]
@@ -1,12 +1,12 @@
 """Setup script for GitHub Assistant."""
 
-from setuptools import setup, find_packages
+from setuptools import setup
 
 setup(
     name='github-assistant',
     version='1.0.0',
     description='AI-powered GitHub and Git automation assistant',
-    packages=find_packages(),
+    packages=['github_assistant', 'github_assistant.core', 'github_assistant.cli_commands'],
     install_requires=[
         'PyGithub>=2.5.0',
         'GitPython>=3.1.43',
@@ -15,11 +15,12 @@ setup(
         'rich>=13.9.4',
         'python-dotenv>=1.0.1',
         'requests>=2.32.3',
+        'aiohttp>=3.10.0',
         'PyYAML>=6.0.2',
     ],
     entry_points={
         'console_scripts': [
-            'gh-assist=github_assistant.cli:cli',
+            'gh-assist=github_assistant.__main__:main',
         ],
     },
     python_requires='>=3.8',